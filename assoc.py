@@ -1,7 +1,10 @@
 class DoubleHashingMap:
     def __init__(self, initial_capacity=8):
-        self.capacity = initial_capacity  # Размер таблицы (должен быть степенью 2 для эффективности)
+        # Размер таблицы округляется вверх до степени двойки: только тогда
+        # нечетный шаг _hash2 взаимно прост с ним и проход обходит всю таблицу
+        self.capacity = 1 << max(initial_capacity - 1, 1).bit_length()
         self.size = 0  # Количество элементов в таблице
+        self.used = 0  # Количество занятых ячеек, включая удаленные
         self.table = [None] * self.capacity
         self.deleted = object()  # Флаг удаленного элемента
 
@@ -25,7 +28,8 @@ class DoubleHashingMap:
         Returns:
             int: полученный хэш
         """
-        return 1 + (hash(key) % (self.capacity - 1))
+        # Размер таблицы - степень двойки, поэтому нечетный шаг взаимно прост с ним
+        return (hash(key) // self.capacity) % (self.capacity // 2) * 2 + 1
 
     def _probe(self, key, i) -> int:
         """Вычисляет индекс с учетом двойного хэширования (пробирование)
@@ -37,7 +41,7 @@ class DoubleHashingMap:
         Returns:
             int: индекс
         """
-        return (hash(key) + i * hash(key)) % self.capacity
+        return (self._hash1(key) + i * self._hash2(key)) % self.capacity
 
     def insert(self, key, value) -> None:
         """Вставка ключа и значения в таблицу
@@ -49,21 +53,32 @@ class DoubleHashingMap:
         Raises:
             RuntimeError: ошибка вставки
         """
-        if self.size >= self.capacity // 2:  # Перехеширование при заполнении 50%
+        if self.used >= self.capacity // 2:  # Перехеширование при заполнении 50%
             self._resize()
 
+        free = None  # первая удаленная ячейка на пути пробирования
         for i in range(self.capacity):
             index = self._probe(key, i)
-            if self.table[index] is None or self.table[index] is self.deleted:
-                self.table[index] = (key, value)
-                self.size += 1
-                return
+            entry = self.table[index]
+            if entry is None:
+                if free is None:
+                    free = index
+                    self.used += 1
+                break
+            if entry is self.deleted:
+                if free is None:
+                    free = index
             # Если ключ уже существует, обновляем значение
-            if self.table[index][0] == key:
+            elif entry[0] == key:
                 self.table[index] = (key, value)
                 return
 
-        raise RuntimeError("Hash table insertion failed")
+        if free is None:
+            raise RuntimeError("Hash table insertion failed")
+        # Ключ вставляется в первую свободную ячейку только после проверки,
+        # что его нет дальше по пути пробирования
+        self.table[free] = (key, value)
+        self.size += 1
 
     def search(self, key):
         """Поиск значения по ключу
@@ -98,11 +113,17 @@ class DoubleHashingMap:
                 return
 
     def _resize(self) -> None:
-        """Ресайзинг таблицы, перехеширование с увеличением размера таблицы"""
+        """Ресайзинг таблицы, перехеширование с увеличением размера таблицы
+
+        Если таблица заполнена в основном удаленными ячейками, размер не
+        меняется - они просто отбрасываются при перехешировании
+        """
         old_table = self.table
-        self.capacity *= 2
+        if self.size >= self.capacity // 4:
+            self.capacity *= 2
         self.table = [None] * self.capacity
         self.size = 0
+        self.used = 0
 
         for entry in old_table:
             if entry is not None and entry is not self.deleted:
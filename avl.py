@@ -1,7 +1,61 @@
-from graphviz import Digraph  # для отрисовки
+import gc
+import mmap
+import random
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Разница высот, начиная с которой merge_trees выбирает объединение через
+# split/join вместо линейного слияния (примерно N/M > 2^UNION_HEIGHT_GAP)
+UNION_HEIGHT_GAP = 4
+
+# Формат файла AVLTree.dump: сигнатура, версия формата, количество узлов
+_DUMP_HEADER = struct.Struct("<4sIQ")
+_DUMP_MAGIC = b"AVLT"
+_DUMP_VERSION = 1
+_HEIGHT_MASK = 0x3F
+_HAS_LEFT = 0x40
+_HAS_RIGHT = 0x80
+
+
+@contextmanager
+def _gc_paused():
+    """Приостанавливает сборщик мусора на время массового создания узлов
+
+    Дерево не содержит циклических ссылок, а на миллионах новых объектов
+    циклический сборщик запускается многократно и тратит больше времени,
+    чем само построение
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _dot_id(key) -> str:
+    """Идентификатор узла в формате DOT (числа как есть, остальное в кавычках)
+
+    Args:
+        key: ключ узла
+
+    Returns:
+        str: идентификатор
+    """
+    text = str(key)
+    if re.fullmatch(r"-?(\d+(\.\d*)?|\.\d+)", text):
+        return text
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
 
 
 class AVLNode:
+    __slots__ = ("key", "height", "left", "right")
+
     def __init__(self, key):
         self.key = key  # Значение ключа узла (натуральное число)
         self.height = 1  # Высота узла
@@ -10,9 +64,28 @@ class AVLNode:
 
 
 class AVLTree:
+    # Кэш узлов с минимальным и максимальным ключом (None - не вычислен).
+    # Узлы не пересоздаются при поворотах и удалении, поэтому кэш остается
+    # верным, пока его не сбросит присваивание корня. Вставка и удаление
+    # крайнего ключа переносят кэш на соседний узел без нового спуска
+    _min_node = None
+    _max_node = None
+    # Формат dump хранит только ключи и высоты, поэтому подклассы с другими
+    # данными в узлах (значения, кратности, агрегаты) сбрасывают этот флаг
+    _dump_supported = True
+
     def __init__(self):
         self.root = None  # корень дерева
 
+    @property
+    def root(self) -> AVLNode:
+        return self._root
+
+    @root.setter
+    def root(self, node: AVLNode) -> None:
+        self._root = node
+        self._min_node = self._max_node = None
+
     def _get_height(self, node: AVLNode) -> int:
         """Возвращает высоту узла
 
@@ -103,13 +176,32 @@ class AVLTree:
             return self._rotate_left(node)  # малый правый
         return node
 
+    def _new_node(self, key: int) -> AVLNode:
+        """Создание нового узла дерева
+
+        Args:
+            key (int): ключ узла
+
+        Returns:
+            AVLNode: новый узел
+        """
+        return AVLNode(key)
+
     def insert(self, key: int) -> None:
         """Вставка нового узла с заданным ключом (внутренняя приватная часть)
 
         Args:
             key (int): ключ для вставки
         """
+        low, high = self._min_node, self._max_node
         self.root = self._insert(self.root, key)
+        # Новый крайний ключ - лист, ставший потомком прежнего крайнего узла
+        # (повороты на крайнем пути его не перемещают). У скопированного
+        # персистентным деревом узла потомка нет, и кэш вычисляется заново
+        if low is not None:
+            self._min_node = low.left if key < low.key else low
+        if high is not None:
+            self._max_node = high.right if high.key < key else high
 
     def _insert(self, node: AVLNode, key: int) -> AVLNode:
         """Вставка нового узла с заданным ключом (внутренняя приватная часть)
@@ -122,7 +214,7 @@ class AVLTree:
             AVLNode: узел после вставки
         """
         if not node:
-            return AVLNode(key)
+            return self._new_node(key)
         if key < node.key:
             node.left = self._insert(node.left, key)
         elif key > node.key:
@@ -134,6 +226,72 @@ class AVLTree:
         # Балансировка узла
         return self._balance_node(node)
 
+    def insert_many(self, keys) -> None:
+        """Пакетная вставка ключей за O(mlog(n/m+1)) за один рекурсивный проход
+
+        Args:
+            keys: ключи для вставки (в любом порядке)
+        """
+        batch = sorted(set(keys))
+        with _gc_paused():
+            self.root = self._insert_many(self.root, batch, 0, len(batch))
+
+    def _insert_many(self, node: AVLNode, keys: list, lo: int, hi: int) -> AVLNode:
+        """Пакетная вставка (внутренняя приватная часть)
+
+        Args:
+            node (AVLNode): текущий узел просмотра
+            keys (list): отсортированные ключи без повторов
+            lo (int): начало диапазона ключей для поддерева
+            hi (int): конец диапазона (не включительно)
+
+        Returns:
+            AVLNode: узел после вставки
+        """
+        if lo >= hi:
+            return node
+        if not node:
+            nodes = [self._new_node(key) for key in keys[lo:hi]]
+            return self._link_balanced(nodes, 0, len(nodes))
+        node_left, node_right = node.left, node.right
+        i = bisect_left(keys, node.key, lo, hi)
+        j = i + 1 if i < hi and keys[i] == node.key else i
+        left = self._insert_many(node_left, keys, lo, i)
+        right = self._insert_many(node_right, keys, j, hi)
+        return self._join(left, node, right)
+
+    def delete_many(self, keys) -> None:
+        """Пакетное удаление ключей за O(mlog(n/m+1)) за один рекурсивный проход
+
+        Args:
+            keys: ключи для удаления (в любом порядке)
+        """
+        batch = sorted(set(keys))
+        self.root = self._delete_many(self.root, batch, 0, len(batch))
+
+    def _delete_many(self, node: AVLNode, keys: list, lo: int, hi: int) -> AVLNode:
+        """Пакетное удаление (внутренняя приватная часть)
+
+        Args:
+            node (AVLNode): текущий узел просмотра
+            keys (list): отсортированные ключи без повторов
+            lo (int): начало диапазона ключей для поддерева
+            hi (int): конец диапазона (не включительно)
+
+        Returns:
+            AVLNode: узел после удаления
+        """
+        if lo >= hi or not node:
+            return node
+        node_left, node_right = node.left, node.right
+        i = bisect_left(keys, node.key, lo, hi)
+        found = i < hi and keys[i] == node.key
+        left = self._delete_many(node_left, keys, lo, i)
+        right = self._delete_many(node_right, keys, i + 1 if found else i, hi)
+        if found:
+            return self._join2(left, right)
+        return self._join(left, node, right)
+
     def _find_min(self, node: AVLNode) -> AVLNode:
         """Находит узел с минимальным значением ключа
 
@@ -148,13 +306,37 @@ class AVLTree:
             current = current.left
         return current
 
+    def _find_max(self, node: AVLNode) -> AVLNode:
+        """Находит узел с максимальным значением ключа
+
+        Args:
+            node (AVLNode): узел для поиска максимума в поддереве
+
+        Returns:
+            AVLNode: найденный максимум
+        """
+        current = node
+        while current.right is not None:
+            current = current.right
+        return current
+
     def delete(self, key: int) -> None:
         """Удаление узла с заданным ключом
 
         Args:
             key (int): ключ для удаления
         """
+        low, high = self._min_node, self._max_node
+        # Крайний ключ отделяется как при pop_min/pop_max, и кэш переходит
+        # к соседнему узлу
+        if low is not None and low.key == key:
+            self._cut_end(self._pop_min)
+            return
+        if high is not None and high.key == key:
+            self._cut_end(self._pop_max)
+            return
         self.root = self._delete(self.root, key)
+        self._min_node, self._max_node = low, high
 
     def _delete(self, node: AVLNode, key: int) -> AVLNode:
         """Удаление узла с заданным ключом (внутренняя приватная часть)
@@ -178,15 +360,169 @@ class AVLTree:
                 return node.right
             elif not node.right:
                 return node.left
-            # Узел с двумя потомками ищем минимум в правом поддереве
-            temp = self._find_min(node.right)
-            node.key = temp.key
-            node.right = self._delete(node.right, temp.key)
+            # Узел с двумя потомками заменяем минимумом правого поддерева,
+            # перенося сам узел, чтобы ссылки на узлы оставались корректными
+            right, successor, _ = self._pop_min(node.right)
+            successor.left, successor.right = node.left, right
+            node = successor
         # Обновляем высоту текущего узла
         self._update_height(node)
         # Балансировка узла
         return self._balance_node(node)
 
+    def _pop_min(self, node: AVLNode) -> tuple:
+        """Отделение узла с минимальным ключом от поддерева с балансировкой
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Returns:
+            tuple: (оставшееся поддерево, узел с минимальным ключом,
+                новый минимальный узел поддерева или None)
+        """
+        if not node.left:
+            return node.right, node, node.right
+        node.left, first, after = self._pop_min(node.left)
+        after = after or node
+        self._update_height(node)
+        return self._balance_node(node), first, after
+
+    def _pop_max(self, node: AVLNode) -> tuple:
+        """Отделение узла с максимальным ключом от поддерева с балансировкой
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Returns:
+            tuple: (оставшееся поддерево, узел с максимальным ключом,
+                новый максимальный узел поддерева или None)
+        """
+        if not node.right:
+            return node.left, node, node.left
+        node.right, last, after = self._pop_max(node.right)
+        after = after or node
+        self._update_height(node)
+        return self._balance_node(node), last, after
+
+    def min(self) -> int:
+        """Минимальный ключ за O(1) (после изменения крайних ключей - O(log n))
+
+        Raises:
+            ValueError: дерево пустое
+
+        Returns:
+            int: минимальный ключ
+        """
+        if self._min_node is None:
+            if not self.root:
+                raise ValueError("min() of an empty tree")
+            self._min_node = self._find_min(self.root)
+        return self._min_node.key
+
+    def max(self) -> int:
+        """Максимальный ключ за O(1) (после изменения крайних ключей - O(log n))
+
+        Raises:
+            ValueError: дерево пустое
+
+        Returns:
+            int: максимальный ключ
+        """
+        if self._max_node is None:
+            if not self.root:
+                raise ValueError("max() of an empty tree")
+            self._max_node = self._find_max(self.root)
+        return self._max_node.key
+
+    def pop_min(self) -> int:
+        """Удаление и возврат минимального ключа за O(log n)
+
+        Raises:
+            IndexError: дерево пустое
+
+        Returns:
+            int: минимальный ключ
+        """
+        return self._pop_end(self._pop_min).key
+
+    def pop_max(self) -> int:
+        """Удаление и возврат максимального ключа за O(log n)
+
+        Raises:
+            IndexError: дерево пустое
+
+        Returns:
+            int: максимальный ключ
+        """
+        return self._pop_end(self._pop_max).key
+
+    def _pop_end(self, pop) -> AVLNode:
+        """Отделение крайнего узла дерева
+
+        Args:
+            pop: self._pop_min или self._pop_max
+
+        Raises:
+            IndexError: дерево пустое
+
+        Returns:
+            AVLNode: отделенный узел
+        """
+        if not self.root:
+            raise IndexError("pop from an empty tree")
+        return self._cut_end(pop)
+
+    def _cut_end(self, pop) -> AVLNode:
+        """Отделение крайнего узла непустого дерева: кэш этого края переходит
+        к соседнему узлу, найденному при отделении, кэш другого края сохраняется
+
+        Args:
+            pop: self._pop_min или self._pop_max
+
+        Returns:
+            AVLNode: отделенный узел
+        """
+        low, high = self._min_node, self._max_node
+        self.root, node, after = pop(self.root)
+        if not self.root:
+            return node
+        # Сравнение по ключу: персистентное дерево могло скопировать узел
+        if pop == self._pop_min:
+            low = after
+            if high is not None and high.key == node.key:
+                high = None
+        else:
+            high = after
+            if low is not None and low.key == node.key:
+                low = None
+        self._min_node, self._max_node = low, high
+        return node
+
+    def pop_min_n(self, k: int) -> list:
+        """Удаление и возврат k минимальных ключей за O(k + log n)
+
+        Ключи обходятся в порядке возрастания, после чего дерево разрезается
+        по k-му ключу (split) вместо k отдельных удалений
+
+        Args:
+            k (int): количество ключей
+
+        Returns:
+            list: до k минимальных ключей в порядке возрастания
+        """
+        if k <= 0 or not self.root:
+            return []
+        keys = []
+        for node in self._iter_nodes(self.root):
+            keys.append(node.key)
+            if len(keys) == k:
+                break
+        high = self._max_node
+        _, _, self.root = self._split(self.root, keys[-1])
+        if self.root:
+            self._max_node = high
+        return keys
+
     def search(self, key: int) -> AVLNode:
         """Поиск узла с заданным ключом
 
@@ -238,6 +574,33 @@ class AVLTree:
             result.extend(self._inorder_traversal(node.right))
         return result
 
+    def irange(self, lo: int, hi: int):
+        """Ленивый обход ключей из отрезка [lo, hi] за O(log n + k)
+
+        Args:
+            lo (int): нижняя граница (включительно)
+            hi (int): верхняя граница (включительно)
+
+        Yields:
+            int: ключи в порядке возрастания
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key > hi:
+                return
+            yield node.key
+            node = node.right
+
     def preorder_traversal(self) -> list:
         """Обход дерева в порядке (preorder)
 
@@ -333,95 +696,706 @@ class AVLTree:
             node.right
         )
 
-    def visualize(self, filename: str = "viz") -> None:
+    def freeze(self):
+        """Экспорт ключей в неизменяемый индекс для пакетного поиска на NumPy
+
+        Модуль avl_frozen (и numpy) импортируется только здесь
+
+        Returns:
+            FrozenAVLIndex: индекс в раскладке Эйтцингера
+        """
+        from avl_frozen import FrozenAVLIndex
+
+        return FrozenAVLIndex([node.key for node in self._iter_nodes(self.root)])
+
+    def dump(self, path: str) -> None:
+        """Сохранение дерева в компактный бинарный файл
+
+        Формат: заголовок, ключи в порядке preorder (int64, little-endian) и
+        по байту на узел с высотой (младшие 6 бит) и флагами наличия левого и
+        правого потомков. По такому файлу форма дерева восстанавливается за
+        O(n) без балансировки
+
+        Args:
+            path (str): путь к файлу
+
+        Raises:
+            TypeError: узлы дерева хранят не только ключи
+        """
+        self._check_dump_supported()
+        keys, meta = array("q"), bytearray()
+        for node in self._iter_preorder(self.root):
+            keys.append(node.key)
+            meta.append(
+                node.height
+                | (_HAS_LEFT if node.left else 0)
+                | (_HAS_RIGHT if node.right else 0)
+            )
+        if sys.byteorder != "little":
+            keys.byteswap()
+        with open(path, "wb") as file:
+            file.write(_DUMP_HEADER.pack(_DUMP_MAGIC, _DUMP_VERSION, len(keys)))
+            keys.tofile(file)
+            file.write(meta)
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = False):
+        """Загрузка дерева, сохраненного методом dump, за O(n) без балансировки
+
+        Args:
+            path (str): путь к файлу
+            use_mmap (bool): читать файл через mmap без копирования в память
+
+        Raises:
+            TypeError: узлы дерева хранят не только ключи
+            ValueError: файл не является сохраненным деревом
+
+        Returns:
+            AVLTree: загруженное дерево
+        """
+        cls._check_dump_supported()
+        with open(path, "rb") as file:
+            if use_mmap:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return cls._load_buffer(view)
+            return cls._load_buffer(memoryview(file.read()))
+
+    @classmethod
+    def _check_dump_supported(cls) -> None:
+        """Проверка, что dump/load сохраняют все данные узлов этого класса
+
+        Raises:
+            TypeError: узлы дерева хранят не только ключи
+        """
+        if not cls._dump_supported:
+            raise TypeError(
+                f"{cls.__name__} nodes hold more than keys and cannot be dumped"
+            )
+
+    @classmethod
+    def _load_buffer(cls, view: memoryview):
+        """Восстановление дерева из содержимого файла (внутренняя часть)
+
+        Args:
+            view (memoryview): содержимое файла
+
+        Raises:
+            ValueError: файл не является сохраненным деревом
+
+        Returns:
+            AVLTree: загруженное дерево
+        """
+        if len(view) < _DUMP_HEADER.size:
+            raise ValueError("Not an AVL tree dump")
+        magic, version, count = _DUMP_HEADER.unpack_from(view)
+        keys_end = _DUMP_HEADER.size + count * 8
+        if (
+            magic != _DUMP_MAGIC
+            or version != _DUMP_VERSION
+            or len(view) != keys_end + count
+        ):
+            raise ValueError("Not an AVL tree dump")
+        with view[_DUMP_HEADER.size : keys_end] as raw:
+            if sys.byteorder == "little":
+                with raw.cast("q") as cast:
+                    keys = cast.tolist()
+            else:
+                swapped = array("q", raw)
+                swapped.byteswap()
+                keys = swapped.tolist()
+        with view[keys_end:] as meta:
+            tree = cls()
+            tree.root = tree._link_preorder(keys, meta)
+        return tree
+
+    def _link_preorder(self, keys: list, meta: memoryview) -> AVLNode:
+        """Восстановление формы дерева по preorder ключам и байтам высот/флагов
+
+        Args:
+            keys (list): ключи в порядке preorder
+            meta (memoryview): байты с высотой и флагами потомков
+
+        Returns:
+            AVLNode: корень восстановленного дерева
+        """
+        root = None
+        pending_left = None  # узел, следующим за которым идет его левый потомок
+        stack = []  # узлы, ожидающие правого потомка
+        with _gc_paused():
+            for key, info in zip(keys, meta):
+                node = self._new_node(key)
+                node.height = info & _HEIGHT_MASK
+                if root is None:
+                    root = node
+                elif pending_left is not None:
+                    pending_left.left = node
+                else:
+                    stack.pop().right = node
+                if info & _HAS_RIGHT:
+                    stack.append(node)
+                pending_left = node if info & _HAS_LEFT else None
+        return root
+
+    def _iter_preorder(self, node: AVLNode):
+        """Ленивый preorder обход узлов поддерева без рекурсии
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Yields:
+            AVLNode: узлы в порядке preorder
+        """
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def visualize(
+        self,
+        filename: str = "viz",
+        max_depth: int = None,
+        root_key: int = None,
+        sample: float = None,
+    ) -> None:
         """Визуализация дерева с помощью Graphviz
 
+        Описание графа в формате DOT пишется в файл filename потоково
+        (см. write_dot), после чего Graphviz отрисовывает его в filename.png.
+        Модуль graphviz импортируется только здесь
+
         Args:
             filename (str): название файла
+            max_depth (int): максимальная глубина отрисовки (None - без ограничения)
+            root_key (int): ключ корня отрисовываемого поддерева (None - все дерево)
+            sample (float): вероятность раскрытия каждого поддерева (None - все)
+
+        Raises:
+            KeyError: в дереве нет ключа root_key
         """
-        img = Digraph(format="png")
-        if self.root:
-            self._visualize(img, self.root, filename)
-        img.render(filename)
+        import graphviz  # для отрисовки
+
+        self.write_dot(filename, max_depth, root_key, sample)
+        graphviz.render("dot", "png", filename)
         print(f"Отрисовка дерева сохранена в файл: {filename}.png")
 
-    def _visualize(self, img: Digraph, node: AVLNode, filename: str) -> None:
-        """Визуализация дерева с помощью Graphviz (внутренняя приватная часть)
+    def write_dot(
+        self,
+        filename: str,
+        max_depth: int = None,
+        root_key: int = None,
+        sample: float = None,
+    ) -> None:
+        """Потоковая запись дерева в формате DOT без построения графа в памяти
+
+        Узлы пишутся в файл по мере нерекурсивного обхода, поэтому время и
+        память ограничены размером отрисовываемой части. Обрезанные по глубине
+        или выборке поддеревья отмечаются узлом "..."
 
         Args:
-            img (Digraph): обьект графа отрисовки
-            node (AVLNode): текущий узел
             filename (str): название файла
+            max_depth (int): максимальная глубина отрисовки (None - без ограничения)
+            root_key (int): ключ корня отрисовываемого поддерева (None - все дерево)
+            sample (float): вероятность раскрытия каждого поддерева (None - все)
+
+        Raises:
+            KeyError: в дереве нет ключа root_key
         """
-        if node:
-            img.node(str(node.key))
-            if node.left:
-                img.edge(str(node.key), str(node.left.key))
-                self._visualize(img, node.left, filename)
-            if node.right:
-                img.edge(str(node.key), str(node.right.key))
-                self._visualize(img, node.right, filename)
+        root = self.root
+        if root_key is not None:
+            root = self._search(self.root, root_key)
+            if root is None:
+                raise KeyError(root_key)
+        rng = random.Random(0)
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write("digraph {\n")
+            # Ребра к потомкам пишутся вместе с узлом слева направо (graphviz
+            # располагает потомков в порядке ребер), а раскрываемые потомки
+            # кладутся в стек справа налево для вывода в порядке preorder
+            stack = [(root, 1)] if root else []
+            while stack:
+                node, depth = stack.pop()
+                node_id = _dot_id(node.key)
+                file.write(f"\t{node_id}\n")
+                expanded = []
+                for child in (node.left, node.right):
+                    if not child:
+                        continue
+                    if (max_depth is not None and depth >= max_depth) or (
+                        sample is not None and rng.random() >= sample
+                    ):
+                        more_id = _dot_id(f"...{child.key}")
+                        file.write(f'\t{more_id} [label="..." shape=none]\n')
+                        file.write(f"\t{node_id} -> {more_id}\n")
+                    else:
+                        file.write(f"\t{node_id} -> {_dot_id(child.key)}\n")
+                        expanded.append((child, depth + 1))
+                stack.extend(reversed(expanded))
+            file.write("}\n")
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Построение сбалансированного дерева из возрастающей
+        последовательности ключей за O(n) без поворотов
+
+        Повторяющиеся подряд ключи пропускаются
+
+        Args:
+            iterable: ключи в порядке неубывания
+
+        Raises:
+            ValueError: ключи не отсортированы
+
+        Returns:
+            AVLTree: построенное дерево
+        """
+        tree = cls()
+        nodes = []
+        new_node = tree._new_node
+        with _gc_paused():
+            for key in iterable:
+                if nodes and not nodes[-1].key < key:
+                    if key == nodes[-1].key:
+                        continue
+                    raise ValueError("Keys must be sorted in ascending order")
+                nodes.append(new_node(key))
+            tree.root = tree._link_balanced(nodes, 0, len(nodes))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Построение дерева из произвольной последовательности ключей
+        за O(n log n) на сортировку и O(n) на построение
+
+        Args:
+            iterable: ключи в любом порядке (дубликаты допускаются)
+
+        Returns:
+            AVLTree: построенное дерево
+        """
+        return cls.from_sorted(sorted(set(iterable)))
 
     def merge_trees(self, other) -> None:
-        """Слияние двух деревьев за O(Mlog(N+M))
+        """Слияние двух деревьев
+
+        Если деревья сопоставимы по размеру, ключи обоих деревьев сливаются
+        потоково в порядке возрастания и из них строится идеально
+        сбалансированное дерево за O(N+M). Если other заметно меньше,
+        используется объединение через split/join за O(Mlog(N/M+1)).
+        Дерево other при этом не изменяется
 
         Args:
             other (AVLTree): другое дерево
         """
         if not other.root:
             return
-        # Рекурсивно начинаем добавлять вершины
-        self._merge_nodes(other.root)
+        height_gap = self._get_height(self.root) - self._get_height(other.root)
+        if height_gap > UNION_HEIGHT_GAP:
+            self.root = self._union_nodes(self.root, other.root)
+        else:
+            self.root = self._merge_linear(self.root, other.root)
+
+    def _merge_linear(self, node: AVLNode, other: AVLNode) -> AVLNode:
+        """Линейное слияние двух поддеревьев за O(N+M)
+
+        Узлы текущего дерева переиспользуются, узлы другого дерева копируются
 
-    def _merge_nodes(self, node: AVLNode) -> None:
-        """Рекурсивная часть добавления узлов из другого дерева
+        Args:
+            node (AVLNode): корень текущего дерева
+            other (AVLNode): корень другого дерева
+
+        Returns:
+            AVLNode: корень нового сбалансированного дерева
+        """
+        nodes = []
+        ours, theirs = self._iter_nodes(node), self._iter_nodes(other)
+        x, y = next(ours, None), next(theirs, None)
+        with _gc_paused():
+            while x and y:
+                if x.key < y.key:
+                    nodes.append(x)
+                    x = next(ours, None)
+                elif y.key < x.key:
+                    nodes.append(self._clone_node(y))
+                    y = next(theirs, None)
+                else:
+                    # Дубликаты не вставляются, остается узел текущего дерева
+                    nodes.append(x)
+                    x, y = next(ours, None), next(theirs, None)
+            while x:
+                nodes.append(x)
+                x = next(ours, None)
+            while y:
+                nodes.append(self._clone_node(y))
+                y = next(theirs, None)
+            return self._link_balanced(nodes, 0, len(nodes))
+
+    def _union_nodes(self, node: AVLNode, other: AVLNode) -> AVLNode:
+        """Объединение через split/join за O(Mlog(N/M+1)) (рекурсивная часть)
+
+        Текущее дерево разрезается по ключам другого, само другое дерево
+        только читается
 
         Args:
-            node (AVLNode): текущий узел
+            node (AVLNode): корень текущего (большего) поддерева
+            other (AVLNode): корень другого (меньшего) поддерева
+
+        Returns:
+            AVLNode: корень объединения
         """
+        if not other:
+            return node
         if not node:
-            return
-        self.insert(node.key)
-        self._merge_nodes(node.left)
-        self._merge_nodes(node.right)
+            nodes = [self._clone_node(n) for n in self._iter_nodes(other)]
+            return self._link_balanced(nodes, 0, len(nodes))
+        left, found, right = self._split(node, other.key)
+        middle = found if found else self._clone_node(other)
+        left = self._union_nodes(left, other.left)
+        right = self._union_nodes(right, other.right)
+        return self._join(left, middle, right)
+
+    def _iter_nodes(self, node: AVLNode):
+        """Ленивый inorder обход узлов поддерева без рекурсии
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Yields:
+            AVLNode: узлы в порядке возрастания ключей
+        """
+        stack = []
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def _clone_node(self, node: AVLNode) -> AVLNode:
+        """Поверхностная копия узла (ключ, высота и ссылки на потомков)
+
+        Args:
+            node (AVLNode): исходный узел
+
+        Returns:
+            AVLNode: копия узла
+        """
+        clone = self._new_node(node.key)
+        clone.height = node.height
+        clone.left, clone.right = node.left, node.right
+        return clone
+
+    def _link_balanced(self, nodes: list, lo: int, hi: int) -> AVLNode:
+        """Связывание отсортированных узлов nodes[lo:hi] в идеально
+        сбалансированное дерево за O(hi - lo) без поворотов
+
+        Args:
+            nodes (list): узлы в порядке возрастания ключей
+            lo (int): начало диапазона
+            hi (int): конец диапазона (не включительно)
+
+        Returns:
+            AVLNode: корень построенного дерева
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self._link_balanced(nodes, lo, mid)
+        node.right = self._link_balanced(nodes, mid + 1, hi)
+        self._update_height(node)
+        return node
+
+    def _join(self, left: AVLNode, node: AVLNode, right: AVLNode) -> AVLNode:
+        """Соединение двух деревьев через средний узел за O(|h1-h2|)
+
+        Все ключи left должны быть меньше node.key, а все ключи right - больше
+
+        Args:
+            left (AVLNode): левое поддерево
+            node (AVLNode): средний узел
+            right (AVLNode): правое поддерево
+
+        Returns:
+            AVLNode: корень соединенного дерева
+        """
+        left_height, right_height = self._get_height(left), self._get_height(right)
+        if left_height > right_height + 1:
+            return self._join_right(left, node, right)
+        if right_height > left_height + 1:
+            return self._join_left(left, node, right)
+        node.left, node.right = left, right
+        self._update_height(node)
+        return node
+
+    def _join_right(self, left: AVLNode, node: AVLNode, right: AVLNode) -> AVLNode:
+        """Спуск по правому краю более высокого левого дерева при соединении
+
+        Args:
+            left (AVLNode): левое (более высокое) поддерево
+            node (AVLNode): средний узел
+            right (AVLNode): правое поддерево
+
+        Returns:
+            AVLNode: корень соединенного дерева
+        """
+        if self._get_height(left.right) <= self._get_height(right) + 1:
+            node.left, node.right = left.right, right
+            self._update_height(node)
+            left.right = node
+        else:
+            left.right = self._join_right(left.right, node, right)
+        self._update_height(left)
+        return self._balance_node(left)
+
+    def _join_left(self, left: AVLNode, node: AVLNode, right: AVLNode) -> AVLNode:
+        """Спуск по левому краю более высокого правого дерева при соединении
+
+        Args:
+            left (AVLNode): левое поддерево
+            node (AVLNode): средний узел
+            right (AVLNode): правое (более высокое) поддерево
+
+        Returns:
+            AVLNode: корень соединенного дерева
+        """
+        if self._get_height(right.left) <= self._get_height(left) + 1:
+            node.left, node.right = left, right.left
+            self._update_height(node)
+            right.left = node
+        else:
+            right.left = self._join_left(left, node, right.left)
+        self._update_height(right)
+        return self._balance_node(right)
+
+    def _split(self, node: AVLNode, key: int) -> tuple:
+        """Разрезание поддерева по ключу через join за O(log n)
+
+        Args:
+            node (AVLNode): корень поддерева
+            key (int): ключ для разрезания
+
+        Returns:
+            tuple: (ключи меньше key, узел с ключом key или None, ключи больше key)
+        """
+        if not node:
+            return None, None, None
+        if key < node.key:
+            left, found, right = self._split(node.left, key)
+            return left, found, self._join(right, node, node.right)
+        if key > node.key:
+            left, found, right = self._split(node.right, key)
+            return self._join(node.left, node, left), found, right
+        return node.left, node, node.right
 
     def split_tree(self, key: int) -> tuple:
-        """Разделение авл дерева по ключу
+        """Разделение авл дерева по ключу за O(log n)
+
+        В текущем дереве остается только узел с ключом key (если он был)
 
         Args:
             key (int): ключ с которой вершины будет происходить разделение
 
         Returns:
-            tuple: полученные новые деревья
+            tuple: полученные новые деревья (ключи меньше key, ключи больше key)
         """
-        left, right = AVLTree(), AVLTree()
-        self.root, left_root, right_root = self._split_tree(self.root, key)
-        left.root, right.root = left_root, right_root
+        left, found, right = self.split(key)
+        if found:
+            found.left, found.right = None, None
+            self._update_height(found)
+            self.root = found
         return left, right
 
-    def _split_tree(self, node: AVLNode, key: int) -> tuple:
-        """Разделение авл дерева по ключу (внутренняя часть)
+    def split(self, key: int) -> tuple:
+        """Разрезание дерева по ключу за O(log n), текущее дерево становится пустым
 
         Args:
-            node (AVLNode): текущий узел
-            key (int): ключ для деления
+            key (int): ключ для разрезания
 
         Returns:
-            tuple: новые вершины
+            tuple: (дерево с ключами меньше key, узел с ключом key или None,
+                дерево с ключами больше key)
+        """
+        left, right = type(self)(), type(self)()
+        left.root, found, right.root = self._split(self.root, key)
+        self.root = None
+        return left, found, right
+
+    @classmethod
+    def join(cls, left, key: int, right):
+        """Соединение двух деревьев через ключ key за O(|h1-h2|)
+
+        Деревья left и right становятся пустыми
+
+        Args:
+            left (AVLTree): дерево с ключами меньше key
+            key (int): средний ключ
+            right (AVLTree): дерево с ключами больше key
+
+        Raises:
+            ValueError: ключи деревьев не разделены ключом key
+
+        Returns:
+            AVLTree: соединенное дерево
+        """
+        if (left.root and left._find_max(left.root).key >= key) or (
+            right.root and right._find_min(right.root).key <= key
+        ):
+            raise ValueError("Keys of the joined trees must be separated by key")
+        tree = cls()
+        tree.root = tree._join(left.root, tree._new_node(key), right.root)
+        left.root, right.root = None, None
+        return tree
+
+    def union(self, other) -> None:
+        """Объединение множеств за O(Mlog(N/M+1)), other становится пустым
+
+        Args:
+            other (AVLTree): другое дерево
+        """
+        self.root = self._union(self.root, other.root)
+        other.root = None
+
+    def intersection(self, other) -> None:
+        """Пересечение множеств за O(Mlog(N/M+1)), other становится пустым
+
+        Args:
+            other (AVLTree): другое дерево
+        """
+        self.root = self._intersection(self.root, other.root)
+        other.root = None
+
+    def difference(self, other) -> None:
+        """Разность множеств за O(Mlog(N/M+1)), other становится пустым
+
+        Args:
+            other (AVLTree): другое дерево
+        """
+        self.root = self._difference(self.root, other.root)
+        other.root = None
+
+    def symmetric_difference(self, other) -> None:
+        """Симметрическая разность множеств за O(Mlog(N/M+1)), other становится пустым
+
+        Args:
+            other (AVLTree): другое дерево
+        """
+        self.root = self._symmetric_difference(self.root, other.root)
+        other.root = None
+
+    def _union(self, node: AVLNode, other: AVLNode) -> AVLNode:
+        """Объединение поддеревьев (рекурсивная часть)
+
+        Args:
+            node (AVLNode): корень первого поддерева
+            other (AVLNode): корень второго поддерева
+
+        Returns:
+            AVLNode: корень результата
         """
         if not node:
-            return None, None, None
-        if key < node.key:
-            node.left, left_root, right_root = self._split_tree(node.left, key)
-            return node, left_root, self._balance_node(right_root)
-        elif key > node.key:
-            node.right, left_root, right_root = self._split_tree(node.right, key)
-            return self._balance_node(left_root), node, right_root
-        else:
-            # Нашли узел по которому делим
-            left_root, right_root = node.left, node.right
-            node.left, node.right = None, None
-            return node, left_root, right_root
+            return other
+        if not other:
+            return node
+        node_left, node_right = node.left, node.right
+        left, _, right = self._split(other, node.key)
+        left = self._union(node_left, left)
+        right = self._union(node_right, right)
+        return self._join(left, node, right)
+
+    def _intersection(self, node: AVLNode, other: AVLNode) -> AVLNode:
+        """Пересечение поддеревьев (рекурсивная часть)
+
+        Args:
+            node (AVLNode): корень первого поддерева
+            other (AVLNode): корень второго поддерева
+
+        Returns:
+            AVLNode: корень результата
+        """
+        if not node or not other:
+            return None
+        node_left, node_right = node.left, node.right
+        left, found, right = self._split(other, node.key)
+        left = self._intersection(node_left, left)
+        right = self._intersection(node_right, right)
+        if found:
+            return self._join(left, node, right)
+        return self._join2(left, right)
+
+    def _difference(self, node: AVLNode, other: AVLNode) -> AVLNode:
+        """Разность поддеревьев (рекурсивная часть)
+
+        Args:
+            node (AVLNode): корень уменьшаемого поддерева
+            other (AVLNode): корень вычитаемого поддерева
+
+        Returns:
+            AVLNode: корень результата
+        """
+        if not node or not other:
+            return node
+        other_left, other_right = other.left, other.right
+        left, _, right = self._split(node, other.key)
+        left = self._difference(left, other_left)
+        right = self._difference(right, other_right)
+        return self._join2(left, right)
+
+    def _symmetric_difference(self, node: AVLNode, other: AVLNode) -> AVLNode:
+        """Симметрическая разность поддеревьев (рекурсивная часть)
+
+        Args:
+            node (AVLNode): корень первого поддерева
+            other (AVLNode): корень второго поддерева
+
+        Returns:
+            AVLNode: корень результата
+        """
+        if not node:
+            return other
+        if not other:
+            return node
+        node_left, node_right = node.left, node.right
+        left, found, right = self._split(other, node.key)
+        left = self._symmetric_difference(node_left, left)
+        right = self._symmetric_difference(node_right, right)
+        if found:
+            return self._join2(left, right)
+        return self._join(left, node, right)
+
+    def _join2(self, left: AVLNode, right: AVLNode) -> AVLNode:
+        """Соединение двух деревьев без среднего ключа за O(log n)
+
+        Args:
+            left (AVLNode): левое поддерево
+            right (AVLNode): правое поддерево
+
+        Returns:
+            AVLNode: корень соединенного дерева
+        """
+        if not left:
+            return right
+        rest, last = self._split_last(left)
+        return self._join(rest, last, right)
+
+    def _split_last(self, node: AVLNode) -> tuple:
+        """Отделение узла с максимальным ключом от поддерева
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Returns:
+            tuple: (оставшееся поддерево, узел с максимальным ключом)
+        """
+        if not node.right:
+            return node.left, node
+        rest, last = self._split_last(node.right)
+        return self._join(node.left, node, rest), last
 
     def __len__(self) -> int:
         """Магический метод определения количества нод в дереве
@@ -448,7 +1422,7 @@ class AVLTree:
         Args:
             key (int): ключ для удаления
         """
-        self._delete(self.root, key)
+        self.root = self._delete(self.root, key)
 
     def __str__(self) -> str:
         """Магический метод вывода дерева в виде строки
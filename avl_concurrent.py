@@ -0,0 +1,223 @@
+import threading
+from contextlib import contextmanager
+
+from avl import AVLNode, AVLTree
+
+
+class RWLock:
+    """Блокировка читатель-писатель с приоритетом писателей
+
+    Любое количество читателей может работать одновременно. Ожидающий писатель
+    блокирует вход новых читателей, чтобы при преобладании чтений записи
+    не голодали
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0  # количество активных читателей
+        self._writer = False  # активен ли писатель
+        self._waiting_writers = 0  # количество ожидающих писателей
+
+    def acquire_read(self) -> None:
+        """Захват блокировки на чтение"""
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Освобождение блокировки на чтение"""
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Захват блокировки на запись"""
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """Освобождение блокировки на запись"""
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """Контекстный менеджер блокировки на чтение"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """Контекстный менеджер блокировки на запись"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentAVLTree:
+    """Потокобезопасная обертка над AVLTree
+
+    Поиск, диапазонные запросы и обходы выполняются под блокировкой на чтение
+    и идут параллельно, изменения - под блокировкой на запись. Несколько
+    изменений можно выполнить за один захват блокировки через batch()
+    """
+
+    def __init__(self, tree: AVLTree = None):
+        self.tree = tree if tree is not None else AVLTree()  # защищаемое дерево
+        self.lock = RWLock()
+
+    def search(self, key: int) -> AVLNode:
+        """Поиск узла с заданным ключом
+
+        Args:
+            key (int): ключ для поиска
+
+        Returns:
+            AVLNode: найденный узел или None
+        """
+        with self.lock.read_locked():
+            return self.tree.search(key)
+
+    def irange(self, lo: int, hi: int) -> list:
+        """Ключи из отрезка [lo, hi] в порядке возрастания
+
+        Args:
+            lo (int): нижняя граница (включительно)
+            hi (int): верхняя граница (включительно)
+
+        Returns:
+            list: список ключей
+        """
+        with self.lock.read_locked():
+            return list(self.tree.irange(lo, hi))
+
+    def inorder_traversal(self) -> list:
+        """Обход дерева в порядке (inorder)
+
+        Returns:
+            list: список узлов
+        """
+        with self.lock.read_locked():
+            return self.tree.inorder_traversal()
+
+    def preorder_traversal(self) -> list:
+        """Обход дерева в порядке (preorder)
+
+        Returns:
+            list: список узлов
+        """
+        with self.lock.read_locked():
+            return self.tree.preorder_traversal()
+
+    def postorder_traversal(self) -> list:
+        """Обход дерева в порядке (postorder)
+
+        Returns:
+            list: список узлов
+        """
+        with self.lock.read_locked():
+            return self.tree.postorder_traversal()
+
+    def insert(self, key: int) -> None:
+        """Вставка нового узла с заданным ключом
+
+        Args:
+            key (int): ключ для вставки
+        """
+        with self.lock.write_locked():
+            self.tree.insert(key)
+
+    def delete(self, key: int) -> None:
+        """Удаление узла с заданным ключом
+
+        Args:
+            key (int): ключ для удаления
+        """
+        with self.lock.write_locked():
+            self.tree.delete(key)
+
+    def insert_many(self, keys) -> None:
+        """Пакетная вставка ключей
+
+        Args:
+            keys: ключи для вставки
+        """
+        with self.lock.write_locked():
+            self.tree.insert_many(keys)
+
+    def delete_many(self, keys) -> None:
+        """Пакетное удаление ключей
+
+        Args:
+            keys: ключи для удаления
+        """
+        with self.lock.write_locked():
+            self.tree.delete_many(keys)
+
+    @contextmanager
+    def batch(self):
+        """Несколько изменений под одним захватом блокировки на запись
+
+        Yields:
+            AVLTree: защищаемое дерево (использовать только внутри блока with)
+        """
+        with self.lock.write_locked():
+            yield self.tree
+
+    def __contains__(self, key: int) -> bool:
+        """Магический метод проверки наличия ключа (key in tree)
+
+        Args:
+            key (int): ключ
+
+        Returns:
+            bool: True, если ключ есть в дереве
+        """
+        return self.search(key) is not None
+
+    def __len__(self) -> int:
+        """Магический метод определения количества нод в дереве
+
+        Returns:
+            int: количество нод в дереве
+        """
+        with self.lock.read_locked():
+            return len(self.tree)
+
+    def __str__(self) -> str:
+        """Магический метод вывода дерева в виде строки
+
+        Returns:
+            str: дерево в виде строки
+        """
+        with self.lock.read_locked():
+            return str(self.tree)
+
+
+# Пример использования
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    tree = ConcurrentAVLTree(AVLTree.from_sorted(range(0, 1000, 2)))
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(tree.insert, range(1, 1000, 2)))
+        found = sum(pool.map(tree.__contains__, range(1000)))
+    print("Found keys:", found)
+
+    with tree.batch() as t:
+        for key in range(10):
+            t.delete(key)
+    print("Range [0, 20]:", tree.irange(0, 20))
+    print("AVL validation:", tree.tree.validate_avl_tree())
@@ -0,0 +1,135 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+class BatchSearchResult(NamedTuple):
+    found: np.ndarray  # есть ли ключ в индексе
+    lower_bound: np.ndarray  # наименьший ключ >= запроса (при rank == n не определен)
+    rank: np.ndarray  # количество ключей, меньших запроса
+
+
+class FrozenAVLIndex:
+    """Неизменяемый индекс ключей в раскладке Эйтцингера (BFS-порядок)
+
+    Ключи лежат в массиве NumPy так, что потомки позиции k находятся в 2k и
+    2k+1 - спуск по неявному дереву читает память предсказуемо и выполняется
+    сразу для всего массива запросов без ветвлений: на каждом уровне
+    k = 2k + (b[k] < q), пока k <= n
+    """
+
+    def __init__(self, keys):
+        sorted_keys = np.asarray(keys)
+        n = len(sorted_keys)
+        if n and np.any(sorted_keys[1:] <= sorted_keys[:-1]):
+            raise ValueError("Keys must be sorted in ascending order without repeats")
+        self.size = n
+        self.depth = n.bit_length()  # количество уровней неявного дерева
+        # Позиции 1..n - ключи, остальные - заполнитель не меньше любого ключа:
+        # при спуске вычисляются индексы до 2n + 1 включительно, а позиция 0
+        # означает отсутствие lower_bound. Сравнения с заполнителем за
+        # пределами дерева отбрасываются, поэтому для строк, дат и объектов
+        # достаточно наибольшего ключа того же типа
+        width = 2 * n + 2
+        dtype = sorted_keys.dtype if n else np.int64
+        if np.issubdtype(dtype, np.integer):
+            filler = np.iinfo(dtype).max
+        elif np.issubdtype(dtype, np.floating):
+            filler = np.inf
+        else:
+            filler = sorted_keys[-1]
+        self.keys = np.full(width, filler, dtype=dtype)
+        self.ranks = np.full(width, n, dtype=np.int64)  # позиция -> индекс в sorted
+        order = self._eytzinger_order(n)
+        self.keys[1 : n + 1] = sorted_keys[order]
+        self.ranks[1 : n + 1] = order
+        self.ranks[0] = n
+
+    @staticmethod
+    def _eytzinger_order(n: int) -> np.ndarray:
+        """Индексы отсортированного массива для позиций 1..n раскладки Эйтцингера
+
+        Args:
+            n (int): количество ключей
+
+        Returns:
+            np.ndarray: order[k - 1] - индекс ключа для позиции k
+        """
+        order = np.empty(n, dtype=np.int64)
+        # Нерекурсивный inorder обход неявного дерева позиций
+        stack, k, i = [], 1, 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            order[k - 1] = i
+            i += 1
+            k = 2 * k + 1
+        return order
+
+    def search_many(self, queries) -> BatchSearchResult:
+        """Векторизованный поиск массива запросов
+
+        Args:
+            queries: массив запросов
+
+        Returns:
+            BatchSearchResult: принадлежность, lower_bound и ранг для каждого запроса
+        """
+        q = np.asarray(queries)
+        k = np.ones(q.shape, dtype=np.int64)
+        n = self.size
+        for _ in range(self.depth):
+            # Вышедшие за пределы дерева позиции больше не двигаются, чтобы
+            # путь каждого запроса заканчивался ровно на выходе из дерева
+            k = np.where(k <= n, 2 * k + (self.keys[k] < q), k)
+        # Отбрасываем хвост из единиц (шаги вправо) и последний шаг влево:
+        # остается позиция первого ключа >= q или 0, если такого нет
+        lowest_zero = ~k & (k + 1)
+        k //= lowest_zero << 1
+        lower_bound = self.keys[k]
+        return BatchSearchResult(
+            found=(k != 0) & (lower_bound == q),
+            lower_bound=lower_bound,
+            rank=self.ranks[k],
+        )
+
+    def search(self, key) -> bool:
+        """Проверка наличия одного ключа
+
+        Args:
+            key: ключ для поиска
+
+        Returns:
+            bool: True, если ключ есть в индексе
+        """
+        return bool(self.search_many([key]).found[0])
+
+    def __len__(self) -> int:
+        """Магический метод определения количества ключей в индексе
+
+        Returns:
+            int: количество ключей
+        """
+        return self.size
+
+    def __contains__(self, key) -> bool:
+        """Магический метод проверки наличия ключа (key in index)
+
+        Args:
+            key: ключ
+
+        Returns:
+            bool: True, если ключ есть в индексе
+        """
+        return self.search(key)
+
+
+# Пример использования
+if __name__ == "__main__":
+    index = FrozenAVLIndex([10, 20, 25, 30, 40, 50, 60])
+    result = index.search_many(np.array([5, 20, 33, 60, 70]))
+    print("Found:", result.found)
+    print("Lower bound:", result.lower_bound)
+    print("Rank:", result.rank)
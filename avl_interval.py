@@ -0,0 +1,188 @@
+from avl import AVLNode, AVLTree
+
+
+class IntervalNode(AVLNode):
+    __slots__ = ("max_end",)
+
+    def __init__(self, key: tuple):
+        super().__init__(key)
+        self.max_end = key[1]  # Наибольший конец интервала в поддереве
+
+
+class IntervalTree(AVLTree):
+    """Дерево отрезков [start, end] на АВЛ-дереве
+
+    Ключ узла - пара (start, end), поэтому узлы упорядочены по началу
+    отрезка (одинаковые отрезки хранятся один раз). Каждый узел хранит
+    наибольший конец отрезка в своем поддереве, который пересчитывается
+    вместе с высотой (в том числе при поворотах, вставке и удалении), что
+    позволяет пропускать поддеревья без пересечений с запросом
+    """
+
+    _dump_supported = False  # Ключи-пары не сохраняются в dump
+
+    def _new_node(self, key: tuple) -> IntervalNode:
+        """Создание нового узла дерева
+
+        Args:
+            key (tuple): отрезок (start, end)
+
+        Returns:
+            IntervalNode: новый узел
+        """
+        return IntervalNode(key)
+
+    def _update_height(self, node: IntervalNode) -> None:
+        """Обновляет высоту и наибольший конец поддерева узла
+
+        Args:
+            node (IntervalNode): узел для обновления
+        """
+        super()._update_height(node)
+        max_end = node.key[1]
+        if node.left and node.left.max_end > max_end:
+            max_end = node.left.max_end
+        if node.right and node.right.max_end > max_end:
+            max_end = node.right.max_end
+        node.max_end = max_end
+
+    @staticmethod
+    def _check(interval: tuple) -> tuple:
+        """Проверка корректности отрезка
+
+        Args:
+            interval (tuple): отрезок (start, end)
+
+        Raises:
+            ValueError: начало отрезка больше конца
+
+        Returns:
+            tuple: отрезок в виде пары
+        """
+        start, end = interval
+        if end < start:
+            raise ValueError("Interval start must not exceed its end")
+        return start, end
+
+    def insert(self, start, end) -> None:
+        """Вставка отрезка [start, end]
+
+        Args:
+            start: начало отрезка
+            end: конец отрезка
+        """
+        super().insert(self._check((start, end)))
+
+    def delete(self, start, end) -> None:
+        """Удаление отрезка [start, end]
+
+        Args:
+            start: начало отрезка
+            end: конец отрезка
+        """
+        super().delete((start, end))
+
+    def insert_many(self, intervals) -> None:
+        """Пакетная вставка отрезков за O(mlog(n/m+1))
+
+        Args:
+            intervals: пары (start, end)
+        """
+        super().insert_many(map(self._check, intervals))
+
+    @classmethod
+    def from_sorted(cls, intervals):
+        """Построение дерева из отрезков, отсортированных по (start, end),
+        за O(n) без поворотов
+
+        Args:
+            intervals: пары (start, end) в порядке возрастания
+
+        Raises:
+            ValueError: отрезки не отсортированы или начало больше конца
+
+        Returns:
+            IntervalTree: построенное дерево
+        """
+        return super().from_sorted(map(cls._check, intervals))
+
+    @classmethod
+    def from_iterable(cls, intervals):
+        """Построение дерева из отрезков в любом порядке за O(n log n)
+        на сортировку и O(n) на построение
+
+        Args:
+            intervals: пары (start, end)
+
+        Returns:
+            IntervalTree: построенное дерево
+        """
+        return cls.from_sorted(sorted(set(map(tuple, intervals))))
+
+    def overlap(self, lo, hi) -> list:
+        """Отрезки, пересекающиеся с [lo, hi]
+
+        Поддерево пропускается, если его наибольший конец меньше lo, а правое
+        поддерево - если начало отрезка узла больше hi, поэтому просматривается
+        O(log n) узлов на каждый найденный отрезок
+
+        Args:
+            lo: начало отрезка запроса (включительно)
+            hi: конец отрезка запроса (включительно)
+
+        Returns:
+            list: пары (start, end) в порядке возрастания
+        """
+        result = []
+        stack = []
+        node = self.root
+        while True:
+            # Спускаемся влево, пока в поддереве есть отрезки с концом >= lo
+            while node and node.max_end >= lo:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return result
+            node = stack.pop()
+            start, end = node.key
+            if start > hi:
+                # Дальше по порядку начала только больше
+                return result
+            if end >= lo:
+                result.append(node.key)
+            node = node.right
+
+    def stab(self, point) -> list:
+        """Отрезки, содержащие точку
+
+        Args:
+            point: точка
+
+        Returns:
+            list: пары (start, end) в порядке возрастания
+        """
+        return self.overlap(point, point)
+
+    def __contains__(self, interval: tuple) -> bool:
+        """Магический метод проверки наличия отрезка ((start, end) in tree)
+
+        Args:
+            interval (tuple): отрезок (start, end)
+
+        Returns:
+            bool: True, если отрезок есть в дереве
+        """
+        return self._search(self.root, tuple(interval)) is not None
+
+
+# Пример использования
+if __name__ == "__main__":
+    meetings = IntervalTree()
+    for start, end in [(9, 10), (9, 12), (11, 13), (14, 15), (8, 17), (16, 18)]:
+        meetings.insert(start, end)
+    print("Intervals:", meetings)
+    print("Containing 12:", meetings.stab(12))
+    print("Overlapping [13, 14]:", meetings.overlap(13, 14))
+    meetings.delete(8, 17)
+    print("Overlapping [13, 14] after deleting (8, 17):", meetings.overlap(13, 14))
+    print("AVL validation:", meetings.validate_avl_tree())
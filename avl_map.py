@@ -0,0 +1,413 @@
+from bisect import bisect_left
+from operator import add
+
+from avl import AVLNode, AVLTree, _gc_paused
+
+# Поддерживаемые агрегаты: значение для одного узла и функция объединения
+# (все функции коммутативны, поэтому порядок объединения не важен)
+AGGREGATES = {
+    "sum": (lambda value: value, add),
+    "count": (lambda value: 1, add),
+    "min": (lambda value: value, min),
+    "max": (lambda value: value, max),
+}
+
+
+class AVLMapNode(AVLNode):
+    __slots__ = ("value", "agg")
+
+    def __init__(self, key, value):
+        super().__init__(key)
+        self.value = value  # Значение, связанное с ключом
+        self.agg = None  # Агрегаты значений поддерева (кортеж) или None
+
+
+class AVLMap(AVLTree):
+    """Упорядоченный ассоциативный массив на АВЛ-дереве
+
+    Значения хранятся прямо в узлах. При заданных агрегатах каждый узел
+    хранит агрегаты своего поддерева, которые пересчитываются вместе с высотой
+    (в том числе при поворотах), поэтому aggregate(lo, hi) работает за O(log n)
+    """
+
+    _dump_supported = False  # Значения не сохраняются в dump
+
+    def __init__(self, aggregates: tuple = ()):
+        super().__init__()
+        for name in aggregates:
+            if name not in AGGREGATES:
+                raise ValueError(f"Unknown aggregate: {name}")
+        self.aggregates = tuple(aggregates)  # имена поддерживаемых агрегатов
+        self._leafs = tuple(AGGREGATES[name][0] for name in aggregates)
+        self._combines = tuple(AGGREGATES[name][1] for name in aggregates)
+
+    def _update_height(self, node: AVLMapNode) -> None:
+        """Обновляет высоту и агрегаты узла
+
+        Args:
+            node (AVLMapNode): узел для обновления
+        """
+        super()._update_height(node)
+        if self._combines:
+            agg = self._own_aggregate(node)
+            if node.left:
+                agg = self._combine(agg, node.left.agg)
+            if node.right:
+                agg = self._combine(agg, node.right.agg)
+            node.agg = agg
+
+    def _own_aggregate(self, node: AVLMapNode) -> tuple:
+        """Агрегаты одного узла без учета поддеревьев
+
+        Args:
+            node (AVLMapNode): узел
+
+        Returns:
+            tuple: агрегаты узла
+        """
+        return tuple(leaf(node.value) for leaf in self._leafs)
+
+    def _combine(self, a: tuple, b: tuple) -> tuple:
+        """Объединение двух кортежей агрегатов (None - пустой агрегат)
+
+        Args:
+            a (tuple): первый кортеж агрегатов
+            b (tuple): второй кортеж агрегатов
+
+        Returns:
+            tuple: объединенные агрегаты
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return tuple(combine(x, y) for combine, x, y in zip(self._combines, a, b))
+
+    def _clone_node(self, node: AVLMapNode) -> AVLMapNode:
+        """Поверхностная копия узла вместе со значением и агрегатами
+
+        Args:
+            node (AVLMapNode): исходный узел
+
+        Returns:
+            AVLMapNode: копия узла
+        """
+        clone = self._new_node(node.key, node.value)
+        clone.height, clone.agg = node.height, node.agg
+        clone.left, clone.right = node.left, node.right
+        return clone
+
+    def _new_node(self, key, value=None) -> AVLMapNode:
+        """Создание нового узла массива
+
+        Args:
+            key: ключ
+            value: значение
+
+        Returns:
+            AVLMapNode: новый узел
+        """
+        return AVLMapNode(key, value)
+
+    def insert(self, key, value) -> AVLMapNode:
+        """Вставка ключа со значением (значение существующего ключа заменяется)
+
+        Args:
+            key: ключ
+            value: значение
+
+        Returns:
+            AVLMapNode: узел с ключом key (новый или существующий)
+        """
+        low, high = self._min_node, self._max_node
+        self.root, target = self._insert(self.root, key, value)
+        if low is not None:
+            self._min_node = target if key < low.key else low
+        if high is not None:
+            self._max_node = target if high.key < key else high
+        return target
+
+    def _insert(self, node: AVLMapNode, key, value) -> tuple:
+        """Вставка ключа со значением (внутренняя приватная часть)
+
+        Args:
+            node (AVLMapNode): текущий узел просмотра
+            key: ключ
+            value: значение
+
+        Returns:
+            tuple: (узел после вставки, узел с ключом key)
+        """
+        if not node:
+            node = self._new_node(key, value)
+            self._update_height(node)
+            return node, node
+        if key < node.key:
+            node.left, target = self._insert(node.left, key, value)
+        elif key > node.key:
+            node.right, target = self._insert(node.right, key, value)
+        else:
+            node.value = value
+            target = node
+        self._update_height(node)
+        return self._balance_node(node), target
+
+    def insert_many(self, items) -> list:
+        """Пакетная вставка пар (ключ, значение) за O(mlog(n/m+1))
+
+        При повторах ключа в пакете остается последнее значение
+
+        Args:
+            items: пары (ключ, значение)
+
+        Returns:
+            list: узлы, созданные для новых ключей
+        """
+        batch = sorted(dict(items).items())
+        keys = [key for key, _ in batch]
+        created = []
+        with _gc_paused():
+            self.root = self._insert_many(
+                self.root, keys, batch, 0, len(batch), created
+            )
+        return created
+
+    def _insert_many(
+        self, node: AVLMapNode, keys: list, items: list, lo: int, hi: int, created
+    ) -> AVLMapNode:
+        """Пакетная вставка (внутренняя приватная часть)
+
+        Args:
+            node (AVLMapNode): текущий узел просмотра
+            keys (list): отсортированные ключи пакета
+            items (list): пары (ключ, значение) в том же порядке
+            lo (int): начало диапазона пакета для поддерева
+            hi (int): конец диапазона (не включительно)
+            created (list): список, в который добавляются новые узлы
+
+        Returns:
+            AVLMapNode: узел после вставки
+        """
+        if lo >= hi:
+            return node
+        if not node:
+            nodes = [self._new_node(key, value) for key, value in items[lo:hi]]
+            created.extend(nodes)
+            return self._link_balanced(nodes, 0, len(nodes))
+        node_left, node_right = node.left, node.right
+        i = bisect_left(keys, node.key, lo, hi)
+        j = i
+        if i < hi and keys[i] == node.key:
+            node.value = items[i][1]
+            j = i + 1
+        left = self._insert_many(node_left, keys, items, lo, i, created)
+        right = self._insert_many(node_right, keys, items, j, hi, created)
+        return self._join(left, node, right)
+
+    @classmethod
+    def from_sorted(cls, items, aggregates: tuple = ()):
+        """Построение массива из пар (ключ, значение), отсортированных по
+        ключу, за O(n) без поворотов
+
+        Args:
+            items: пары (ключ, значение) в порядке возрастания ключей
+            aggregates (tuple): имена агрегатов
+
+        Raises:
+            ValueError: ключи не отсортированы
+
+        Returns:
+            AVLMap: построенный массив
+        """
+        tree = cls(aggregates)
+        nodes = []
+        with _gc_paused():
+            for key, value in items:
+                if nodes and not nodes[-1].key < key:
+                    raise ValueError("Keys must be sorted in ascending order")
+                nodes.append(tree._new_node(key, value))
+            tree.root = tree._link_balanced(nodes, 0, len(nodes))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, items, aggregates: tuple = ()):
+        """Построение массива из пар (ключ, значение) в любом порядке
+
+        Args:
+            items: пары (ключ, значение), при повторах остается последнее
+            aggregates (tuple): имена агрегатов
+
+        Returns:
+            AVLMap: построенный массив
+        """
+        return cls.from_sorted(sorted(dict(items).items()), aggregates)
+
+    @classmethod
+    def join(cls, left, key, value, right):
+        """Соединение двух массивов через пару (key, value) за O(|h1-h2|)
+
+        Массивы left и right становятся пустыми, агрегаты берутся из left
+
+        Args:
+            left (AVLMap): массив с ключами меньше key
+            key: средний ключ
+            value: значение среднего ключа
+            right (AVLMap): массив с ключами больше key
+
+        Raises:
+            ValueError: ключи массивов не разделены ключом key
+
+        Returns:
+            AVLMap: соединенный массив
+        """
+        if (left.root and left._find_max(left.root).key >= key) or (
+            right.root and right._find_min(right.root).key <= key
+        ):
+            raise ValueError("Keys of the joined trees must be separated by key")
+        tree = cls(left.aggregates)
+        tree.root = tree._join(left.root, tree._new_node(key, value), right.root)
+        left.root, right.root = None, None
+        return tree
+
+    def split(self, key) -> tuple:
+        """Разрезание массива по ключу за O(log n), текущий массив становится пустым
+
+        Args:
+            key: ключ для разрезания
+
+        Returns:
+            tuple: (массив с ключами меньше key, узел с ключом key или None,
+                массив с ключами больше key)
+        """
+        left, right = type(self)(self.aggregates), type(self)(self.aggregates)
+        left.root, found, right.root = self._split(self.root, key)
+        self.root = None
+        return left, found, right
+
+    def get(self, key, default=None):
+        """Получение значения по ключу
+
+        Args:
+            key: ключ
+            default: значение по умолчанию
+
+        Returns:
+            Any: значение, если ключ найден, иначе default
+        """
+        node = self._search(self.root, key)
+        return node.value if node else default
+
+    def aggregate(self, lo, hi) -> dict:
+        """Агрегаты значений ключей из отрезка [lo, hi] за O(log n)
+
+        Args:
+            lo: нижняя граница ключей (включительно)
+            hi: верхняя граница ключей (включительно)
+
+        Returns:
+            dict: значения агрегатов по именам (для пустого отрезка sum и
+                count равны 0, min и max - None)
+        """
+        node = self.root
+        # Спускаемся до узла, в котором расходятся пути к lo и hi
+        while node and not lo <= node.key <= hi:
+            node = node.left if hi < node.key else node.right
+        result = None
+        if node:
+            result = self._own_aggregate(node)
+            current = node.left
+            while current:
+                if lo <= current.key:
+                    result = self._combine(result, self._own_aggregate(current))
+                    if current.right:
+                        result = self._combine(result, current.right.agg)
+                    current = current.left
+                else:
+                    current = current.right
+            current = node.right
+            while current:
+                if current.key <= hi:
+                    result = self._combine(result, self._own_aggregate(current))
+                    if current.left:
+                        result = self._combine(result, current.left.agg)
+                    current = current.right
+                else:
+                    current = current.left
+        if result is None:
+            return {
+                name: 0 if name in ("sum", "count") else None
+                for name in self.aggregates
+            }
+        return dict(zip(self.aggregates, result))
+
+    def items(self) -> list:
+        """Пары (ключ, значение) в порядке возрастания ключей
+
+        Returns:
+            list: список пар
+        """
+        return [(node.key, node.value) for node in self._iter_nodes(self.root)]
+
+    def values(self) -> list:
+        """Значения в порядке возрастания ключей
+
+        Returns:
+            list: список значений
+        """
+        return [node.value for node in self._iter_nodes(self.root)]
+
+    def __getitem__(self, key):
+        """Магический метод получения значения по ключу (arr[key])
+
+        Args:
+            key: ключ
+
+        Returns:
+            (Any | None): значение, если ключ найден, иначе None
+        """
+        return self.get(key)
+
+    def __setitem__(self, key, value) -> None:
+        """Магический метод для вставки по ключу (arr[key] = value)
+
+        Args:
+            key: ключ
+            value: значение
+        """
+        self.insert(key, value)
+
+    def __contains__(self, key) -> bool:
+        """Магический метод проверки наличия по ключу (key in map)
+
+        Args:
+            key: ключ
+
+        Returns:
+            bool: True, если ключ есть в массиве
+        """
+        return self._search(self.root, key) is not None
+
+    def __str__(self) -> str:
+        """Магический метод вывода массива в виде строки
+
+        Returns:
+            str: массив в виде строки
+        """
+        return (
+            "{" + ", ".join(f"{k}: {v}" for k, v in self.items()) + "}"
+            if self.root
+            else "Empty map"
+        )
+
+
+# Пример использования
+if __name__ == "__main__":
+    rollups = AVLMap(aggregates=("sum", "count", "min", "max"))
+    for ts, value in [(10, 3), (20, 7), (30, 1), (40, 9), (50, 4), (60, 2)]:
+        rollups[ts] = value
+    print(rollups)
+    print("Value at 30:", rollups[30])
+    print("Aggregate [20, 50]:", rollups.aggregate(20, 50))
+    del rollups[40]
+    print("Aggregate [20, 50] after deleting 40:", rollups.aggregate(20, 50))
+    print("AVL validation:", rollups.validate_avl_tree())
@@ -0,0 +1,551 @@
+from bisect import bisect_left
+from collections import Counter
+from itertools import groupby, islice
+
+from avl import AVLNode, AVLTree, _gc_paused
+
+
+class MultisetNode(AVLNode):
+    __slots__ = ("count", "total")
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.count = 1  # Кратность ключа
+        self.total = 1  # Сумма кратностей в поддереве
+
+
+class AVLMultiset(AVLTree):
+    """Мультимножество на АВЛ-дереве
+
+    Каждый узел хранит кратность своего ключа и сумму кратностей поддерева
+    (пересчитывается вместе с высотой). Повторная вставка или удаление
+    существующего ключа не меняет структуру дерева: меняются только счетчики
+    на пути поиска. Операции над множествами работают по правилам
+    collections.Counter: union - сумма, intersection - минимум, difference -
+    вычитание, symmetric_difference - модуль разности кратностей
+    """
+
+    _dump_supported = False  # Кратности не сохраняются в dump
+
+    def _new_node(self, key) -> MultisetNode:
+        """Создание нового узла с кратностью 1
+
+        Args:
+            key: ключ узла
+
+        Returns:
+            MultisetNode: новый узел
+        """
+        return MultisetNode(key)
+
+    def _update_height(self, node: MultisetNode) -> None:
+        """Обновляет высоту и сумму кратностей поддерева узла
+
+        Args:
+            node (MultisetNode): узел для обновления
+        """
+        super()._update_height(node)
+        total = node.count
+        if node.left:
+            total += node.left.total
+        if node.right:
+            total += node.right.total
+        node.total = total
+
+    def _clone_node(self, node: MultisetNode) -> MultisetNode:
+        """Поверхностная копия узла вместе с кратностью
+
+        Args:
+            node (MultisetNode): исходный узел
+
+        Returns:
+            MultisetNode: копия узла
+        """
+        clone = super()._clone_node(node)
+        clone.count, clone.total = node.count, node.total
+        return clone
+
+    def _find_path(self, key) -> tuple:
+        """Поиск узла с запоминанием пути от корня
+
+        Args:
+            key: ключ для поиска
+
+        Returns:
+            tuple: (узлы на пути до найденного, найденный узел или None)
+        """
+        path = []
+        node = self.root
+        while node:
+            if key < node.key:
+                path.append(node)
+                node = node.left
+            elif key > node.key:
+                path.append(node)
+                node = node.right
+            else:
+                break
+        return path, node
+
+    def insert(self, key, count: int = 1) -> None:
+        """Вставка count экземпляров ключа
+
+        Если ключ уже есть, увеличиваются только счетчики на пути к нему
+
+        Args:
+            key: ключ для вставки
+            count (int): количество экземпляров
+
+        Raises:
+            ValueError: count меньше 1
+        """
+        if count < 1:
+            raise ValueError("Count must be positive")
+        path, node = self._find_path(key)
+        if not node:
+            super().insert(key)
+            count -= 1
+            if not count:
+                return
+            path, node = self._find_path(key)
+        node.count += count
+        node.total += count
+        for parent in path:
+            parent.total += count
+
+    def delete(self, key, count: int = 1) -> None:
+        """Удаление count экземпляров ключа
+
+        Узел удаляется из дерева, только когда кратность становится нулевой
+
+        Args:
+            key: ключ для удаления
+            count (int): количество экземпляров (None - все)
+
+        Raises:
+            ValueError: count меньше 1
+        """
+        if count is not None and count < 1:
+            raise ValueError("Count must be positive")
+        path, node = self._find_path(key)
+        if not node:
+            return
+        if count is None or count >= node.count:
+            super().delete(key)
+            return
+        node.count -= count
+        node.total -= count
+        for parent in path:
+            parent.total -= count
+
+    def insert_many(self, keys) -> None:
+        """Пакетная вставка ключей за O(d log(n/d+1)), d - число различных
+        ключей, за один рекурсивный проход
+
+        Args:
+            keys: ключи для вставки (повторы увеличивают кратность)
+        """
+        counts = Counter(keys)
+        batch = sorted(counts)
+        with _gc_paused():
+            self.root = self._insert_counts(self.root, batch, counts, 0, len(batch))
+
+    def _insert_counts(
+        self, node: MultisetNode, keys: list, counts: Counter, lo: int, hi: int
+    ) -> MultisetNode:
+        """Пакетная вставка (внутренняя приватная часть)
+
+        Кратность найденных узлов увеличивается на месте, отсутствующие ключи
+        собираются в сбалансированные поддеревья, а суммы кратностей
+        пересчитываются при соединении через _join
+
+        Args:
+            node (MultisetNode): текущий узел просмотра
+            keys (list): отсортированные ключи без повторов
+            counts (Counter): кратности ключей пакета
+            lo (int): начало диапазона ключей для поддерева
+            hi (int): конец диапазона (не включительно)
+
+        Returns:
+            MultisetNode: узел после вставки
+        """
+        if lo >= hi:
+            return node
+        if not node:
+            nodes = []
+            for key in keys[lo:hi]:
+                new = self._new_node(key)
+                new.count = counts[key]
+                nodes.append(new)
+            return self._link_balanced(nodes, 0, len(nodes))
+        node_left, node_right = node.left, node.right
+        i = bisect_left(keys, node.key, lo, hi)
+        j = i
+        if i < hi and keys[i] == node.key:
+            node.count += counts[node.key]
+            j += 1
+        left = self._insert_counts(node_left, keys, counts, lo, i)
+        right = self._insert_counts(node_right, keys, counts, j, hi)
+        return self._join(left, node, right)
+
+    def delete_many(self, keys) -> None:
+        """Пакетное удаление ключей за O(d log(n/d+1)), d - число различных
+        ключей, за один рекурсивный проход
+
+        Args:
+            keys: ключи для удаления (каждое вхождение удаляет один экземпляр)
+        """
+        counts = Counter(keys)
+        batch = sorted(counts)
+        self.root = self._delete_counts(self.root, batch, counts, 0, len(batch))
+
+    def _delete_counts(
+        self, node: MultisetNode, keys: list, counts: Counter, lo: int, hi: int
+    ) -> MultisetNode:
+        """Пакетное удаление (внутренняя приватная часть)
+
+        Узел убирается из дерева, только когда его кратность становится нулевой
+
+        Args:
+            node (MultisetNode): текущий узел просмотра
+            keys (list): отсортированные ключи без повторов
+            counts (Counter): количество удаляемых экземпляров ключей
+            lo (int): начало диапазона ключей для поддерева
+            hi (int): конец диапазона (не включительно)
+
+        Returns:
+            MultisetNode: узел после удаления
+        """
+        if lo >= hi or not node:
+            return node
+        node_left, node_right = node.left, node.right
+        i = bisect_left(keys, node.key, lo, hi)
+        found = i < hi and keys[i] == node.key
+        left = self._delete_counts(node_left, keys, counts, lo, i)
+        right = self._delete_counts(node_right, keys, counts, i + 1 if found else i, hi)
+        if found:
+            node.count -= counts[node.key]
+            if node.count <= 0:
+                return self._join2(left, right)
+        return self._join(left, node, right)
+
+    def count(self, key) -> int:
+        """Кратность ключа
+
+        Args:
+            key: ключ
+
+        Returns:
+            int: количество экземпляров ключа (0, если его нет)
+        """
+        node = self._search(self.root, key)
+        return node.count if node else 0
+
+    def rank(self, key) -> int:
+        """Количество элементов меньше key с учетом кратности за O(log n)
+
+        Args:
+            key: ключ
+
+        Returns:
+            int: ранг ключа
+        """
+        rank = 0
+        node = self.root
+        while node:
+            if key <= node.key:
+                node = node.left
+            else:
+                rank += node.count + (node.left.total if node.left else 0)
+                node = node.right
+        return rank
+
+    def select(self, index: int):
+        """Элемент с заданным номером в отсортированном порядке с учетом
+        кратности за O(log n)
+
+        Args:
+            index (int): номер элемента (с нуля, отрицательные - с конца)
+
+        Raises:
+            IndexError: номер вне мультимножества
+
+        Returns:
+            Any: ключ элемента
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Multiset index out of range")
+        node = self.root
+        while True:
+            left = node.left.total if node.left else 0
+            if index < left:
+                node = node.left
+            elif index < left + node.count:
+                return node.key
+            else:
+                index -= left + node.count
+                node = node.right
+
+    def elements(self):
+        """Ленивый обход элементов в порядке возрастания с повторами
+
+        Yields:
+            Any: ключи, каждый столько раз, какова его кратность
+        """
+        for node in self._iter_nodes(self.root):
+            for _ in range(node.count):
+                yield node.key
+
+    def items(self) -> list:
+        """Пары (ключ, кратность) в порядке возрастания ключей
+
+        Returns:
+            list: список пар
+        """
+        return [(node.key, node.count) for node in self._iter_nodes(self.root)]
+
+    def pop_min(self):
+        """Удаление и возврат одного экземпляра минимального ключа
+
+        Raises:
+            IndexError: мультимножество пустое
+
+        Returns:
+            Any: минимальный ключ
+        """
+        if not self.root:
+            raise IndexError("pop from an empty multiset")
+        key = self.min()
+        self.delete(key)
+        return key
+
+    def pop_max(self):
+        """Удаление и возврат одного экземпляра максимального ключа
+
+        Raises:
+            IndexError: мультимножество пустое
+
+        Returns:
+            Any: максимальный ключ
+        """
+        if not self.root:
+            raise IndexError("pop from an empty multiset")
+        key = self.max()
+        self.delete(key)
+        return key
+
+    def pop_min_n(self, k: int) -> list:
+        """Удаление и возврат k минимальных элементов с учетом кратности
+
+        Args:
+            k (int): количество элементов
+
+        Returns:
+            list: до k минимальных элементов в порядке возрастания
+        """
+        keys = list(islice(self.elements(), max(k, 0)))
+        for key, group in groupby(keys):
+            self.delete(key, sum(1 for _ in group))
+        return keys
+
+    @classmethod
+    def _from_counts(cls, items):
+        """Построение мультимножества из пар (ключ, кратность), отсортированных
+        по ключу, за O(d) без поворотов
+
+        Args:
+            items: пары (ключ, кратность) в порядке возрастания ключей
+
+        Raises:
+            ValueError: ключи не отсортированы
+
+        Returns:
+            AVLMultiset: построенное мультимножество
+        """
+        tree = cls()
+        nodes = []
+        with _gc_paused():
+            for key, count in items:
+                if nodes and not nodes[-1].key < key:
+                    raise ValueError("Keys must be sorted in ascending order")
+                node = tree._new_node(key)
+                node.count = count
+                nodes.append(node)
+            tree.root = tree._link_balanced(nodes, 0, len(nodes))
+        return tree
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Построение мультимножества из неубывающей последовательности ключей
+        за O(n) без поворотов (повторы увеличивают кратность)
+
+        Args:
+            iterable: ключи в порядке неубывания
+
+        Raises:
+            ValueError: ключи не отсортированы
+
+        Returns:
+            AVLMultiset: построенное мультимножество
+        """
+        return cls._from_counts(
+            (key, sum(1 for _ in group)) for key, group in groupby(iterable)
+        )
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Построение мультимножества из ключей в любом порядке
+
+        Args:
+            iterable: ключи (повторы увеличивают кратность)
+
+        Returns:
+            AVLMultiset: построенное мультимножество
+        """
+        return cls._from_counts(sorted(Counter(iterable).items()))
+
+    def merge_trees(self, other) -> None:
+        """Сложение с другим мультимножеством, other не изменяется
+
+        Args:
+            other (AVLMultiset): другое мультимножество
+        """
+        self.union(self._from_counts(other.items()))
+
+    def _union(self, node: MultisetNode, other: MultisetNode) -> MultisetNode:
+        """Сумма кратностей поддеревьев (рекурсивная часть)
+
+        Args:
+            node (MultisetNode): корень первого поддерева
+            other (MultisetNode): корень второго поддерева
+
+        Returns:
+            MultisetNode: корень результата
+        """
+        if not node:
+            return other
+        if not other:
+            return node
+        node_left, node_right = node.left, node.right
+        left, found, right = self._split(other, node.key)
+        if found:
+            node.count += found.count
+        left = self._union(node_left, left)
+        right = self._union(node_right, right)
+        return self._join(left, node, right)
+
+    def _intersection(self, node: MultisetNode, other: MultisetNode) -> MultisetNode:
+        """Минимум кратностей поддеревьев (рекурсивная часть)
+
+        Args:
+            node (MultisetNode): корень первого поддерева
+            other (MultisetNode): корень второго поддерева
+
+        Returns:
+            MultisetNode: корень результата
+        """
+        if not node or not other:
+            return None
+        node_left, node_right = node.left, node.right
+        left, found, right = self._split(other, node.key)
+        left = self._intersection(node_left, left)
+        right = self._intersection(node_right, right)
+        if found:
+            node.count = min(node.count, found.count)
+            return self._join(left, node, right)
+        return self._join2(left, right)
+
+    def _difference(self, node: MultisetNode, other: MultisetNode) -> MultisetNode:
+        """Вычитание кратностей поддеревьев (рекурсивная часть)
+
+        Args:
+            node (MultisetNode): корень уменьшаемого поддерева
+            other (MultisetNode): корень вычитаемого поддерева
+
+        Returns:
+            MultisetNode: корень результата
+        """
+        if not node or not other:
+            return node
+        other_left, other_right = other.left, other.right
+        left, found, right = self._split(node, other.key)
+        left = self._difference(left, other_left)
+        right = self._difference(right, other_right)
+        if found and found.count > other.count:
+            found.count -= other.count
+            return self._join(left, found, right)
+        return self._join2(left, right)
+
+    def _symmetric_difference(
+        self, node: MultisetNode, other: MultisetNode
+    ) -> MultisetNode:
+        """Модуль разности кратностей поддеревьев (рекурсивная часть)
+
+        Args:
+            node (MultisetNode): корень первого поддерева
+            other (MultisetNode): корень второго поддерева
+
+        Returns:
+            MultisetNode: корень результата
+        """
+        if not node:
+            return other
+        if not other:
+            return node
+        node_left, node_right = node.left, node.right
+        left, found, right = self._split(other, node.key)
+        left = self._symmetric_difference(node_left, left)
+        right = self._symmetric_difference(node_right, right)
+        if found and found.count == node.count:
+            return self._join2(left, right)
+        if found:
+            node.count = abs(node.count - found.count)
+        return self._join(left, node, right)
+
+    def __len__(self) -> int:
+        """Магический метод определения количества элементов с учетом кратности
+
+        Returns:
+            int: количество элементов
+        """
+        return self.root.total if self.root else 0
+
+    def __contains__(self, key) -> bool:
+        """Магический метод проверки наличия ключа (key in multiset)
+
+        Args:
+            key: ключ
+
+        Returns:
+            bool: True, если ключ есть в мультимножестве
+        """
+        return self._search(self.root, key) is not None
+
+    def __str__(self) -> str:
+        """Магический метод вывода мультимножества в виде строки
+
+        Returns:
+            str: мультимножество в виде строки
+        """
+        return (
+            "{" + ", ".join(f"{k}: {c}" for k, c in self.items()) + "}"
+            if self.root
+            else "Empty multiset"
+        )
+
+
+# Пример использования
+if __name__ == "__main__":
+    events = AVLMultiset()
+    for key in [5, 3, 5, 8, 3, 5, 1]:
+        events.insert(key)
+    print(events)
+    print("Count of 5:", events.count(5), "total:", len(events))
+    print("Elements:", list(events.elements()))
+    print("Rank of 5:", events.rank(5), "select(4):", events.select(4))
+    events.delete(5)
+    print("After deleting one 5:", events)
+    print("AVL validation:", events.validate_avl_tree())
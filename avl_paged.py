@@ -0,0 +1,467 @@
+import os
+import struct
+import tempfile
+import weakref
+from collections import OrderedDict
+from itertools import islice
+
+from avl import AVLNode, AVLTree
+
+PAGE_SIZE = 4096
+# Запись узла: ключ, левый и правый потомки (номера записей, 0 - нет), высота
+RECORD = struct.Struct("<qqqi4x")
+RECORDS_PER_PAGE = PAGE_SIZE // RECORD.size
+# Заголовок (страница 0): сигнатура, корень, следующая свободная запись,
+# голова списка освобожденных записей
+HEADER = struct.Struct("<4sqqq")
+MAGIC = b"AVLP"
+
+_KEY, _LEFT, _RIGHT, _HEIGHT = 0, 8, 16, 24  # смещения полей в записи
+_INT64 = struct.Struct("<q")
+_INT32 = struct.Struct("<i")
+
+
+class BufferPool:
+    """LRU-кэш страниц файла с отложенной записью измененных страниц"""
+
+    def __init__(self, file, capacity: int):
+        if capacity < 1:
+            raise ValueError("Buffer pool must hold at least one page")
+        self.file = file  # файл, открытый на чтение и запись в двоичном режиме
+        self.capacity = capacity  # максимальное количество страниц в памяти
+        self.pages = OrderedDict()  # номер страницы -> содержимое
+        self.dirty = set()  # номера измененных страниц
+        self.hits = 0  # обращения к странице в кэше
+        self.reads = 0  # чтения страниц с диска
+        self.writes = 0  # записи страниц на диск
+
+    def get(self, page_no: int, for_write: bool = False) -> bytearray:
+        """Получение страницы (с чтением с диска при промахе)
+
+        Args:
+            page_no (int): номер страницы
+            for_write (bool): страница будет изменена
+
+        Returns:
+            bytearray: содержимое страницы
+        """
+        page = self.pages.get(page_no)
+        if page is None:
+            self.file.seek(page_no * PAGE_SIZE)
+            page = bytearray(self.file.read(PAGE_SIZE).ljust(PAGE_SIZE, b"\0"))
+            self.reads += 1
+            self.pages[page_no] = page
+            if len(self.pages) > self.capacity:
+                self._evict()
+        else:
+            self.hits += 1
+            self.pages.move_to_end(page_no)
+        if for_write:
+            self.dirty.add(page_no)
+        return page
+
+    def _evict(self) -> None:
+        """Вытеснение самой давно использованной страницы с записью на диск"""
+        page_no, page = self.pages.popitem(last=False)
+        if page_no in self.dirty:
+            self._write(page_no, page)
+
+    def _write(self, page_no: int, page: bytearray) -> None:
+        """Запись страницы на диск
+
+        Args:
+            page_no (int): номер страницы
+            page (bytearray): содержимое страницы
+        """
+        self.file.seek(page_no * PAGE_SIZE)
+        self.file.write(page)
+        self.dirty.discard(page_no)
+        self.writes += 1
+
+    def flush(self) -> None:
+        """Запись всех измененных страниц на диск"""
+        for page_no in sorted(self.dirty):
+            self._write(page_no, self.pages[page_no])
+        self.file.flush()
+
+
+class PagedNode:
+    """Узел дерева, хранящийся записью фиксированного размера в файле
+
+    Поля читаются и пишутся через пул буферов при каждом обращении, поэтому
+    алгоритмы AVLTree работают с такими узлами без изменений
+    """
+
+    __slots__ = ("tree", "id")
+
+    def __init__(self, tree, node_id: int):
+        self.tree = tree  # дерево, которому принадлежит файл
+        self.id = node_id  # номер записи (начиная с 1)
+
+    def _location(self) -> tuple:
+        """Номер страницы и смещение записи в ней
+
+        Returns:
+            tuple: (номер страницы, смещение)
+        """
+        index = self.id - 1
+        return 1 + index // RECORDS_PER_PAGE, index % RECORDS_PER_PAGE * RECORD.size
+
+    def _get(self, field: int, fmt: struct.Struct) -> int:
+        page_no, offset = self._location()
+        return fmt.unpack_from(self.tree.pool.get(page_no), offset + field)[0]
+
+    def _set(self, field: int, fmt: struct.Struct, value: int) -> None:
+        page_no, offset = self._location()
+        fmt.pack_into(self.tree.pool.get(page_no, True), offset + field, value)
+
+    def _child(self, field: int):
+        node_id = self._get(field, _INT64)
+        return PagedNode(self.tree, node_id) if node_id else None
+
+    key = property(lambda self: self._get(_KEY, _INT64))
+    height = property(
+        lambda self: self._get(_HEIGHT, _INT32),
+        lambda self, value: self._set(_HEIGHT, _INT32, value),
+    )
+    left = property(
+        lambda self: self._child(_LEFT),
+        lambda self, node: self._set(_LEFT, _INT64, node.id if node else 0),
+    )
+    right = property(
+        lambda self: self._child(_RIGHT),
+        lambda self, node: self._set(_RIGHT, _INT64, node.id if node else 0),
+    )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, PagedNode) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+class PagedAVLTree(AVLTree):
+    """АВЛ-дерево, узлы которого хранятся в файле постранично
+
+    Узлы - записи фиксированного размера, адресуемые номером страницы и
+    смещением. Горячие страницы держатся в LRU-пуле буферов заданного
+    размера, измененные страницы пишутся на диск при вытеснении или flush().
+    Поддерживаются все операции AVLTree (ключи - 64-битные целые). Без
+    указания пути используется временный файл, который удаляется при close()
+    или сборке дерева сборщиком мусора. Узлы не могут переходить между
+    файлами, поэтому split/join и операции над множествами копируют ключи
+    """
+
+    def __init__(self, path: str = None, pool_pages: int = 1024):
+        temporary = path is None
+        if temporary:
+            handle, path = tempfile.mkstemp(suffix=".avlp")
+            os.close(handle)
+        self.path = path  # путь к файлу дерева
+        mode = "r+b" if os.path.exists(path) and os.path.getsize(path) else "w+b"
+        self.file = open(path, mode)
+        self.pool = BufferPool(self.file, pool_pages)
+        # Закрывает файл (и удаляет временный), даже если close() не вызван:
+        # split, join и from_sorted создают деревья, которые никто не закрывает
+        self._finalizer = weakref.finalize(
+            self, _release, self.pool, self.file, path if temporary else None
+        )
+        if mode == "w+b":
+            self._write_header(0, 1, 0)
+        else:
+            magic, *_ = HEADER.unpack_from(self.pool.get(0))
+            if magic != MAGIC:
+                self._finalizer.detach()
+                self.file.close()
+                raise ValueError("Not a paged AVL tree file")
+
+    def _read_header(self) -> tuple:
+        """Чтение заголовка файла
+
+        Returns:
+            tuple: (корень, следующая свободная запись, голова списка освобожденных)
+        """
+        return HEADER.unpack_from(self.pool.get(0))[1:]
+
+    def _write_header(self, root_id: int, next_id: int, free_id: int) -> None:
+        """Запись заголовка файла
+
+        Args:
+            root_id (int): номер записи корня (0 - пустое дерево)
+            next_id (int): номер следующей еще не использованной записи
+            free_id (int): голова списка освобожденных записей
+        """
+        HEADER.pack_into(self.pool.get(0, True), 0, MAGIC, root_id, next_id, free_id)
+
+    @property
+    def root(self) -> PagedNode:
+        root_id = self._read_header()[0]
+        return PagedNode(self, root_id) if root_id else None
+
+    @root.setter
+    def root(self, node: PagedNode) -> None:
+        _, next_id, free_id = self._read_header()
+        self._write_header(node.id if node else 0, next_id, free_id)
+        self._min_node = self._max_node = None
+
+    def _new_node(self, key: int) -> PagedNode:
+        """Выделение записи под новый узел (сначала из освобожденных)
+
+        Args:
+            key (int): ключ узла
+
+        Returns:
+            PagedNode: новый узел
+        """
+        root_id, next_id, free_id = self._read_header()
+        if free_id:
+            node = PagedNode(self, free_id)
+            free_id = node._get(_LEFT, _INT64)
+        else:
+            node = PagedNode(self, next_id)
+            next_id += 1
+        self._write_header(root_id, next_id, free_id)
+        page_no, offset = node._location()
+        RECORD.pack_into(self.pool.get(page_no, True), offset, key, 0, 0, 1)
+        return node
+
+    def _free_node(self, node: PagedNode) -> None:
+        """Возврат записи удаленного узла в список освобожденных
+
+        Args:
+            node (PagedNode): удаленный узел
+        """
+        root_id, next_id, free_id = self._read_header()
+        node._set(_LEFT, _INT64, free_id)
+        self._write_header(root_id, next_id, node.id)
+
+    def _clear(self) -> None:
+        """Удаление всех узлов за O(1): все записи файла снова свободны"""
+        self._write_header(0, 1, 0)
+        self._min_node = self._max_node = None
+
+    def delete(self, key: int) -> None:
+        """Удаление узла с заданным ключом с освобождением его записи
+
+        Args:
+            key (int): ключ для удаления
+        """
+        node = self._search(self.root, key)
+        if node:
+            super().delete(key)
+            self._free_node(node)
+
+    def __delitem__(self, key: int) -> None:
+        """Магический метод удаления узла по ключу с освобождением его записи
+
+        Args:
+            key (int): ключ для удаления
+        """
+        self.delete(key)
+
+    def delete_many(self, keys) -> None:
+        """Пакетное удаление ключей с освобождением записей
+
+        Args:
+            keys: ключи для удаления
+        """
+        removed = [node for node in map(self.search, set(keys)) if node]
+        super().delete_many(keys)
+        for node in removed:
+            self._free_node(node)
+
+    def _pop_end(self, pop) -> PagedNode:
+        """Отделение крайнего узла с освобождением его записи
+
+        Args:
+            pop: self._pop_min или self._pop_max
+
+        Returns:
+            PagedNode: отделенный узел (ключ читается до повторного
+                использования записи)
+        """
+        node = super()._pop_end(pop)
+        self._free_node(node)
+        return node
+
+    def pop_min_n(self, k: int) -> list:
+        """Удаление и возврат k минимальных ключей с освобождением записей
+
+        Args:
+            k (int): количество ключей
+
+        Returns:
+            list: до k минимальных ключей в порядке возрастания
+        """
+        keys = [node.key for node in islice(self._iter_nodes(self.root), max(k, 0))]
+        self.delete_many(keys)
+        return keys
+
+    def _clone_node(self, node) -> PagedNode:
+        """Копия ключа узла в новой записи файла (без потомков)
+
+        Args:
+            node: исходный узел (в том числе из другого дерева)
+
+        Returns:
+            PagedNode: копия узла
+        """
+        # Потомков расставляют _link_balanced и _join: ссылки исходного узла
+        # могут указывать в другой файл или на узлы AVLTree в памяти
+        return self._new_node(node.key)
+
+    def split(self, key: int) -> tuple:
+        """Разрезание дерева по ключу с копированием частей в новые файлы за O(n)
+
+        Узлы разных файлов не могут ссылаться друг на друга, поэтому части
+        строятся заново (AVLTree.from_sorted), а текущее дерево становится
+        пустым, и все записи его файла освобождаются
+
+        Args:
+            key (int): ключ для разрезания
+
+        Returns:
+            tuple: (дерево с ключами меньше key, узел с ключом key или None,
+                дерево с ключами больше key); найденный узел - копия в памяти
+                (AVLNode), так как его запись освобождается
+        """
+        found = self._search(self.root, key)
+        found = found and AVLNode(found.key)
+        keys = [node.key for node in self._iter_nodes(self.root)]
+        left = self.from_sorted(k for k in keys if k < key)
+        right = self.from_sorted(k for k in keys if k > key)
+        self._clear()
+        return left, found, right
+
+    @classmethod
+    def join(cls, left, key: int, right):
+        """Соединение двух деревьев через ключ key в новом файле за O(n)
+
+        Args:
+            left (PagedAVLTree): дерево с ключами меньше key
+            key (int): средний ключ
+            right (PagedAVLTree): дерево с ключами больше key
+
+        Raises:
+            ValueError: ключи деревьев не разделены ключом key
+
+        Returns:
+            PagedAVLTree: соединенное дерево
+        """
+        keys = left.inorder_traversal() + [key] + right.inorder_traversal()
+        if keys != sorted(set(keys)):
+            raise ValueError("Keys of the joined trees must be separated by key")
+        _discard(left)
+        _discard(right)
+        return cls.from_sorted(keys)
+
+    def union(self, other) -> None:
+        """Объединение множеств за O(Mlog(N/M+1)), other становится пустым
+
+        Args:
+            other (AVLTree): другое дерево
+        """
+        self.insert_many(other.inorder_traversal())
+        _discard(other)
+
+    def intersection(self, other) -> None:
+        """Пересечение множеств, other становится пустым
+
+        Args:
+            other (AVLTree): другое дерево
+        """
+        keep = set(other.inorder_traversal())
+        self.delete_many([key for key in self.inorder_traversal() if key not in keep])
+        _discard(other)
+
+    def difference(self, other) -> None:
+        """Разность множеств за O(Mlog(N/M+1)), other становится пустым
+
+        Args:
+            other (AVLTree): другое дерево
+        """
+        self.delete_many(other.inorder_traversal())
+        _discard(other)
+
+    def symmetric_difference(self, other) -> None:
+        """Симметрическая разность множеств, other становится пустым
+
+        Args:
+            other (AVLTree): другое дерево
+        """
+        theirs = set(other.inorder_traversal())
+        common = [key for key in self.inorder_traversal() if key in theirs]
+        self.insert_many(theirs.difference(common))
+        self.delete_many(common)
+        _discard(other)
+
+    def io_stats(self) -> dict:
+        """Счетчики работы пула буферов
+
+        Returns:
+            dict: попадания в кэш, чтения и записи страниц
+        """
+        return {
+            "hits": self.pool.hits,
+            "reads": self.pool.reads,
+            "writes": self.pool.writes,
+        }
+
+    def flush(self) -> None:
+        """Запись всех измененных страниц на диск"""
+        self.pool.flush()
+
+    def close(self) -> None:
+        """Сохранение изменений и закрытие файла (временный файл удаляется)"""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _discard(tree: AVLTree) -> None:
+    """Опустошение дерева-источника split/join и операций над множествами
+
+    Args:
+        tree (AVLTree): дерево (у PagedAVLTree освобождаются все записи файла)
+    """
+    if isinstance(tree, PagedAVLTree):
+        tree._clear()
+    else:
+        tree.root = None
+
+
+def _release(pool: BufferPool, file, temporary_path: str) -> None:
+    """Закрытие файла дерева
+
+    Args:
+        pool (BufferPool): пул буферов файла
+        file: открытый файл
+        temporary_path (str): путь временного файла для удаления (None - файл
+            пользователя, измененные страницы сохраняются)
+    """
+    if file.closed:
+        return
+    if temporary_path is None:
+        pool.flush()
+    file.close()
+    if temporary_path is not None:
+        os.remove(temporary_path)
+
+
+# Пример использования
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.avlp")
+        with PagedAVLTree(path, pool_pages=4) as tree:
+            for key in [10, 20, 30, 40, 50, 25, 60]:
+                tree.insert(key)
+            tree.delete(30)
+        with PagedAVLTree(path, pool_pages=4) as tree:
+            print("Inorder traversal after reopen:", tree.inorder_traversal())
+            print("Range [15, 45]:", list(tree.irange(15, 45)))
+            print("AVL validation:", tree.validate_avl_tree())
+            print("I/O:", tree.io_stats())
@@ -0,0 +1,140 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from multiprocessing import resource_tracker, shared_memory
+
+from avl import AVLTree
+
+# Размер куска входного файла, который обрабатывает один процесс
+CHUNK_BYTES = 64 * 1024 * 1024
+# Количество ключей, переводимых из общей памяти в int за один раз при слиянии
+MERGE_BLOCK = 64 * 1024
+
+
+def _chunk_bounds(path: str, chunk_bytes: int) -> list:
+    """Разбиение файла на куски по байтам
+
+    Args:
+        path (str): путь к файлу
+        chunk_bytes (int): размер куска
+
+    Returns:
+        list: пары (начало, конец) кусков
+    """
+    size = os.path.getsize(path)
+    return [
+        (start, min(start + chunk_bytes, size))
+        for start in range(0, size, chunk_bytes)
+    ]
+
+
+def _sort_chunk(path: str, start: int, end: int) -> tuple:
+    """Чтение, сортировка и удаление повторов в куске файла (в процессе-работнике)
+
+    Куску принадлежат строки, которые начинаются в [start, end). Результат
+    пишется в блок общей памяти, в родительский процесс передается только имя
+
+    Args:
+        path (str): путь к файлу с ключами (по одному целому числу в строке)
+        start (int): начало куска
+        end (int): конец куска
+
+    Returns:
+        tuple: (имя блока общей памяти или None, количество ключей)
+    """
+    with open(path, "rb") as file:
+        if start:
+            # Дочитываем строку, начатую в предыдущем куске
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        data = file.read(max(end - position, 0)) if position < end else b""
+        if data and not data.endswith(b"\n"):
+            data += file.readline()
+    keys = array("q", sorted(set(map(int, data.split()))))
+    if not keys:
+        return None, 0
+    block = shared_memory.SharedMemory(create=True, size=len(keys) * keys.itemsize)
+    block.buf[: len(keys) * keys.itemsize] = keys.tobytes()
+    block.close()
+    return block.name, len(keys)
+
+
+def _iter_block(block: shared_memory.SharedMemory, count: int):
+    """Ленивое чтение отсортированных ключей из блока общей памяти
+
+    Args:
+        block (SharedMemory): блок общей памяти
+        count (int): количество ключей
+
+    Yields:
+        int: ключи в порядке возрастания
+    """
+    # Блок может быть больше данных (округление до страницы)
+    with block.buf[: count * 8] as raw, raw.cast("q") as view:
+        for i in range(0, count, MERGE_BLOCK):
+            yield from view[i : i + MERGE_BLOCK].tolist()
+
+
+def build_parallel(
+    path: str, workers: int = None, chunk_bytes: int = CHUNK_BYTES
+) -> AVLTree:
+    """Параллельное построение AVLTree из большого файла с ключами
+
+    Куски файла сортируются и очищаются от повторов в пуле процессов,
+    отсортированные результаты передаются через общую память, потоково
+    сливаются (k-way merge) и подаются в построение за O(n) (AVLTree.from_sorted)
+
+    Args:
+        path (str): путь к файлу с ключами (по одному целому числу в строке)
+        workers (int): количество процессов (по умолчанию - число ядер)
+        chunk_bytes (int): размер куска файла на одну задачу
+
+    Returns:
+        AVLTree: построенное дерево
+    """
+    bounds = _chunk_bounds(path, chunk_bytes)
+    # Общий трекер ресурсов для всех процессов: иначе каждый работник
+    # запускает свой и удаляет созданные им блоки общей памяти при выходе
+    resource_tracker.ensure_running()
+    with ProcessPoolExecutor(workers) as pool:
+        results = list(
+            pool.map(
+                _sort_chunk,
+                [path] * len(bounds),
+                [start for start, _ in bounds],
+                [end for _, end in bounds],
+            )
+        )
+    blocks = [
+        (shared_memory.SharedMemory(name=name), count)
+        for name, count in results
+        if name is not None
+    ]
+    streams = [_iter_block(block, count) for block, count in blocks]
+    try:
+        # from_sorted пропускает повторы, попавшие в разные куски
+        return AVLTree.from_sorted(merge(*streams))
+    finally:
+        for stream in streams:
+            stream.close()
+        for block, _ in blocks:
+            block.close()
+            block.unlink()
+
+
+# Пример использования
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        keys = [random.randrange(10**6) for _ in range(10**5)]
+        file.write("\n".join(map(str, keys)))
+    try:
+        tree = build_parallel(file.name, workers=2, chunk_bytes=64 * 1024)
+        print("Total nodes:", tree.count_nodes(), "expected:", len(set(keys)))
+        print("AVL validation:", tree.validate_avl_tree())
+    finally:
+        os.remove(file.name)
@@ -0,0 +1,243 @@
+from avl import AVLNode, AVLTree
+
+
+class PersistentAVLTree(AVLTree):
+    """Персистентное АВЛ-дерево с копированием пути
+
+    Узлы, однажды ставшие частью дерева, больше не изменяются: любая операция
+    копирует только O(log n) узлов на изменяемом пути (включая узлы,
+    участвующие в поворотах) и подменяет корень. Поэтому snapshot() стоит O(1),
+    а старые версии разделяют неизмененные поддеревья с новыми и могут
+    безопасно читаться из других потоков, пока писатель продолжает работу
+    """
+
+    def snapshot(self):
+        """Снимок текущей версии дерева за O(1)
+
+        Returns:
+            PersistentAVLTree: независимая версия дерева, разделяющая узлы с текущей
+        """
+        snap = type(self)()
+        snap.root = self.root
+        return snap
+
+    def _rotate_right(self, y: AVLNode) -> AVLNode:
+        """Правый поворот вокруг узла y с копированием поворачиваемых узлов
+
+        Args:
+            y (AVLNode): узел для поворота
+
+        Returns:
+            AVLNode: узел после поворота
+        """
+        y = self._clone_node(y)
+        y.left = self._clone_node(y.left)
+        return super()._rotate_right(y)
+
+    def _rotate_left(self, x: AVLNode) -> AVLNode:
+        """Левый поворот вокруг узла x с копированием поворачиваемых узлов
+
+        Args:
+            x (AVLNode): узел для поворота
+
+        Returns:
+            AVLNode: узел после поворота
+        """
+        x = self._clone_node(x)
+        x.right = self._clone_node(x.right)
+        return super()._rotate_left(x)
+
+    def _insert(self, node: AVLNode, key: int) -> AVLNode:
+        """Вставка с копированием пути (внутренняя приватная часть)
+
+        Если ключ уже есть, узлы не копируются и возвращается тот же узел
+
+        Args:
+            node (AVLNode): текущий узел просмотра
+            key (int): ключ для вставки
+
+        Returns:
+            AVLNode: новая версия узла после вставки
+        """
+        if not node:
+            return AVLNode(key)
+        if key < node.key:
+            left = self._insert(node.left, key)
+            if left is node.left:
+                return node
+            node = self._clone_node(node)
+            node.left = left
+        elif key > node.key:
+            right = self._insert(node.right, key)
+            if right is node.right:
+                return node
+            node = self._clone_node(node)
+            node.right = right
+        else:
+            return node
+        self._update_height(node)
+        return self._balance_node(node)
+
+    def _delete(self, node: AVLNode, key: int) -> AVLNode:
+        """Удаление с копированием пути (внутренняя приватная часть)
+
+        Если ключа нет, узлы не копируются и возвращается тот же узел
+
+        Args:
+            node (AVLNode): текущий узел просмотра
+            key (int): ключ для удаления
+
+        Returns:
+            AVLNode: новая версия узла после удаления
+        """
+        if not node:
+            return node
+        if key < node.key:
+            left = self._delete(node.left, key)
+            if left is node.left:
+                return node
+            node = self._clone_node(node)
+            node.left = left
+        elif key > node.key:
+            right = self._delete(node.right, key)
+            if right is node.right:
+                return node
+            node = self._clone_node(node)
+            node.right = right
+        else:
+            if not node.left:
+                return node.right
+            elif not node.right:
+                return node.left
+            # Минимум правого поддерева копируется на место удаляемого узла
+            left = node.left
+            right, successor, _ = self._pop_min(node.right)
+            node = self._clone_node(successor)
+            node.left, node.right = left, right
+        self._update_height(node)
+        return self._balance_node(node)
+
+    def _pop_min(self, node: AVLNode) -> tuple:
+        """Отделение минимального узла с копированием пути
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Returns:
+            tuple: (новая версия оставшегося поддерева, минимальный узел,
+                новый минимальный узел поддерева или None)
+        """
+        if not node.left:
+            return node.right, node, node.right
+        left, first, after = self._pop_min(node.left)
+        node = self._clone_node(node)
+        node.left = left
+        after = after or node
+        self._update_height(node)
+        return self._balance_node(node), first, after
+
+    def _pop_max(self, node: AVLNode) -> tuple:
+        """Отделение максимального узла с копированием пути
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Returns:
+            tuple: (новая версия оставшегося поддерева, максимальный узел,
+                новый максимальный узел поддерева или None)
+        """
+        if not node.right:
+            return node.left, node, node.left
+        right, last, after = self._pop_max(node.right)
+        node = self._clone_node(node)
+        node.right = right
+        after = after or node
+        self._update_height(node)
+        return self._balance_node(node), last, after
+
+    def _join(self, left: AVLNode, node: AVLNode, right: AVLNode) -> AVLNode:
+        """Соединение деревьев через копию среднего узла
+
+        Args:
+            left (AVLNode): левое поддерево
+            node (AVLNode): средний узел (не изменяется)
+            right (AVLNode): правое поддерево
+
+        Returns:
+            AVLNode: корень соединенного дерева
+        """
+        return super()._join(left, self._clone_node(node), right)
+
+    def _join_right(self, left: AVLNode, node: AVLNode, right: AVLNode) -> AVLNode:
+        """Спуск по правому краю левого дерева с копированием пути
+
+        Args:
+            left (AVLNode): левое (более высокое) поддерево
+            node (AVLNode): средний узел (уже скопирован)
+            right (AVLNode): правое поддерево
+
+        Returns:
+            AVLNode: корень соединенного дерева
+        """
+        return super()._join_right(self._clone_node(left), node, right)
+
+    def _join_left(self, left: AVLNode, node: AVLNode, right: AVLNode) -> AVLNode:
+        """Спуск по левому краю правого дерева с копированием пути
+
+        Args:
+            left (AVLNode): левое поддерево
+            node (AVLNode): средний узел (уже скопирован)
+            right (AVLNode): правое (более высокое) поддерево
+
+        Returns:
+            AVLNode: корень соединенного дерева
+        """
+        return super()._join_left(left, node, self._clone_node(right))
+
+    def _link_balanced(self, nodes: list, lo: int, hi: int) -> AVLNode:
+        """Связывание копий отсортированных узлов в сбалансированное дерево
+
+        Args:
+            nodes (list): узлы в порядке возрастания ключей (не изменяются)
+            lo (int): начало диапазона
+            hi (int): конец диапазона (не включительно)
+
+        Returns:
+            AVLNode: корень построенного дерева
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._clone_node(nodes[mid])
+        node.left = self._link_balanced(nodes, lo, mid)
+        node.right = self._link_balanced(nodes, mid + 1, hi)
+        self._update_height(node)
+        return node
+
+    def split_tree(self, key: int) -> tuple:
+        """Разделение дерева по ключу за O(log n) без изменения старых версий
+
+        Args:
+            key (int): ключ с которой вершины будет происходить разделение
+
+        Returns:
+            tuple: полученные новые деревья (ключи меньше key, ключи больше key)
+        """
+        left, found, right = self.split(key)
+        if found:
+            self.root = AVLNode(found.key)
+        return left, right
+
+
+# Пример использования
+if __name__ == "__main__":
+    tree = PersistentAVLTree()
+    for key in [10, 20, 30, 40, 50, 25, 60]:
+        tree.insert(key)
+    before = tree.snapshot()
+
+    tree.insert(35)
+    tree.delete(20)
+    print("Current version:", tree.inorder_traversal())
+    print("Snapshot:", before.inorder_traversal())
+    print("AVL validation:", tree.validate_avl_tree(), before.validate_avl_tree())
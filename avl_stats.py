@@ -0,0 +1,222 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Операции, время которых замеряется
+TIMED_OPERATIONS = ("insert", "delete", "search", "split_tree", "merge_trees")
+# Методы дерева, подменяемые на время сбора статистики
+_PATCHED = ("_rotate_left", "_rotate_right", "_balance_node", "_update_height", "_search")
+
+
+class TreeStats:
+    """Счетчики работы дерева, собираемые instrument()"""
+
+    def __init__(self, on_operation=None):
+        self.rotations = Counter()  # направление поворота -> количество
+        self.rebalances = Counter()  # "single" / "double" -> количество балансировок
+        # длина подъема (узлов с изменившейся высотой) -> количество вставок/удалений
+        self.retrace = Counter()
+        self.search_depth = Counter()  # просмотренные узлы -> количество поисков
+        self.timings = {}  # операция -> [количество, суммарное время, максимум]
+        self.on_operation = on_operation  # callback(имя операции, время в секундах)
+        self._changed = 0  # узлы с изменившейся высотой в текущей операции
+        self._visited = 0  # вызовы _search в текущем поиске
+
+    def _record(self, name: str, elapsed: float) -> None:
+        """Учет времени одной операции
+
+        Args:
+            name (str): имя операции
+            elapsed (float): время в секундах
+        """
+        timing = self.timings.get(name)
+        if timing is None:
+            self.timings[name] = [1, elapsed, elapsed]
+        else:
+            timing[0] += 1
+            timing[1] += elapsed
+            if elapsed > timing[2]:
+                timing[2] = elapsed
+        if self.on_operation:
+            self.on_operation(name, elapsed)
+
+    def reset(self) -> None:
+        """Обнуление всех счетчиков"""
+        for counter in (self.rotations, self.rebalances, self.retrace, self.search_depth):
+            counter.clear()
+        self.timings.clear()
+
+    def snapshot(self) -> dict:
+        """Снимок счетчиков в виде словаря (пригоден для json.dumps)
+
+        Returns:
+            dict: счетчики поворотов, балансировок, гистограммы длин подъема и
+                глубин поиска, время операций (количество, сумма, среднее, максимум)
+        """
+        return {
+            "rotations": dict(self.rotations),
+            "rebalances": dict(self.rebalances),
+            "retrace": dict(sorted(self.retrace.items())),
+            "search_depth": dict(sorted(self.search_depth.items())),
+            "timings": {
+                name: {
+                    "count": count,
+                    "total": total,
+                    "mean": total / count,
+                    "max": worst,
+                }
+                for name, (count, total, worst) in self.timings.items()
+            },
+        }
+
+
+def instrument(tree, on_operation=None) -> TreeStats:
+    """Включение сбора статистики для одного дерева
+
+    Методы подменяются атрибутами экземпляра, класс не изменяется: другие
+    деревья и это дерево после uninstrument() работают без накладных расходов
+
+    Args:
+        tree (AVLTree): дерево (в том числе наследник AVLTree)
+        on_operation: функция (имя, время в секундах), вызываемая после каждой
+            замеряемой операции
+
+    Raises:
+        ValueError: статистика для дерева уже собирается
+
+    Returns:
+        TreeStats: счетчики, пополняемые при работе дерева
+    """
+    if "_stats" in vars(tree):
+        raise ValueError("Tree is already instrumented")
+    stats = TreeStats(on_operation)
+    rotate_left, rotate_right = tree._rotate_left, tree._rotate_right
+    balance_node, update_height = tree._balance_node, tree._update_height
+    search_node = tree._search
+
+    def _rotate_left(node):
+        stats.rotations["left"] += 1
+        return rotate_left(node)
+
+    def _rotate_right(node):
+        stats.rotations["right"] += 1
+        return rotate_right(node)
+
+    def _balance_node(node):
+        balance = tree._get_balance(node)
+        if balance > 1:
+            double = tree._get_balance(node.left) < 0
+        elif balance < -1:
+            double = tree._get_balance(node.right) > 0
+        else:
+            return balance_node(node)
+        stats.rebalances["double" if double else "single"] += 1
+        return balance_node(node)
+
+    def _update_height(node):
+        height = node.height
+        update_height(node)
+        if node.height != height:
+            stats._changed += 1
+
+    def _search(node, key):
+        stats._visited += 1
+        return search_node(node, key)
+
+    patches = {
+        "_rotate_left": _rotate_left,
+        "_rotate_right": _rotate_right,
+        "_balance_node": _balance_node,
+        "_update_height": _update_height,
+        "_search": _search,
+    }
+    for name in TIMED_OPERATIONS:
+        patches[name] = _timed(stats, name, getattr(tree, name))
+    vars(tree).update(patches)
+    tree._stats = stats
+    return stats
+
+
+def _timed(stats: TreeStats, name: str, method):
+    """Обертка операции с замером времени и сбором гистограмм
+
+    Args:
+        stats (TreeStats): счетчики
+        name (str): имя операции
+        method: исходный связанный метод
+
+    Returns:
+        function: обертка
+    """
+
+    def wrapper(*args, **kwargs):
+        stats._changed = stats._visited = 0
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+        if name == "search":
+            # Промах заканчивается лишним вызовом для пустого потомка
+            stats.search_depth[stats._visited - (result is None)] += 1
+        elif name in ("insert", "delete"):
+            stats.retrace[stats._changed] += 1
+        stats._record(name, elapsed)
+        return result
+
+    return wrapper
+
+
+def uninstrument(tree) -> TreeStats:
+    """Отключение сбора статистики и возврат методов класса
+
+    Args:
+        tree (AVLTree): дерево
+
+    Returns:
+        TreeStats: собранные счетчики (None, если сбор не был включен)
+    """
+    for name in _PATCHED + TIMED_OPERATIONS:
+        vars(tree).pop(name, None)
+    return vars(tree).pop("_stats", None)
+
+
+@contextmanager
+def instrumented(tree, on_operation=None):
+    """Контекстный менеджер сбора статистики внутри блока with
+
+    Args:
+        tree (AVLTree): дерево
+        on_operation: функция (имя, время в секундах) для каждой операции
+
+    Yields:
+        TreeStats: счетчики
+    """
+    stats = instrument(tree, on_operation)
+    try:
+        yield stats
+    finally:
+        uninstrument(tree)
+
+
+# Пример использования
+if __name__ == "__main__":
+    import json
+    import random
+
+    from avl import AVLTree
+
+    tree = AVLTree()
+    slow = []
+    with instrumented(
+        tree, on_operation=lambda name, t: t > 1e-3 and slow.append(name)
+    ) as stats:
+        for key in random.sample(range(10000), 2000):
+            tree.insert(key)
+        for key in range(0, 10000, 7):
+            tree.search(key)
+        for key in range(0, 10000, 3):
+            tree.delete(key)
+    print(json.dumps(stats.snapshot(), indent=2))
+    print("Slow operations:", slow)
+    print("Instrumentation removed:", "insert" not in vars(tree))
@@ -0,0 +1,323 @@
+from avl import AVLNode, AVLTree
+
+
+class WAVLTree(AVLTree):
+    """Weak AVL (WAVL) дерево с интерфейсом AVLTree
+
+    В поле height узла хранится ранг + 1 (у отсутствующего узла 0), разность
+    рангов родителя и потомка равна 1 или 2, у листьев ранг 0. Пока есть только
+    вставки, дерево совпадает с АВЛ-деревом, а при удалении балансировка
+    понижает ранги вместо поворотов и выполняет не больше двух поворотов
+    на операцию (O(1) амортизированно на любой последовательности операций).
+    Высота не превышает 2log(n)
+
+    Пакетные операции, split/join и операции над множествами используют
+    соединения AVLTree: разность рангов соседних узлов не больше 1, поэтому
+    они работают без изменений и оставляют ранговое правило выполненным
+    """
+
+    def _rotate_right(self, y: AVLNode) -> AVLNode:
+        """Правый поворот вокруг узла y без пересчета рангов
+
+        Args:
+            y (AVLNode): узел для поворота
+
+        Returns:
+            AVLNode: узел после поворота
+        """
+        x = y.left
+        y.left, x.right = x.right, y
+        return x
+
+    def _rotate_left(self, x: AVLNode) -> AVLNode:
+        """Левый поворот вокруг узла x без пересчета рангов
+
+        Args:
+            x (AVLNode): узел для поворота
+
+        Returns:
+            AVLNode: узел после поворота
+        """
+        y = x.right
+        x.right, y.left = y.left, x
+        return y
+
+    def _rotate_update(self, node: AVLNode, rotate) -> AVLNode:
+        """Поворот с пересчетом рангов по высотам потомков (как в AVLTree)
+
+        Args:
+            node (AVLNode): узел для поворота
+            rotate: self._rotate_left или self._rotate_right
+
+        Returns:
+            AVLNode: узел после поворота
+        """
+        top = rotate(node)
+        self._update_height(node)
+        self._update_height(top)
+        return top
+
+    def _balance_node(self, node: AVLNode) -> AVLNode:
+        """Балансировка узла по правилам АВЛ-дерева на рангах (при соединениях)
+
+        Args:
+            node (AVLNode): узел для балансировки
+
+        Returns:
+            AVLNode: узел после балансировки
+        """
+        balance = self._get_balance(node)
+        if balance > 1:
+            if self._get_balance(node.left) < 0:
+                node.left = self._rotate_update(node.left, self._rotate_left)
+            return self._rotate_update(node, self._rotate_right)
+        if balance < -1:
+            if self._get_balance(node.right) > 0:
+                node.right = self._rotate_update(node.right, self._rotate_right)
+            return self._rotate_update(node, self._rotate_left)
+        return node
+
+    def _insert(self, node: AVLNode, key: int) -> AVLNode:
+        """Вставка нового узла с заданным ключом (внутренняя приватная часть)
+
+        Args:
+            node (AVLNode): текущий узел просмотра
+            key (int): ключ для вставки
+
+        Returns:
+            AVLNode: узел после вставки
+        """
+        if not node:
+            return self._new_node(key)
+        if key < node.key:
+            node.left = self._insert(node.left, key)
+            return self._grow_left(node)
+        if key > node.key:
+            node.right = self._insert(node.right, key)
+            return self._grow_right(node)
+        return node
+
+    def _grow_left(self, node: AVLNode) -> AVLNode:
+        """Восстановление рангов после роста левого поддерева
+
+        Args:
+            node (AVLNode): узел, у левого потомка которого мог вырасти ранг
+
+        Returns:
+            AVLNode: узел после балансировки
+        """
+        rank = self._get_height
+        x = node.left
+        if rank(node) != rank(x):
+            return node
+        # Левый потомок стал 0-потомком
+        if rank(node) - rank(node.right) == 1:
+            node.height += 1  # повышение, проверка продолжается выше
+            return node
+        if rank(x) - rank(x.right) == 2:  # малый поворот
+            top = self._rotate_right(node)
+            node.height -= 1
+            return top
+        y = x.right  # большой поворот
+        node.left = self._rotate_left(x)
+        top = self._rotate_right(node)
+        y.height += 1
+        x.height -= 1
+        node.height -= 1
+        return top
+
+    def _grow_right(self, node: AVLNode) -> AVLNode:
+        """Восстановление рангов после роста правого поддерева
+
+        Args:
+            node (AVLNode): узел, у правого потомка которого мог вырасти ранг
+
+        Returns:
+            AVLNode: узел после балансировки
+        """
+        rank = self._get_height
+        x = node.right
+        if rank(node) != rank(x):
+            return node
+        if rank(node) - rank(node.left) == 1:
+            node.height += 1
+            return node
+        if rank(x) - rank(x.left) == 2:
+            top = self._rotate_left(node)
+            node.height -= 1
+            return top
+        y = x.left
+        node.right = self._rotate_right(x)
+        top = self._rotate_left(node)
+        y.height += 1
+        x.height -= 1
+        node.height -= 1
+        return top
+
+    def _delete(self, node: AVLNode, key: int) -> AVLNode:
+        """Удаление узла с заданным ключом (внутренняя приватная часть)
+
+        Args:
+            node (AVLNode): текущий узел просмотра
+            key (int): ключ для удаления
+
+        Returns:
+            AVLNode: узел после удаления
+        """
+        if not node:
+            return node
+        if key < node.key:
+            node.left = self._delete(node.left, key)
+            return self._shrink_left(node)
+        if key > node.key:
+            node.right = self._delete(node.right, key)
+            return self._shrink_right(node)
+        if not node.left:
+            return node.right
+        if not node.right:
+            return node.left
+        # Преемник занимает место узла вместе с его рангом
+        right, successor, _ = self._pop_min(node.right)
+        successor.left, successor.right = node.left, right
+        successor.height = node.height
+        return self._shrink_right(successor)
+
+    def _pop_min(self, node: AVLNode) -> tuple:
+        """Отделение узла с минимальным ключом от поддерева
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Returns:
+            tuple: (оставшееся поддерево, узел с минимальным ключом,
+                новый минимальный узел поддерева или None)
+        """
+        if not node.left:
+            return node.right, node, node.right
+        node.left, first, after = self._pop_min(node.left)
+        return self._shrink_left(node), first, after or node
+
+    def _pop_max(self, node: AVLNode) -> tuple:
+        """Отделение узла с максимальным ключом от поддерева
+
+        Args:
+            node (AVLNode): корень поддерева
+
+        Returns:
+            tuple: (оставшееся поддерево, узел с максимальным ключом,
+                новый максимальный узел поддерева или None)
+        """
+        if not node.right:
+            return node.left, node, node.left
+        node.right, last, after = self._pop_max(node.right)
+        return self._shrink_right(node), last, after or node
+
+    def _shrink_left(self, node: AVLNode) -> AVLNode:
+        """Восстановление рангов после уменьшения левого поддерева
+
+        Args:
+            node (AVLNode): узел, у левого потомка которого мог уменьшиться ранг
+
+        Returns:
+            AVLNode: узел после балансировки
+        """
+        rank = self._get_height
+        if not node.left and not node.right:
+            node.height = 1  # лист 2,2 понижается до ранга 0
+            return node
+        if rank(node) - rank(node.left) < 3:
+            return node
+        # Левый потомок стал 3-потомком
+        y = node.right
+        if rank(node) - rank(y) == 2:
+            node.height -= 1  # понижение, проверка продолжается выше
+            return node
+        if rank(y) - rank(y.left) == 2 and rank(y) - rank(y.right) == 2:
+            y.height -= 1  # двойное понижение
+            node.height -= 1
+            return node
+        if rank(y) - rank(y.right) == 1:  # малый поворот
+            top = self._rotate_left(node)
+            y.height += 1
+            node.height -= 1
+            if not node.left and not node.right:
+                node.height = 1
+            return top
+        z = y.left  # большой поворот
+        node.right = self._rotate_right(y)
+        top = self._rotate_left(node)
+        z.height += 2
+        y.height -= 1
+        node.height -= 2
+        return top
+
+    def _shrink_right(self, node: AVLNode) -> AVLNode:
+        """Восстановление рангов после уменьшения правого поддерева
+
+        Args:
+            node (AVLNode): узел, у правого потомка которого мог уменьшиться ранг
+
+        Returns:
+            AVLNode: узел после балансировки
+        """
+        rank = self._get_height
+        if not node.left and not node.right:
+            node.height = 1
+            return node
+        if rank(node) - rank(node.right) < 3:
+            return node
+        y = node.left
+        if rank(node) - rank(y) == 2:
+            node.height -= 1
+            return node
+        if rank(y) - rank(y.left) == 2 and rank(y) - rank(y.right) == 2:
+            y.height -= 1
+            node.height -= 1
+            return node
+        if rank(y) - rank(y.left) == 1:
+            top = self._rotate_right(node)
+            y.height += 1
+            node.height -= 1
+            if not node.left and not node.right:
+                node.height = 1
+            return top
+        z = y.right
+        node.left = self._rotate_left(y)
+        top = self._rotate_right(node)
+        z.height += 2
+        y.height -= 1
+        node.height -= 2
+        return top
+
+    def _validate_avl_tree(self, node: AVLNode) -> bool:
+        """Проверка рангового правила WAVL-дерева (разности рангов 1 или 2,
+        ранг листа 0)
+
+        Args:
+            node (AVLNode): узел для начала обхода
+
+        Returns:
+            bool: True, если корректно, иначе False
+        """
+        if not node:
+            return True
+        if not node.left and not node.right and node.height != 1:
+            return False
+        for child in (node.left, node.right):
+            if node.height - self._get_height(child) not in (1, 2):
+                return False
+        return self._validate_avl_tree(node.left) and self._validate_avl_tree(
+            node.right
+        )
+
+
+# Пример использования
+if __name__ == "__main__":
+    tree = WAVLTree()
+    for key in range(1, 16):
+        tree.insert(key)
+    for key in range(1, 16, 2):
+        tree.delete(key)
+    print("Inorder traversal:", tree.inorder_traversal())
+    print("Root rank:", tree.root.height - 1)
+    print("WAVL validation:", tree.validate_avl_tree())
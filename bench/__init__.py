@@ -0,0 +1,11 @@
+"""Бенчмарки структур данных модулей assoc.py и avl.py
+
+Каждый модуль пакета запускается отдельно из корня репозитория, например:
+
+    python -m bench.build
+
+Общий набор нагрузок с результатами в JSON и сравнением двух запусков:
+
+    python -m bench run --output results.json
+    python -m bench compare base.json results.json
+"""
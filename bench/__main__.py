@@ -0,0 +1,168 @@
+"""Набор бенчмарков DoubleHashingMap, MyDict и AVLTree с базовыми структурами
+dict, set и bisect и сравнение результатов двух запусков
+
+    python -m bench run --sizes 1000 10000 --output results.json
+    python -m bench compare base.json results.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+
+from bench.suite import (
+    BULK_STRUCTURES,
+    BULK_WORKLOADS,
+    DISTRIBUTIONS,
+    STRUCTURES,
+    WORKLOADS,
+    environment,
+    result_key,
+    run_bulk_workload,
+    run_key_workload,
+)
+
+
+def run(args) -> None:
+    """Запуск выбранных нагрузок, вывод таблицы и запись результатов в JSON
+
+    Args:
+        args: аргументы командной строки
+    """
+    records = []
+    print(
+        f"{'structure':>16} {'workload':>8} {'keys':>10} {'n':>8} {'param':>6}"
+        f" {'ops/s':>12} {'p50 us':>8} {'p99 us':>8} {'peak KiB':>9}"
+    )
+    for workload in args.workloads:
+        bulk = workload in BULK_WORKLOADS
+        for n in args.sizes:
+            for distribution in ["random"] if bulk else args.distributions:
+                params = args.merge_ratios if workload == "merge" else [None]
+                if workload == "lookup":
+                    params = args.hit_ratios
+                for param in params:
+                    for structure in args.structures:
+                        if bulk and structure not in BULK_STRUCTURES:
+                            continue
+                        if bulk:
+                            result = run_bulk_workload(
+                                structure, workload, n, param or 1, args.repeat, args.seed
+                            )
+                        else:
+                            result = run_key_workload(
+                                structure,
+                                workload,
+                                distribution,
+                                n,
+                                param or 0.0,
+                                args.repeat,
+                                args.seed,
+                            )
+                        record = {
+                            "structure": structure,
+                            "workload": workload,
+                            "distribution": distribution,
+                            "size": n,
+                            "param": param,
+                            **result,
+                        }
+                        records.append(record)
+                        print(
+                            f"{structure:>16} {workload:>8} {distribution:>10}"
+                            f" {n:>8} {'' if param is None else param:>6}"
+                            f" {result['ops_per_sec']:>12.0f}"
+                            f" {result['p50_us']:>8.2f} {result['p99_us']:>8.2f}"
+                            f" {result['peak_bytes'] / 1024:>9.0f}"
+                        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(), "results": records}, file, indent=1)
+        print("Results written to", args.output)
+
+
+def compare(args) -> int:
+    """Сравнение двух файлов результатов по операциям в секунду
+
+    Args:
+        args: аргументы командной строки
+
+    Returns:
+        int: код возврата (1, если найдены регрессии)
+    """
+    with open(args.base) as file:
+        base = {result_key(r): r for r in json.load(file)["results"]}
+    with open(args.new) as file:
+        new = json.load(file)["results"]
+    regressions = 0
+    print(
+        f"{'structure':>16} {'workload':>8} {'keys':>10} {'n':>8} {'param':>6}"
+        f" {'base ops/s':>12} {'new ops/s':>12} {'change':>8}"
+    )
+    for record in new:
+        old = base.get(result_key(record))
+        if old is None:
+            continue
+        change = record["ops_per_sec"] / old["ops_per_sec"] - 1
+        flag = ""
+        if change < -args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        param = record["param"]
+        print(
+            f"{record['structure']:>16} {record['workload']:>8}"
+            f" {record['distribution']:>10} {record['size']:>8}"
+            f" {'' if param is None else param:>6}"
+            f" {old['ops_per_sec']:>12.0f} {record['ops_per_sec']:>12.0f}"
+            f" {change:>+8.1%}{flag}"
+        )
+    print(f"Regressions (slower by more than {args.threshold:.0%}):", regressions)
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="запуск нагрузок")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**4])
+    run_parser.add_argument(
+        "--structures", nargs="+", choices=list(STRUCTURES), default=list(STRUCTURES)
+    )
+    run_parser.add_argument(
+        "--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS)
+    )
+    run_parser.add_argument(
+        "--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS)
+    )
+    run_parser.add_argument(
+        "--hit-ratios", type=float, nargs="+", default=[1.0, 0.5, 0.0]
+    )
+    run_parser.add_argument(
+        "--merge-ratios",
+        type=int,
+        nargs="+",
+        default=[1, 64],
+        help="во сколько раз второе дерево меньше первого",
+    )
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--output", help="файл для результатов в формате JSON")
+
+    compare_parser = commands.add_parser("compare", help="сравнение двух запусков")
+    compare_parser.add_argument("base", help="результаты до изменений")
+    compare_parser.add_argument("new", help="результаты после изменений")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="допустимое замедление"
+    )
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Сравнение пакетных insert_many/delete_many с поэлементными insert/delete"""
+
+import argparse
+import random
+
+from avl import AVLTree
+from bench.common import measure
+
+
+def insert_each(tree: AVLTree, keys) -> None:
+    """Поэлементная вставка ключей
+
+    Args:
+        tree (AVLTree): дерево
+        keys: ключи для вставки
+    """
+    for key in keys:
+        tree.insert(key)
+
+
+def delete_each(tree: AVLTree, keys) -> None:
+    """Поэлементное удаление ключей
+
+    Args:
+        tree (AVLTree): дерево
+        keys: ключи для удаления
+    """
+    for key in keys:
+        tree.delete(key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument(
+        "--batches", type=int, nargs="+", default=[10, 100, 1000, 10**4, 10**5]
+    )
+    args = parser.parse_args()
+
+    # Четные ключи в дереве, нечетные - во входящих пакетах
+    tree = AVLTree.from_sorted(range(0, 2 * args.size, 2))
+    print(
+        f"{'batch':>8} {'insert':>10} {'insert_many':>12}"
+        f" {'delete':>10} {'delete_many':>12}"
+    )
+    for m in args.batches:
+        batch = random.sample(range(1, 2 * args.size, 2), m)
+        t_insert = measure(insert_each, tree, batch)
+        t_delete = measure(delete_each, tree, batch)
+        t_insert_many = measure(tree.insert_many, batch)
+        t_delete_many = measure(tree.delete_many, batch)
+        print(
+            f"{m:>8} {t_insert:>10.4f} {t_insert_many:>12.4f}"
+            f" {t_delete:>10.4f} {t_delete_many:>12.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Сравнение массового построения AVLTree с последовательными вставками"""
+
+import argparse
+import random
+
+from avl import AVLTree
+from bench.common import measure
+
+
+def build_by_insert(keys) -> AVLTree:
+    """Построение дерева последовательными вставками
+
+    Args:
+        keys: ключи
+
+    Returns:
+        AVLTree: построенное дерево
+    """
+    tree = AVLTree()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10**4, 10**5, 10**6]
+    )
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'insert':>10} {'from_sorted':>12} {'from_iterable':>14}")
+    for n in args.sizes:
+        keys = random.sample(range(n * 10), n)
+        sorted_keys = sorted(keys)
+        t_insert = measure(build_by_insert, keys)
+        t_sorted = measure(AVLTree.from_sorted, sorted_keys)
+        t_iterable = measure(AVLTree.from_iterable, keys)
+        print(f"{n:>10} {t_insert:>10.3f} {t_sorted:>12.3f} {t_iterable:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
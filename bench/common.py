@@ -0,0 +1,17 @@
+"""Общие вспомогательные функции бенчмарков"""
+
+import time
+
+
+def measure(func, *args) -> float:
+    """Время выполнения функции в секундах
+
+    Args:
+        func: функция для замера
+
+    Returns:
+        float: время выполнения
+    """
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
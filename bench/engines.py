@@ -0,0 +1,59 @@
+"""Сравнение AVLTree и BPlusTree на вставке, поиске и полном обходе
+
+Для больших размеров: python -m bench.engines --sizes 10000 100000 1000000 10000000
+"""
+
+import argparse
+import random
+
+from avl import AVLTree
+from bench.common import measure
+from btree import BPlusTree
+
+
+def insert_all(tree, keys) -> None:
+    """Поэлементная вставка ключей
+
+    Args:
+        tree: дерево
+        keys: ключи для вставки
+    """
+    for key in keys:
+        tree.insert(key)
+
+
+def search_all(tree, keys) -> None:
+    """Поиск всех ключей
+
+    Args:
+        tree: дерево
+        keys: ключи для поиска
+    """
+    for key in keys:
+        tree.search(key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10**4, 10**5, 10**6]
+    )
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'engine':>8} {'insert':>10} {'lookup':>10} {'scan':>10}")
+    for n in args.sizes:
+        keys = random.sample(range(n * 10), n)
+        queries = random.sample(range(n * 10), n)
+        for name, engine in (("avl", AVLTree), ("bplus", BPlusTree)):
+            tree = engine()
+            t_insert = measure(insert_all, tree, keys)
+            t_lookup = measure(search_all, tree, queries)
+            t_scan = measure(tree.inorder_traversal)
+            print(
+                f"{n:>10} {name:>8} {t_insert:>10.3f}"
+                f" {t_lookup:>10.3f} {t_scan:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Сравнение FrozenAVLIndex.search_many с поиском AVLTree.search в цикле"""
+
+import argparse
+
+import numpy as np
+
+from avl import AVLTree
+from bench.common import measure
+
+
+def search_loop(tree: AVLTree, queries: list) -> None:
+    """Поиск каждого запроса по отдельности
+
+    Args:
+        tree (AVLTree): дерево
+        queries (list): запросы
+    """
+    for key in queries:
+        tree.search(key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument(
+        "--queries", type=int, nargs="+", default=[10**3, 10**5, 10**6]
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    keys = np.unique(rng.integers(0, args.size * 10, args.size))
+    tree = AVLTree.from_sorted(keys.tolist())
+    t_freeze = measure(tree.freeze)
+    index = tree.freeze()
+    print(f"freeze: {t_freeze:.3f}s for {len(index)} keys")
+    print(f"{'queries':>10} {'search loop':>12} {'search_many':>12} {'speedup':>8}")
+    for m in args.queries:
+        queries = rng.integers(0, args.size * 10, m)
+        t_loop = measure(search_loop, tree, queries.tolist())
+        t_many = measure(index.search_many, queries)
+        print(f"{m:>10} {t_loop:>12.4f} {t_many:>12.4f} {t_loop / t_many:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
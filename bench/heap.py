@@ -0,0 +1,132 @@
+"""Сравнение AVLTree как очереди с приоритетами с heapq на смешанной нагрузке
+(вставка, извлечение минимума, удаление произвольного ключа)"""
+
+import argparse
+import heapq
+import random
+
+from avl import AVLTree
+from bench.common import measure
+
+
+def make_ops(n: int, ops: int, delete_share: float, rng: random.Random) -> list:
+    """Генерация последовательности операций
+
+    Очередь моделируется во время генерации, поэтому удаляются только ключи,
+    которые в ней есть, а все вставляемые ключи различны
+
+    Args:
+        n (int): начальный размер очереди (ключи 0..n-1)
+        ops (int): количество операций
+        delete_share (float): доля удалений произвольного ключа
+        rng (random.Random): генератор случайных чисел
+
+    Returns:
+        list: пары (операция, ключ), ключ не используется для "pop"
+    """
+    live = set(range(n))
+    heap = list(range(n))
+    used = n
+    result = []
+    for _ in range(ops):
+        r = rng.random()
+        if r < delete_share and live:
+            key = rng.choice(heap)
+            while key not in live:
+                key = rng.choice(heap)
+            live.discard(key)
+            result.append(("delete", key))
+        elif r < (1 + delete_share) / 2:
+            used += 1
+            key = rng.randrange(used * 4) * (n + ops) + used  # различные ключи
+            live.add(key)
+            heapq.heappush(heap, key)
+            result.append(("push", key))
+        else:
+            while heap and heap[0] not in live:
+                heapq.heappop(heap)
+            if heap:
+                live.discard(heapq.heappop(heap))
+            result.append(("pop", None))
+    return result
+
+
+def run_tree(keys: list, ops: list) -> None:
+    """Выполнение операций над AVLTree
+
+    Args:
+        keys (list): начальные ключи
+        ops (list): операции
+    """
+    tree = AVLTree.from_iterable(keys)
+    for op, key in ops:
+        if op == "push":
+            tree.insert(key)
+        elif op == "delete":
+            tree.delete(key)
+        elif tree.root:
+            tree.pop_min()
+
+
+def run_heap(keys: list, ops: list) -> None:
+    """Выполнение операций над heapq (удаление - remove и heapify за O(n))
+
+    Args:
+        keys (list): начальные ключи
+        ops (list): операции
+    """
+    heap = list(keys)
+    heapq.heapify(heap)
+    for op, key in ops:
+        if op == "push":
+            heapq.heappush(heap, key)
+        elif op == "delete":
+            heap.remove(key)
+            heapq.heapify(heap)
+        elif heap:
+            heapq.heappop(heap)
+
+
+def run_lazy_heap(keys: list, ops: list) -> None:
+    """Выполнение операций над heapq с ленивым удалением (множество удаленных
+    ключей, пропуск при извлечении)
+
+    Args:
+        keys (list): начальные ключи
+        ops (list): операции
+    """
+    heap = list(keys)
+    heapq.heapify(heap)
+    deleted = set()
+    for op, key in ops:
+        if op == "push":
+            heapq.heappush(heap, key)
+        elif op == "delete":
+            deleted.add(key)
+        else:
+            while heap and heap[0] in deleted:
+                deleted.discard(heapq.heappop(heap))
+            if heap:
+                heapq.heappop(heap)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**4)
+    parser.add_argument("--ops", type=int, default=10**4)
+    parser.add_argument("--deletes", type=float, nargs="+", default=[0.0, 0.1, 0.3])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    keys = list(range(args.size))
+    print(f"{'deletes':>8} {'AVLTree':>10} {'heapq':>10} {'lazy heapq':>11}")
+    for share in args.deletes:
+        ops = make_ops(args.size, args.ops, share, rng)
+        t_tree = measure(run_tree, keys, ops)
+        t_heap = measure(run_heap, keys, ops)
+        t_lazy = measure(run_lazy_heap, keys, ops)
+        print(f"{share:>8.0%} {t_tree:>10.4f} {t_heap:>10.4f} {t_lazy:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Сравнение OrderedIndex с парой MyDict + AVLTree, которые синхронизируются
+вручную (вставка, точный поиск, удаление, диапазонные запросы, память)"""
+
+import argparse
+import random
+import tracemalloc
+
+from assoc import MyDict
+from avl import AVLTree
+from bench.common import measure
+from ordered_index import OrderedIndex
+
+
+class TwoStructures:
+    """Значения в MyDict, порядок ключей в AVLTree"""
+
+    def __init__(self):
+        self.values = MyDict()
+        self.keys = AVLTree()
+
+    def insert(self, key, value) -> None:
+        self.values[key] = value
+        self.keys.insert(key)
+
+    def get(self, key):
+        return self.values[key]
+
+    def delete(self, key) -> None:
+        del self.values[key]
+        self.keys.delete(key)
+
+    def irange(self, lo, hi):
+        values = self.values
+        for key in self.keys.irange(lo, hi):
+            yield key, values[key]
+
+
+def fill(index, keys: list) -> None:
+    for key in keys:
+        index.insert(key, key)
+
+
+def lookup(index, keys: list) -> None:
+    for key in keys:
+        index.get(key)
+
+
+def delete(index, keys: list) -> None:
+    for key in keys:
+        index.delete(key)
+
+
+def scan(index, ranges: list) -> None:
+    for lo, hi in ranges:
+        for _ in index.irange(lo, hi):
+            pass
+
+
+def footprint(engine, keys: list) -> int:
+    """Память, занятая заполненной структурой
+
+    Args:
+        engine: класс структуры
+        keys (list): ключи
+
+    Returns:
+        int: байты
+    """
+    tracemalloc.start()
+    index = engine()
+    fill(index, keys)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del index
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**5)
+    parser.add_argument("--ranges", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    keys = rng.sample(range(args.size * 10), args.size)
+    queries = [rng.randrange(args.size * 10) for _ in range(args.size)]
+    ranges = []
+    for _ in range(args.ranges):
+        lo = rng.randrange(args.size * 10)
+        ranges.append((lo, lo + 1000))
+    print(
+        f"{'engine':>14} {'insert':>8} {'get':>8} {'range':>8} {'delete':>8} {'MiB':>7}"
+    )
+    for name, engine in (("OrderedIndex", OrderedIndex), ("MyDict+AVL", TwoStructures)):
+        index = engine()
+        t_fill = measure(fill, index, keys)
+        t_get = measure(lookup, index, queries)
+        t_scan = measure(scan, index, ranges)
+        t_delete = measure(delete, index, queries)
+        memory = footprint(engine, keys) / 2**20
+        print(
+            f"{name:>14} {t_fill:>8.3f} {t_get:>8.3f} {t_scan:>8.3f} "
+            f"{t_delete:>8.3f} {memory:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Сравнение запросов IntervalTree.overlap с линейным просмотром отрезков"""
+
+import argparse
+import random
+
+from avl_interval import IntervalTree
+from bench.common import measure
+
+
+def scan(intervals: list, queries: list) -> None:
+    """Линейный просмотр всех отрезков на каждый запрос
+
+    Args:
+        intervals (list): пары (start, end)
+        queries (list): пары (lo, hi)
+    """
+    for lo, hi in queries:
+        [(start, end) for start, end in intervals if start <= hi and end >= lo]
+
+
+def tree_queries(tree: IntervalTree, queries: list) -> None:
+    """Запросы к дереву отрезков
+
+    Args:
+        tree (IntervalTree): дерево
+        queries (list): пары (lo, hi)
+    """
+    for lo, hi in queries:
+        tree.overlap(lo, hi)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**4, 10**5])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--span", type=int, default=100, help="средняя длина отрезка")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'n':>8} {'build':>8} {'scan':>10} {'overlap':>10} {'speedup':>8}")
+    for n in args.sizes:
+        universe = n * args.span
+        intervals = []
+        for _ in range(n):
+            start = rng.randrange(universe)
+            intervals.append((start, start + rng.randrange(2 * args.span)))
+        queries = []
+        for _ in range(args.queries):
+            lo = rng.randrange(universe)
+            queries.append((lo, lo + rng.randrange(args.span)))
+        t_build = measure(IntervalTree.from_iterable, intervals)
+        tree = IntervalTree.from_iterable(intervals)
+        t_scan = measure(scan, intervals, queries)
+        t_tree = measure(tree_queries, tree, queries)
+        print(
+            f"{n:>8} {t_build:>8.3f} {t_scan:>10.4f} {t_tree:>10.4f} "
+            f"{t_scan / t_tree:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
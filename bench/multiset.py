@@ -0,0 +1,72 @@
+"""Сравнение AVLMultiset с AVLTree и отдельной таблицей счетчиков (MyDict,
+для справки - встроенный dict) на потоке событий с большим количеством повторов"""
+
+import argparse
+import random
+
+from assoc import MyDict
+from avl import AVLTree
+from avl_multiset import AVLMultiset
+from bench.common import measure
+
+
+def tree_with_my_dict(events: list) -> None:
+    """AVLTree для порядка ключей и MyDict для кратностей
+
+    Args:
+        events (list): ключи событий
+    """
+    tree, counts = AVLTree(), MyDict()
+    for key in events:
+        tree.insert(key)
+        counts[key] = (counts[key] or 0) + 1
+
+
+def tree_with_dict(events: list) -> None:
+    """AVLTree для порядка ключей и встроенный dict для кратностей
+
+    Args:
+        events (list): ключи событий
+    """
+    tree, counts = AVLTree(), {}
+    for key in events:
+        tree.insert(key)
+        counts[key] = counts.get(key, 0) + 1
+
+
+def multiset(events: list) -> None:
+    """AVLMultiset, по одному событию
+
+    Args:
+        events (list): ключи событий
+    """
+    tree = AVLMultiset()
+    for key in events:
+        tree.insert(key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=10**6)
+    parser.add_argument("--keys", type=int, nargs="+", default=[10**2, 10**3, 10**4])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(
+        f"{'keys':>8} {'AVLTree+MyDict':>15} {'AVLTree+dict':>13}"
+        f" {'AVLMultiset':>12} {'insert_many':>12}"
+    )
+    for k in args.keys:
+        events = [rng.randrange(k) for _ in range(args.events)]
+        t_pair = measure(tree_with_my_dict, events)
+        t_dict = measure(tree_with_dict, events)
+        t_multi = measure(multiset, events)
+        t_batch = measure(AVLMultiset().insert_many, events)
+        print(
+            f"{k:>8} {t_pair:>15.3f} {t_dict:>13.3f}"
+            f" {t_multi:>12.3f} {t_batch:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Чтения страниц на операцию и пропускная способность PagedAVLTree
+в зависимости от размера пула буферов"""
+
+import argparse
+import os
+import random
+import tempfile
+
+from avl_paged import RECORDS_PER_PAGE, PagedAVLTree
+from bench.common import measure
+
+
+def workload(tree: PagedAVLTree, keys: list) -> None:
+    """Чередование поиска и вставки
+
+    Args:
+        tree (PagedAVLTree): дерево
+        keys (list): ключи запросов
+    """
+    for i, key in enumerate(keys):
+        if i % 4:
+            tree.search(key)
+        else:
+            tree.insert(key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2 * 10**5)
+    parser.add_argument("--ops", type=int, default=2 * 10**4)
+    parser.add_argument(
+        "--fractions", type=float, nargs="+", default=[0.01, 0.05, 0.1, 0.25, 1.0]
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.avlp")
+        with PagedAVLTree(path) as tree:
+            t_build = measure(tree.insert_many, range(0, args.size * 2, 2))
+        data_pages = -(-args.size // RECORDS_PER_PAGE)
+        print(f"build: {t_build:.3f}s, {data_pages} data pages")
+        print(f"{'pool':>8} {'pages':>7} {'reads/op':>9} {'ops/s':>10}")
+        for fraction in args.fractions:
+            pages = max(1, int(data_pages * fraction))
+            keys = [rng.randrange(args.size * 2) for _ in range(args.ops)]
+            copy_path = os.path.join(directory, "copy.avlp")
+            with open(path, "rb") as src, open(copy_path, "wb") as dst:
+                dst.write(src.read())
+            with PagedAVLTree(copy_path, pool_pages=pages) as tree:
+                elapsed = measure(workload, tree, keys)
+                reads = tree.io_stats()["reads"]
+            print(
+                f"{fraction:>8.0%} {pages:>7} {reads / args.ops:>9.2f} "
+                f"{args.ops / elapsed:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
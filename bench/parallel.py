@@ -0,0 +1,49 @@
+"""Время параллельного построения AVLTree из файла в зависимости от числа процессов"""
+
+import argparse
+import os
+import random
+import tempfile
+
+from avl import AVLTree
+from avl_parallel import build_parallel
+from bench.common import measure
+
+
+def build_single(path: str) -> AVLTree:
+    """Однопроцессное построение: чтение файла, сортировка и from_sorted
+
+    Args:
+        path (str): путь к файлу с ключами
+
+    Returns:
+        AVLTree: построенное дерево
+    """
+    with open(path, "rb") as file:
+        return AVLTree.from_iterable(map(int, file.read().split()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--chunk-bytes", type=int, default=4 * 1024 * 1024)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()]
+    )
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        for _ in range(args.size):
+            file.write(f"{random.randrange(args.size * 10)}\n")
+    try:
+        print(f"single process: {measure(build_single, file.name):.3f}s")
+        print(f"{'workers':>8} {'time, s':>10}")
+        for workers in sorted(set(args.workers)):
+            elapsed = measure(build_parallel, file.name, workers, args.chunk_bytes)
+            print(f"{workers:>8} {elapsed:>10.3f}")
+    finally:
+        os.remove(file.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Память на версию и пропускная способность чтения снимков PersistentAVLTree"""
+
+import argparse
+import random
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from avl import AVLTree
+from avl_persistent import PersistentAVLTree
+
+
+def memory_per_version(size: int, versions: int) -> tuple:
+    """Средний прирост памяти на одну версию при снимке после каждой вставки
+
+    Args:
+        size (int): размер исходного дерева
+        versions (int): количество версий
+
+    Returns:
+        tuple: (байт на версию у снимков, байт на версию у полных копий)
+    """
+    keys = random.sample(range(size * 10), size + versions)
+    tree = PersistentAVLTree.from_sorted(sorted(keys[:size]))
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    snapshots = []
+    for key in keys[size:]:
+        tree.insert(key)
+        snapshots.append(tree.snapshot())
+    persistent = (tracemalloc.get_traced_memory()[0] - base) / versions
+
+    # Для сравнения - полная копия дерева на каждую версию
+    copies_count = min(versions, 20)
+    base = tracemalloc.get_traced_memory()[0]
+    copies = [AVLTree.from_sorted(tree.inorder_traversal()) for _ in range(copies_count)]
+    copied = (tracemalloc.get_traced_memory()[0] - base) / copies_count
+    tracemalloc.stop()
+    del snapshots, copies
+    return persistent, copied
+
+
+def read_throughput(tree: PersistentAVLTree, threads: int, reads: int) -> float:
+    """Пропускная способность поиска по снимкам из нескольких потоков,
+    пока отдельный поток-писатель продолжает вставки
+
+    Args:
+        tree (PersistentAVLTree): дерево
+        threads (int): количество потоков-читателей
+        reads (int): количество поисков на поток
+
+    Returns:
+        float: поисков в секунду
+    """
+    stop = threading.Event()
+
+    def writer() -> None:
+        while not stop.is_set():
+            tree.insert(random.randrange(10**9))
+
+    def reader() -> None:
+        snap = tree.snapshot()
+        for _ in range(reads):
+            snap.search(random.randrange(10**9))
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        for _ in range(threads):
+            pool.submit(reader)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    writer_thread.join()
+    return threads * reads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**5)
+    parser.add_argument("--versions", type=int, default=1000)
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    persistent, copied = memory_per_version(args.size, args.versions)
+    print(f"bytes per version: snapshot {persistent:.0f}, full copy {copied:.0f}")
+
+    tree = PersistentAVLTree.from_iterable(random.sample(range(10**9), args.size))
+    print(f"{'threads':>8} {'reads/s':>12}")
+    for threads in args.threads:
+        print(f"{threads:>8} {read_throughput(tree, threads, args.reads):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Воспроизведение записанной трассы операций (optrace.py) на разных структурах
+
+    python -m bench.replay trace.bin --engines AVLTree WAVLTree BPlusTree
+    python -m bench.replay --generate 100000 --capacities 8 1024 65536
+
+Без файла трассы (--generate) записывается синтетическая смешанная нагрузка
+и заодно замеряются накладные расходы записи
+"""
+
+import argparse
+import os
+import random
+import tempfile
+
+from assoc import DoubleHashingMap, MyDict
+from avl import AVLTree
+from avl_map import AVLMap
+from avl_wavl import WAVLTree
+from bench.common import measure
+from btree import BPlusTree
+from optrace import load_trace, recording, replay
+from ordered_index import OrderedIndex
+
+ENGINES = {
+    "AVLTree": AVLTree,
+    "WAVLTree": WAVLTree,
+    "BPlusTree": BPlusTree,
+    "AVLMap": AVLMap,
+    "OrderedIndex": OrderedIndex,
+    "MyDict": MyDict,
+    "DoubleHashingMap": DoubleHashingMap,
+    "dict": dict,
+}
+
+
+def mixed_workload(tree, n: int, seed: int) -> None:
+    """Смешанная нагрузка: 60% поисков, 20% вставок, 20% удалений
+
+    Args:
+        tree: дерево
+        n (int): количество операций
+        seed (int): зерно генератора
+    """
+    rng = random.Random(seed)
+    for _ in range(n):
+        key = rng.randrange(n)
+        action = rng.random()
+        if action < 0.6:
+            tree.search(key)
+        elif action < 0.8:
+            tree.insert(key)
+        else:
+            tree.delete(key)
+
+
+def generate(path: str, n: int, seed: int) -> None:
+    """Запись синтетической трассы и вывод накладных расходов записи
+
+    Args:
+        path (str): путь к файлу трассы
+        n (int): количество операций
+        seed (int): зерно генератора
+    """
+    plain = measure(mixed_workload, AVLTree(), n, seed)
+    tree = AVLTree()
+    with recording(tree, path):
+        recorded = measure(mixed_workload, tree, n, seed)
+    print(
+        f"Recording overhead: {plain:.3f}s -> {recorded:.3f}s"
+        f" ({recorded / plain - 1:+.1%}), trace size {os.path.getsize(path)} bytes"
+    )
+
+
+def engines(args) -> list:
+    """Конфигурации структур для воспроизведения
+
+    Args:
+        args: аргументы командной строки
+
+    Returns:
+        list: пары (название, функция создания пустой структуры)
+    """
+    configs = []
+    for name in args.engines:
+        engine = ENGINES[name]
+        if engine is DoubleHashingMap and args.capacities:
+            for capacity in args.capacities:
+                configs.append(
+                    (f"{name}({capacity})", lambda c=capacity: DoubleHashingMap(c))
+                )
+        elif engine is BPlusTree and args.leaf_capacities:
+            for capacity in args.leaf_capacities:
+                configs.append(
+                    (f"{name}({capacity})", lambda c=capacity: BPlusTree(c))
+                )
+        else:
+            configs.append((name, engine))
+    return configs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("trace", nargs="?", help="файл трассы")
+    parser.add_argument(
+        "--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES)
+    )
+    parser.add_argument(
+        "--capacities",
+        type=int,
+        nargs="+",
+        help="начальные размеры DoubleHashingMap (степени двойки)",
+    )
+    parser.add_argument(
+        "--leaf-capacities", type=int, nargs="+", help="размеры листьев BPlusTree"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--generate", type=int, help="записать синтетическую трассу из N операций"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    path = args.trace
+    if args.generate:
+        path = path or os.path.join(tempfile.gettempdir(), "bench_replay.bin")
+        generate(path, args.generate, args.seed)
+    elif not path:
+        parser.error("a trace file or --generate is required")
+    ops, keys = load_trace(path)
+
+    print(
+        f"{'engine':>22} {'ops':>10} {'ops/s':>12}"
+        f" {'p50 us':>8} {'p99 us':>8} {'max us':>8}"
+    )
+    for name, factory in engines(args):
+        try:
+            best = max(
+                replay(factory(), ops, keys)["ops_per_sec"] for _ in range(args.repeat)
+            )
+        except ValueError as error:
+            print(f"{name:>22} skipped: {error}")
+            continue
+        stats = replay(factory(), ops, keys, timed=True)
+        print(
+            f"{name:>22} {stats['ops']:>10} {best:>12.0f} {stats['p50_us']:>8.2f}"
+            f" {stats['p99_us']:>8.2f} {stats['max_us']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
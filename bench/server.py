@@ -0,0 +1,174 @@
+"""Нагрузка на KVServer (kv_server.py) по нескольким соединениям: пропускная
+способность и задержки при разном числе соединений и запросов в полете
+
+Сервер запускается в отдельном процессе, клиенты - корутины в этом процессе:
+
+    python -m bench.server --connections 1 4 16 64 --depths 1 16 --requests 20000
+
+Глубина 1 - один запрос на обмен, при большей глубине запросы соединения идут
+конвейером и сервер объединяет их записи в пакетные операции
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from kv_server import KVClient, run_server
+
+
+async def connection_load(
+    client: KVClient, depth: int, count: int, keys: int, read_ratio: float, seed: int
+) -> list:
+    """Нагрузка одного соединения: depth корутин по count // depth запросов
+
+    Args:
+        client (KVClient): клиент
+        depth (int): запросов в полете
+        count (int): запросов всего
+        keys (int): размер пространства ключей
+        read_ratio (float): доля get среди запросов (остальные - set)
+        seed (int): зерно генератора
+
+    Returns:
+        list: задержки запросов в секундах
+    """
+    latencies = []
+
+    async def worker(worker_seed: int) -> None:
+        rng = random.Random(worker_seed)
+        clock = time.perf_counter
+        for _ in range(count // depth):
+            key = rng.randrange(keys)
+            start = clock()
+            if rng.random() < read_ratio:
+                await client.get(key)
+            else:
+                await client.set(key, key)
+            latencies.append(clock() - start)
+
+    await asyncio.gather(*(worker(seed * 1000 + i) for i in range(depth)))
+    return latencies
+
+
+async def run_load(args, path: str, connections: int, depth: int) -> dict:
+    """Одна конфигурация нагрузки
+
+    Args:
+        args: аргументы командной строки
+        path (str): путь к Unix-сокету сервера
+        connections (int): количество соединений
+        depth (int): запросов в полете на соединение
+
+    Returns:
+        dict: запросы, запросов в секунду, p50 и p99 задержки в микросекундах
+    """
+    clients = [await KVClient.connect_unix(path) for _ in range(connections)]
+    per_connection = args.requests // connections
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            connection_load(
+                client, depth, per_connection, args.keys, args.read_ratio, i
+            )
+            for i, client in enumerate(clients)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        await client.close()
+    latencies = sorted(latency for result in results for latency in result)
+    last = len(latencies) - 1
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_us": latencies[last // 2] * 1e6,
+        "p99_us": latencies[round(last * 0.99)] * 1e6,
+    }
+
+
+async def prefill(path: str, keys: int) -> None:
+    """Заполнение сервера ключами 0..keys-1 пачками по 1000
+
+    Args:
+        path (str): путь к Unix-сокету сервера
+        keys (int): количество ключей
+    """
+    client = await KVClient.connect_unix(path)
+    for lo in range(0, keys, 1000):
+        await client.pipeline(
+            [("set", (key, key)) for key in range(lo, min(lo + 1000, keys))]
+        )
+    await client.close()
+
+
+async def wait_for_socket(path: str, timeout: float = 10.0) -> None:
+    """Ожидание запуска сервера
+
+    Args:
+        path (str): путь к Unix-сокету
+        timeout (float): наибольшее время ожидания в секундах
+
+    Raises:
+        TimeoutError: сервер не запустился
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if os.path.exists(path):
+            try:
+                client = await KVClient.connect_unix(path)
+            except ConnectionError:
+                pass
+            else:
+                await client.close()
+                return
+        await asyncio.sleep(0.05)
+    raise TimeoutError("Server did not start")
+
+
+async def main_async(args, path: str) -> None:
+    await wait_for_socket(path)
+    await prefill(path, args.keys)
+    print(
+        f"{'conns':>6} {'depth':>6} {'requests':>9}"
+        f" {'req/s':>10} {'p50 us':>9} {'p99 us':>9}"
+    )
+    for connections in args.connections:
+        for depth in args.depths:
+            stats = await run_load(args, path, connections, depth)
+            print(
+                f"{connections:>6} {depth:>6} {stats['requests']:>9}"
+                f" {stats['rps']:>10.0f} {stats['p50_us']:>9.0f}"
+                f" {stats['p99_us']:>9.0f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 16])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--keys", type=int, default=10**5)
+    parser.add_argument("--read-ratio", type=float, default=0.8)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "kv.sock")
+    server = multiprocessing.Process(target=run_server, kwargs={"path": path})
+    server.start()
+    try:
+        asyncio.run(main_async(args, path))
+    finally:
+        server.terminate()
+        server.join()
+        if os.path.exists(path):
+            os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
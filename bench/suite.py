@@ -0,0 +1,410 @@
+"""Параметризованные нагрузки для DoubleHashingMap, MyDict и AVLTree
+и базовых структур dict, set и отсортированного списка с bisect"""
+
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from bisect import bisect_left
+from itertools import accumulate
+
+from assoc import DoubleHashingMap, MyDict
+from avl import AVLTree
+
+DISTRIBUTIONS = ("sequential", "random", "zipf")
+WORKLOADS = ("insert", "lookup", "churn", "merge", "split")
+# Нагрузки над целыми структурами, а не отдельными ключами
+BULK_WORKLOADS = ("merge", "split")
+ZIPF_EXPONENT = 1.1
+
+
+# Каждая структура описывается функцией, которая создает пустой экземпляр и
+# возвращает его операции (insert, lookup, delete) над одним ключом
+
+
+def _dict_ops():
+    table = {}
+    return table, (
+        lambda key: table.__setitem__(key, key),
+        table.get,
+        lambda key: table.pop(key, None),
+    )
+
+
+def _set_ops():
+    items = set()
+    return items, (items.add, items.__contains__, items.discard)
+
+
+def _bisect_ops():
+    items = []
+
+    def insert(key):
+        i = bisect_left(items, key)
+        if i == len(items) or items[i] != key:
+            items.insert(i, key)
+
+    def lookup(key):
+        i = bisect_left(items, key)
+        return i < len(items) and items[i] == key
+
+    def delete(key):
+        i = bisect_left(items, key)
+        if i < len(items) and items[i] == key:
+            del items[i]
+
+    return items, (insert, lookup, delete)
+
+
+def _hash_map_ops():
+    table = DoubleHashingMap()
+    return table, (lambda key: table.insert(key, key), table.search, table.delete)
+
+
+def _my_dict_ops():
+    table = MyDict()
+    return table, (
+        lambda key: table.__setitem__(key, key),
+        table.__getitem__,
+        table.__delitem__,
+    )
+
+
+def _avl_ops():
+    tree = AVLTree()
+    return tree, (tree.insert, tree.search, tree.delete)
+
+
+STRUCTURES = {
+    "dict": _dict_ops,
+    "set": _set_ops,
+    "bisect": _bisect_ops,
+    "DoubleHashingMap": _hash_map_ops,
+    "MyDict": _my_dict_ops,
+    "AVLTree": _avl_ops,
+}
+# Структуры, поддерживающие слияние и разделение (и их базовые аналоги)
+BULK_STRUCTURES = ("AVLTree", "set", "bisect")
+
+
+def make_keys(distribution: str, n: int, rng: random.Random) -> list:
+    """Ключи для заполнения структуры
+
+    Args:
+        distribution (str): sequential - 0..n-1 по порядку, random - различные
+            ключи в случайном порядке, zipf - n выборок с повторами по закону Ципфа
+        n (int): количество ключей
+        rng (random.Random): генератор случайных чисел
+
+    Returns:
+        list: ключи
+    """
+    if distribution == "sequential":
+        return list(range(n))
+    if distribution == "random":
+        return rng.sample(range(n * 10), n)
+    return zipf_sample(rng.sample(range(n * 10), n), n, rng)
+
+
+def zipf_sample(population: list, k: int, rng: random.Random) -> list:
+    """Выборка с повторами, в которой i-й элемент встречается с частотой 1/i^s
+
+    Args:
+        population (list): элементы по убыванию популярности
+        k (int): размер выборки
+        rng (random.Random): генератор случайных чисел
+
+    Returns:
+        list: выборка
+    """
+    weights = accumulate(
+        1 / rank**ZIPF_EXPONENT for rank in range(1, len(population) + 1)
+    )
+    return rng.choices(population, cum_weights=list(weights), k=k)
+
+
+def make_ops(workload: str, distribution: str, n: int, hit_ratio: float, seed: int):
+    """Начальное заполнение и последовательность операций нагрузки
+
+    Args:
+        workload (str): insert, lookup или churn
+        distribution (str): распределение ключей
+        n (int): размер
+        hit_ratio (float): доля поисков существующих ключей (для lookup)
+        seed (int): зерно генератора
+
+    Returns:
+        tuple: (ключи заполнения, список пар (номер операции, ключ)), где
+            0 - вставка, 1 - поиск, 2 - удаление
+    """
+    rng = random.Random(seed)
+    keys = make_keys(distribution, n, rng)
+    if workload == "insert":
+        return [], [(0, key) for key in keys]
+    present = list(dict.fromkeys(keys))
+    if workload == "lookup":
+        if distribution == "sequential":
+            hits = present
+        elif distribution == "zipf":
+            hits = zipf_sample(present, n, rng)
+        else:
+            hits = [rng.choice(present) for _ in range(n)]
+        # Отрицательных ключей в структуре нет
+        return keys, [
+            (1, hits[i] if rng.random() < hit_ratio else -1 - i) for i in range(n)
+        ]
+    # churn: удаление самого старого ключа и вставка нового, размер не меняется
+    queue = present + [key + n * 10 for key in make_keys(distribution, n, rng)]
+    ops = []
+    for i in range(n // 2):
+        ops.append((2, queue[i]))
+        ops.append((0, queue[len(present) + i]))
+    return keys, ops
+
+
+def _prepared(structure: str, keys: list) -> tuple:
+    """Заполненный экземпляр структуры и ее операции
+
+    Args:
+        structure (str): имя структуры
+        keys (list): ключи заполнения
+
+    Returns:
+        tuple: (экземпляр, (insert, lookup, delete))
+    """
+    instance, ops = STRUCTURES[structure]()
+    insert = ops[0]
+    for key in keys:
+        insert(key)
+    return instance, ops
+
+
+def _run(ops: tuple, trace: list) -> None:
+    """Выполнение операций
+
+    Args:
+        ops (tuple): функции (insert, lookup, delete)
+        trace (list): пары (номер операции, ключ)
+    """
+    for op, key in trace:
+        ops[op](key)
+
+
+def _run_timed(ops: tuple, trace: list) -> list:
+    """Выполнение операций с замером каждой
+
+    Args:
+        ops (tuple): функции (insert, lookup, delete)
+        trace (list): пары (номер операции, ключ)
+
+    Returns:
+        list: задержки в наносекундах
+    """
+    clock = time.perf_counter_ns
+    latencies = []
+    append = latencies.append
+    for op, key in trace:
+        start = clock()
+        ops[op](key)
+        append(clock() - start)
+    return latencies
+
+
+def percentiles(samples: list) -> dict:
+    """Перцентили задержек в микросекундах
+
+    Args:
+        samples (list): задержки в наносекундах
+
+    Returns:
+        dict: p50, p90, p99
+    """
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {
+        f"p{q}_us": ordered[round(last * q / 100)] / 1000 for q in (50, 90, 99)
+    }
+
+
+def run_key_workload(
+    structure: str,
+    workload: str,
+    distribution: str,
+    n: int,
+    hit_ratio: float,
+    repeat: int,
+    seed: int,
+) -> dict:
+    """Запуск нагрузки над отдельными ключами
+
+    Пропускная способность - лучший из repeat прогонов без замеров отдельных
+    операций, задержки - отдельный прогон с замером каждой операции, пиковая
+    память - прогон под tracemalloc
+
+    Args:
+        structure (str): имя структуры
+        workload (str): insert, lookup или churn
+        distribution (str): распределение ключей
+        n (int): размер
+        hit_ratio (float): доля поисков существующих ключей
+        repeat (int): количество прогонов для пропускной способности
+        seed (int): зерно генератора
+
+    Returns:
+        dict: количество операций, операций в секунду, перцентили задержек
+            и пиковая память в байтах
+    """
+    keys, trace = make_ops(workload, distribution, n, hit_ratio, seed)
+    best = float("inf")
+    for _ in range(repeat):
+        _, ops = _prepared(structure, keys)
+        start = time.perf_counter()
+        _run(ops, trace)
+        best = min(best, time.perf_counter() - start)
+    _, ops = _prepared(structure, keys)
+    result = {"ops": len(trace), "ops_per_sec": len(trace) / best}
+    result.update(percentiles(_run_timed(ops, trace)))
+    tracemalloc.start()
+    instance, ops = _prepared(structure, keys)
+    tracemalloc.reset_peak()
+    _run(ops, trace)
+    result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del instance
+    return result
+
+
+def _bulk_pair(structure: str, left: list, right: list) -> tuple:
+    """Два экземпляра структуры для слияния
+
+    Args:
+        structure (str): AVLTree, set или bisect
+        left (list): отсортированные ключи первого экземпляра
+        right (list): отсортированные ключи второго экземпляра
+
+    Returns:
+        tuple: (первый, второй)
+    """
+    if structure == "AVLTree":
+        return AVLTree.from_sorted(left), AVLTree.from_sorted(right)
+    if structure == "set":
+        return set(left), set(right)
+    return list(left), list(right)
+
+
+def _bulk_op(structure: str, workload: str, first, second, pivot):
+    """Одна операция слияния или разделения
+
+    Args:
+        structure (str): AVLTree, set или bisect
+        workload (str): merge или split
+        first: первый экземпляр (разделяется по pivot)
+        second: второй экземпляр
+        pivot: ключ разделения
+
+    Returns:
+        function: операция без аргументов
+    """
+    if workload == "merge":
+        if structure == "AVLTree":
+            return lambda: first.merge_trees(second)
+        if structure == "set":
+            return lambda: first | second
+        return lambda: sorted(first + second)  # timsort сливает две серии за O(n)
+    if structure == "AVLTree":
+        return lambda: first.split_tree(pivot)
+    if structure == "set":
+        return lambda: (
+            {key for key in first if key < pivot},
+            {key for key in first if key > pivot},
+        )
+    return lambda: (
+        first[: bisect_left(first, pivot)],
+        first[bisect_left(first, pivot) + 1 :],
+    )
+
+
+def run_bulk_workload(
+    structure: str, workload: str, n: int, ratio: int, repeat: int, seed: int
+) -> dict:
+    """Запуск слияния двух структур (размеры n и n // ratio) или разделения
+    структуры размера n по медиане
+
+    Args:
+        structure (str): AVLTree, set или bisect
+        workload (str): merge или split
+        n (int): размер
+        ratio (int): во сколько раз вторая структура меньше первой
+        repeat (int): количество замеряемых операций
+        seed (int): зерно генератора
+
+    Returns:
+        dict: количество операций, операций в секунду, перцентили задержек
+            и пиковая память в байтах
+    """
+    rng = random.Random(seed)
+    universe = rng.sample(range(n * 10), n + n // ratio)
+    left, right = sorted(universe[:n]), sorted(universe[n:])
+    pivot = left[len(left) // 2]
+
+    def prepared():
+        first, second = _bulk_pair(structure, left, right)
+        return _bulk_op(structure, workload, first, second, pivot)
+
+    samples = []
+    for _ in range(repeat):
+        op = prepared()
+        start = time.perf_counter_ns()
+        op()
+        samples.append(time.perf_counter_ns() - start)
+    op = prepared()
+    tracemalloc.start()
+    op()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result = {"ops": 1, "ops_per_sec": 1e9 / min(samples)}
+    result.update(percentiles(samples))
+    result["peak_bytes"] = peak
+    return result
+
+
+def environment() -> dict:
+    """Сведения об окружении для сопоставления результатов
+
+    Returns:
+        dict: версия Python, платформа и текущий коммит (если есть git)
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def result_key(record: dict) -> tuple:
+    """Ключ сопоставления результатов разных запусков
+
+    Args:
+        record (dict): результат
+
+    Returns:
+        tuple: параметры нагрузки
+    """
+    return (
+        record["structure"],
+        record["workload"],
+        record["distribution"],
+        record["size"],
+        record["param"],
+    )
@@ -0,0 +1,89 @@
+"""Масштабирование чтений ConcurrentAVLTree по числу потоков
+
+Смесь операций - 20 чтений на одну запись. Для сравнения та же нагрузка
+выполняется с одним общим мьютексом. Рост пропускной способности с числом
+потоков возможен только на free-threaded CPython (сборка без GIL)
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from avl import AVLTree
+from avl_concurrent import ConcurrentAVLTree
+
+
+class MutexAVLTree:
+    """Дерево за одним мьютексом (текущий вариант в сервисах)"""
+
+    def __init__(self, tree: AVLTree):
+        self.tree = tree
+        self.lock = threading.Lock()
+
+    def search(self, key: int):
+        with self.lock:
+            return self.tree.search(key)
+
+    def insert(self, key: int) -> None:
+        with self.lock:
+            self.tree.insert(key)
+
+
+def run(tree, threads: int, ops: int, read_ratio: int, key_range: int) -> float:
+    """Пропускная способность смешанной нагрузки
+
+    Args:
+        tree: дерево с методами search и insert
+        threads (int): количество потоков
+        ops (int): количество операций на поток
+        read_ratio (int): количество чтений на одну запись
+        key_range (int): диапазон ключей
+
+    Returns:
+        float: операций в секунду
+    """
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        for i in range(ops):
+            key = rng.randrange(key_range)
+            if i % (read_ratio + 1) == read_ratio:
+                tree.insert(key)
+            else:
+                tree.search(key)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(worker, range(threads)))
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**5)
+    parser.add_argument("--ops", type=int, default=50000)
+    parser.add_argument("--read-ratio", type=int, default=20)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+    print(f"{'threads':>8} {'rwlock ops/s':>14} {'mutex ops/s':>14}")
+    for threads in args.threads:
+        keys = range(0, 2 * args.size, 2)
+        rw = run(
+            ConcurrentAVLTree(AVLTree.from_sorted(keys)),
+            threads, args.ops, args.read_ratio, 2 * args.size,
+        )
+        mutex = run(
+            MutexAVLTree(AVLTree.from_sorted(keys)),
+            threads, args.ops, args.read_ratio, 2 * args.size,
+        )
+        print(f"{threads:>8} {rw:>14.0f} {mutex:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
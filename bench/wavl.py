@@ -0,0 +1,70 @@
+"""Сравнение AVLTree и WAVLTree по количеству поворотов и скорости
+на смешанных последовательностях вставок и удалений"""
+
+import argparse
+import random
+
+from avl import AVLTree
+from avl_stats import instrumented
+from avl_wavl import WAVLTree
+from bench.common import measure
+
+
+def make_trace(size: int, ops: int, delete_share: float, rng: random.Random) -> list:
+    """Последовательность операций над деревом из size ключей
+
+    Args:
+        size (int): начальное количество ключей
+        ops (int): количество операций
+        delete_share (float): доля удалений
+        rng (random.Random): генератор случайных чисел
+
+    Returns:
+        list: пары (True - вставка / False - удаление, ключ)
+    """
+    universe = size * 4
+    return [(rng.random() >= delete_share, rng.randrange(universe)) for _ in range(ops)]
+
+
+def replay(tree, trace: list) -> None:
+    """Выполнение последовательности операций
+
+    Args:
+        tree: дерево
+        trace (list): операции
+    """
+    insert, delete = tree.insert, tree.delete
+    for is_insert, key in trace:
+        if is_insert:
+            insert(key)
+        else:
+            delete(key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**5)
+    parser.add_argument("--ops", type=int, default=2 * 10**5)
+    parser.add_argument("--deletes", type=float, nargs="+", default=[0.0, 0.5, 0.7])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    initial = rng.sample(range(args.size * 4), args.size)
+    print(f"{'deletes':>8} {'engine':>7} {'rotations':>10} {'per op':>7} {'ops/s':>10}")
+    for share in args.deletes:
+        trace = make_trace(args.size, args.ops, share, rng)
+        for name, engine in (("avl", AVLTree), ("wavl", WAVLTree)):
+            tree = engine.from_iterable(initial)
+            with instrumented(tree) as stats:
+                replay(tree, trace)
+            rotations = sum(stats.rotations.values())
+            tree = engine.from_iterable(initial)
+            elapsed = measure(replay, tree, trace)
+            print(
+                f"{share:>8.0%} {name:>7} {rotations:>10} "
+                f"{rotations / args.ops:>7.3f} {args.ops / elapsed:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
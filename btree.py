@@ -0,0 +1,427 @@
+from bisect import bisect_left, bisect_right
+from heapq import merge
+
+# Максимальное количество ключей в листе и потомков во внутреннем узле
+LEAF_CAPACITY = 128
+BRANCH_CAPACITY = 64
+
+
+class BPlusLeaf:
+    __slots__ = ("keys", "next")
+
+    def __init__(self, keys: list):
+        self.keys = keys  # Отсортированные ключи листа
+        self.next = None  # Следующий лист (для последовательного обхода)
+
+
+class BPlusInternal:
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys: list, children: list):
+        # keys[i] - разделитель: ключи children[i] меньше него,
+        # ключи children[i + 1] не меньше
+        self.keys = keys
+        self.children = children
+
+
+class BPlusTree:
+    """Упорядоченное множество на B+-дереве с широкими узлами
+
+    Ключи лежат в отсортированных списках листьев, листья связаны в список.
+    Поиск внутри узла - bisect, поэтому на каждый уровень приходится один
+    переход по указателю вместо log2(fanout) у АВЛ-дерева, а полный обход
+    идет по спискам листьев. Интерфейс совпадает с AVLTree со следующими
+    отличиями: отдельных узлов для ключей нет, поэтому search возвращает сам
+    ключ, а не узел (результат нужно сравнивать с None - ключ может быть
+    ложным, например 0), а split_tree и merge_trees перестраивают дерево
+    целиком за O(n) вместо O(log n) и O(Mlog(N/M+1)) у AVLTree
+    """
+
+    def __init__(
+        self, leaf_capacity: int = LEAF_CAPACITY, branch_capacity: int = BRANCH_CAPACITY
+    ):
+        if leaf_capacity < 4 or branch_capacity < 4:
+            raise ValueError("Node capacity must be at least 4")
+        self.leaf_capacity = leaf_capacity
+        self.branch_capacity = branch_capacity
+        self.root = BPlusLeaf([])  # корень дерева
+        self.size = 0  # количество ключей
+
+    def _find_leaf(self, key) -> BPlusLeaf:
+        """Спуск к листу, который может содержать ключ
+
+        Args:
+            key: ключ
+
+        Returns:
+            BPlusLeaf: лист
+        """
+        node = self.root
+        while type(node) is BPlusInternal:
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def _first_leaf(self) -> BPlusLeaf:
+        """Самый левый лист
+
+        Returns:
+            BPlusLeaf: лист
+        """
+        node = self.root
+        while type(node) is BPlusInternal:
+            node = node.children[0]
+        return node
+
+    def search(self, key):
+        """Поиск ключа
+
+        В отличие от AVLTree.search возвращается ключ, а не узел
+
+        Args:
+            key: ключ для поиска
+
+        Returns:
+            (Any | None): найденный ключ или None
+        """
+        keys = self._find_leaf(key).keys
+        i = bisect_left(keys, key)
+        return keys[i] if i < len(keys) and keys[i] == key else None
+
+    def insert(self, key) -> None:
+        """Вставка ключа (дубликаты не вставляются)
+
+        Args:
+            key: ключ для вставки
+        """
+        split = self._insert(self.root, key)
+        if split:
+            separator, right = split
+            self.root = BPlusInternal([separator], [self.root, right])
+
+    def _insert(self, node, key) -> tuple:
+        """Вставка ключа (внутренняя приватная часть)
+
+        Args:
+            node: текущий узел
+            key: ключ для вставки
+
+        Returns:
+            tuple: (разделитель, новый правый узел), если узел разделился, иначе None
+        """
+        if type(node) is BPlusLeaf:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return None
+            keys.insert(i, key)
+            self.size += 1
+            if len(keys) <= self.leaf_capacity:
+                return None
+            mid = len(keys) // 2
+            right = BPlusLeaf(keys[mid:])
+            del keys[mid:]
+            right.next, node.next = node.next, right
+            return right.keys[0], right
+        i = bisect_right(node.keys, key)
+        split = self._insert(node.children[i], key)
+        if not split:
+            return None
+        separator, child = split
+        node.keys.insert(i, separator)
+        node.children.insert(i + 1, child)
+        if len(node.children) <= self.branch_capacity:
+            return None
+        mid = len(node.keys) // 2
+        separator = node.keys[mid]
+        right = BPlusInternal(node.keys[mid + 1 :], node.children[mid + 1 :])
+        del node.keys[mid:]
+        del node.children[mid + 1 :]
+        return separator, right
+
+    def delete(self, key) -> None:
+        """Удаление ключа
+
+        Args:
+            key: ключ для удаления
+        """
+        self._delete(self.root, key)
+        if type(self.root) is BPlusInternal and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+
+    def _delete(self, node, key) -> None:
+        """Удаление ключа (внутренняя приватная часть)
+
+        Args:
+            node: текущий узел
+            key: ключ для удаления
+        """
+        if type(node) is BPlusLeaf:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+                self.size -= 1
+            return
+        i = bisect_right(node.keys, key)
+        self._delete(node.children[i], key)
+        self._fix_underflow(node, i)
+
+    def _fix_underflow(self, parent: BPlusInternal, i: int) -> None:
+        """Восстановление заполненности потомка parent.children[i]
+        заимствованием у соседа или слиянием с ним
+
+        Args:
+            parent (BPlusInternal): родитель
+            i (int): индекс потомка
+        """
+        children = parent.children
+        child = children[i]
+        left = children[i - 1] if i > 0 else None
+        right = children[i + 1] if i + 1 < len(children) else None
+        if type(child) is BPlusLeaf:
+            minimum = self.leaf_capacity // 2
+            if len(child.keys) >= minimum:
+                return
+            if left and len(left.keys) > minimum:
+                child.keys.insert(0, left.keys.pop())
+                parent.keys[i - 1] = child.keys[0]
+            elif right and len(right.keys) > minimum:
+                child.keys.append(right.keys.pop(0))
+                parent.keys[i] = right.keys[0]
+            elif left:
+                left.keys.extend(child.keys)
+                left.next = child.next
+                del parent.keys[i - 1]
+                del children[i]
+            elif right:
+                child.keys.extend(right.keys)
+                child.next = right.next
+                del parent.keys[i]
+                del children[i + 1]
+            return
+        minimum = self.branch_capacity // 2
+        if len(child.children) >= minimum:
+            return
+        if left and len(left.children) > minimum:
+            child.keys.insert(0, parent.keys[i - 1])
+            parent.keys[i - 1] = left.keys.pop()
+            child.children.insert(0, left.children.pop())
+        elif right and len(right.children) > minimum:
+            child.keys.append(parent.keys[i])
+            parent.keys[i] = right.keys.pop(0)
+            child.children.append(right.children.pop(0))
+        elif left:
+            left.keys.append(parent.keys[i - 1])
+            left.keys.extend(child.keys)
+            left.children.extend(child.children)
+            del parent.keys[i - 1]
+            del children[i]
+        elif right:
+            child.keys.append(parent.keys[i])
+            child.keys.extend(right.keys)
+            child.children.extend(right.children)
+            del parent.keys[i]
+            del children[i + 1]
+
+    def inorder_traversal(self) -> list:
+        """Все ключи в порядке возрастания (обход по связанным листьям)
+
+        Returns:
+            list: список ключей
+        """
+        result = []
+        leaf = self._first_leaf()
+        while leaf:
+            result.extend(leaf.keys)
+            leaf = leaf.next
+        return result
+
+    def irange(self, lo, hi):
+        """Ленивый обход ключей из отрезка [lo, hi]
+
+        Args:
+            lo: нижняя граница (включительно)
+            hi: верхняя граница (включительно)
+
+        Yields:
+            Any: ключи в порядке возрастания
+        """
+        leaf = self._find_leaf(lo)
+        i = bisect_left(leaf.keys, lo)
+        while leaf:
+            keys = leaf.keys
+            j = bisect_right(keys, hi)
+            yield from keys[i:j]
+            if j < len(keys):
+                return
+            leaf, i = leaf.next, 0
+
+    @classmethod
+    def from_sorted(cls, iterable, **capacity):
+        """Построение дерева из возрастающей последовательности ключей за O(n)
+
+        Узлы заполняются целиком, последние два узла уровня при необходимости
+        выравниваются, чтобы не нарушить минимальную заполненность
+
+        Args:
+            iterable: ключи в порядке возрастания (повторы пропускаются)
+            capacity: leaf_capacity и branch_capacity
+
+        Raises:
+            ValueError: ключи не отсортированы
+
+        Returns:
+            BPlusTree: построенное дерево
+        """
+        tree = cls(**capacity)
+        keys = []
+        for key in iterable:
+            if keys and not keys[-1] < key:
+                if key == keys[-1]:
+                    continue
+                raise ValueError("Keys must be sorted in ascending order")
+            keys.append(key)
+        tree.size = len(keys)
+        if not keys:
+            return tree
+        chunks = tree._chunk(keys, tree.leaf_capacity)
+        leaves = [BPlusLeaf(chunk) for chunk in chunks]
+        for leaf, following in zip(leaves, leaves[1:]):
+            leaf.next = following
+        level = leaves
+        mins = [chunk[0] for chunk in chunks]
+        while len(level) > 1:
+            groups = tree._chunk(list(range(len(level))), tree.branch_capacity)
+            level, mins = (
+                [
+                    BPlusInternal(
+                        [mins[i] for i in group[1:]], [level[i] for i in group]
+                    )
+                    for group in groups
+                ],
+                [mins[group[0]] for group in groups],
+            )
+        tree.root = level[0]
+        return tree
+
+    @staticmethod
+    def _chunk(items: list, capacity: int) -> list:
+        """Нарезка списка на куски не больше capacity и не меньше capacity // 2
+
+        Args:
+            items (list): элементы
+            capacity (int): вместимость узла
+
+        Returns:
+            list: список кусков
+        """
+        chunks = [items[i : i + capacity] for i in range(0, len(items), capacity)]
+        if len(chunks) > 1 and len(chunks[-1]) < capacity // 2:
+            tail = chunks[-2] + chunks[-1]
+            half = len(tail) // 2
+            chunks[-2:] = [tail[:half], tail[half:]]
+        return chunks
+
+    @classmethod
+    def from_iterable(cls, iterable, **capacity):
+        """Построение дерева из произвольной последовательности ключей
+
+        Args:
+            iterable: ключи в любом порядке
+            capacity: leaf_capacity и branch_capacity
+
+        Returns:
+            BPlusTree: построенное дерево
+        """
+        return cls.from_sorted(sorted(set(iterable)), **capacity)
+
+    def merge_trees(self, other) -> None:
+        """Слияние с другим деревом за O(N+M) (потоковое слияние листьев и
+        построение заново), дерево other не изменяется
+
+        Дерево перестраивается даже при маленьком other, в отличие от
+        объединения через split/join у AVLTree
+
+        Args:
+            other (BPlusTree): другое дерево
+        """
+        merged = self.from_sorted(
+            merge(self.inorder_traversal(), other.inorder_traversal()),
+            leaf_capacity=self.leaf_capacity,
+            branch_capacity=self.branch_capacity,
+        )
+        self.root, self.size = merged.root, merged.size
+
+    def split_tree(self, key) -> tuple:
+        """Разделение дерева по ключу за O(n) на срезах списков
+
+        Обе части строятся заново из всех ключей (у AVLTree - O(log n)).
+        В текущем дереве остается только ключ key (если он был)
+
+        Args:
+            key: ключ разделения
+
+        Returns:
+            tuple: полученные новые деревья (ключи меньше key, ключи больше key)
+        """
+        keys = self.inorder_traversal()
+        i = bisect_left(keys, key)
+        found = i < len(keys) and keys[i] == key
+        capacity = {
+            "leaf_capacity": self.leaf_capacity,
+            "branch_capacity": self.branch_capacity,
+        }
+        left = self.from_sorted(keys[:i], **capacity)
+        right = self.from_sorted(keys[i + 1 if found else i :], **capacity)
+        self.root, self.size = BPlusLeaf([key] if found else []), int(found)
+        return left, right
+
+    def count_nodes(self) -> int:
+        """Количество ключей в дереве
+
+        Returns:
+            int: число ключей
+        """
+        return self.size
+
+    def __len__(self) -> int:
+        """Магический метод определения количества ключей в дереве
+
+        Returns:
+            int: количество ключей
+        """
+        return self.size
+
+    def __contains__(self, key) -> bool:
+        """Магический метод проверки наличия ключа (key in tree)
+
+        Args:
+            key: ключ
+
+        Returns:
+            bool: True, если ключ есть в дереве
+        """
+        keys = self._find_leaf(key).keys
+        i = bisect_left(keys, key)
+        return i < len(keys) and keys[i] == key
+
+    def __str__(self) -> str:
+        """Магический метод вывода дерева в виде строки
+
+        Returns:
+            str: дерево в виде строки
+        """
+        return str(self.inorder_traversal()) if self.size else "Empty tree"
+
+
+# Пример использования
+if __name__ == "__main__":
+    tree = BPlusTree(leaf_capacity=4, branch_capacity=4)
+    for key in [10, 20, 30, 40, 50, 25, 60, 5, 15, 35]:
+        tree.insert(key)
+    print("Inorder traversal after inserts:", tree.inorder_traversal())
+    tree.delete(30)
+    print("Inorder traversal after deletion (30):", tree.inorder_traversal())
+    print("Range [12, 40]:", list(tree.irange(12, 40)))
+    left, right = tree.split_tree(25)
+    print("Split by 25:", left, tree, right)
@@ -0,0 +1,666 @@
+import asyncio
+import struct
+from collections import deque
+from itertools import islice
+
+from ordered_index import OrderedIndex
+
+# Коды операций протокола
+GET = 1
+SET = 2
+DELETE = 3
+CONTAINS = 4
+RANGE = 5
+RANK = 6
+SELECT = 7
+SIZE = 8
+OPERATIONS = {
+    "get": GET,
+    "set": SET,
+    "delete": DELETE,
+    "contains": CONTAINS,
+    "range": RANGE,
+    "rank": RANK,
+    "select": SELECT,
+    "size": SIZE,
+}
+
+# Кадр: длина (uint32, little-endian) и содержимое. Запрос - байт кода
+# операции и аргументы, ответ - байт статуса и результат (или тип и текст ошибки)
+_LENGTH = struct.Struct("<I")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+MAX_FRAME = 1 << 26
+_OK = 0
+_ERROR = 1
+# Исключения, которые клиент поднимает с тем же типом, остальные - RuntimeError
+_ERRORS = {
+    error.__name__: error for error in (KeyError, IndexError, TypeError, ValueError)
+}
+_READ_SIZE = 1 << 16
+
+
+def encode_value(value, out: bytearray) -> None:
+    """Запись значения в буфер: байт типа и данные
+
+    Args:
+        value: None, bool, int (int64), float, str, bytes, list или tuple
+        out (bytearray): буфер
+
+    Raises:
+        TypeError: тип значения не поддерживается
+    """
+    kind = type(value)
+    if value is None:
+        out += b"N"
+    elif kind is bool:
+        out += b"T" if value else b"F"
+    elif kind is int:
+        out += b"i"
+        out += _INT.pack(value)
+    elif kind is float:
+        out += b"f"
+        out += _FLOAT.pack(value)
+    elif kind is str:
+        data = value.encode()
+        out += b"s"
+        out += _LENGTH.pack(len(data))
+        out += data
+    elif kind is bytes or kind is bytearray:
+        out += b"b"
+        out += _LENGTH.pack(len(value))
+        out += value
+    elif kind is list or kind is tuple:
+        out += b"l" if kind is list else b"t"
+        out += _LENGTH.pack(len(value))
+        for item in value:
+            encode_value(item, out)
+    else:
+        raise TypeError(f"Unsupported value type: {kind.__name__}")
+
+
+def decode_value(data, offset: int) -> tuple:
+    """Чтение значения, записанного encode_value
+
+    Args:
+        data: буфер
+        offset (int): смещение значения
+
+    Raises:
+        ValueError: неизвестный тип значения
+
+    Returns:
+        tuple: (значение, смещение следующего значения)
+    """
+    tag = data[offset]
+    offset += 1
+    if tag == 0x69:  # i
+        return _INT.unpack_from(data, offset)[0], offset + 8
+    if tag == 0x73:  # s
+        (size,) = _LENGTH.unpack_from(data, offset)
+        offset += 4
+        return bytes(data[offset : offset + size]).decode(), offset + size
+    if tag == 0x4E:  # N
+        return None, offset
+    if tag == 0x54 or tag == 0x46:  # T, F
+        return tag == 0x54, offset
+    if tag == 0x66:  # f
+        return _FLOAT.unpack_from(data, offset)[0], offset + 8
+    if tag == 0x62:  # b
+        (size,) = _LENGTH.unpack_from(data, offset)
+        offset += 4
+        return bytes(data[offset : offset + size]), offset + size
+    if tag == 0x6C or tag == 0x74:  # l, t
+        (count,) = _LENGTH.unpack_from(data, offset)
+        offset += 4
+        items = []
+        for _ in range(count):
+            item, offset = decode_value(data, offset)
+            items.append(item)
+        return (items if tag == 0x6C else tuple(items)), offset
+    raise ValueError(f"Unknown value tag: {tag}")
+
+
+def encode_request(op: int, args: tuple, out: bytearray) -> None:
+    """Запись кадра запроса в буфер
+
+    Args:
+        op (int): код операции
+        args (tuple): аргументы
+        out (bytearray): буфер
+    """
+    start = len(out)
+    out += b"\0\0\0\0"
+    out.append(op)
+    for arg in args:
+        encode_value(arg, out)
+    _LENGTH.pack_into(out, start, len(out) - start - 4)
+
+
+def split_frames(buffer: bytearray) -> list:
+    """Отделение всех полностью принятых кадров от начала буфера
+
+    Args:
+        buffer (bytearray): принятые байты (разобранные кадры удаляются)
+
+    Raises:
+        ValueError: пустой кадр или кадр больше MAX_FRAME
+
+    Returns:
+        list: содержимое кадров (bytes)
+    """
+    frames = []
+    offset = 0
+    # Копируются только сами кадры, а не весь буфер на каждом чтении
+    with memoryview(buffer) as view:
+        while len(view) - offset >= 4:
+            (size,) = _LENGTH.unpack_from(view, offset)
+            if not 0 < size <= MAX_FRAME:
+                raise ValueError("Invalid frame size")
+            end = offset + 4 + size
+            if end > len(view):
+                break
+            with view[offset + 4 : end] as frame:
+                frames.append(bytes(frame))
+            offset = end
+    del buffer[:offset]
+    return frames
+
+
+class KVServer:
+    """Asyncio-сервер ключ-значение поверх OrderedIndex (DoubleHashingMap и
+    АВЛ-дерево с размерами поддеревьев)
+
+    Клиент может отправлять запросы, не дожидаясь ответов (конвейер). Все
+    кадры, принятые одним чтением из сокета, обрабатываются пачкой: подряд
+    идущие set и delete объединяются в один insert_many / delete_many индекса,
+    а ответы на всю пачку отправляются одной записью. Пачка выполняется без
+    переключения на другие соединения, поэтому порядок операций сохраняется
+    """
+
+    def __init__(self, index: OrderedIndex = None):
+        self.index = OrderedIndex() if index is None else index
+        self.server = None  # asyncio.Server
+        self.requests = 0  # обработанные запросы
+        self.batches = 0  # обработанные пачки
+        self.coalesced = 0  # запросы, выполненные в составе пакетных операций
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Запуск на TCP-сокете
+
+        Args:
+            host (str): адрес
+            port (int): порт (0 - любой свободный)
+        """
+        self.server = await asyncio.start_server(self._serve, host, port)
+
+    async def start_unix(self, path: str) -> None:
+        """Запуск на Unix-сокете
+
+        Args:
+            path (str): путь к сокету
+        """
+        self.server = await asyncio.start_unix_server(self._serve, path)
+
+    @property
+    def address(self):
+        """Адрес первого слушающего сокета (host, port) или путь Unix-сокета"""
+        return self.server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        """Обработка соединений до отмены"""
+        await self.server.serve_forever()
+
+    async def close(self) -> None:
+        """Остановка приема соединений"""
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _serve(self, reader, writer) -> None:
+        """Обработка одного соединения
+
+        Args:
+            reader (asyncio.StreamReader): поток чтения
+            writer (asyncio.StreamWriter): поток записи
+        """
+        buffer = bytearray()
+        try:
+            while True:
+                chunk = await reader.read(_READ_SIZE)
+                if not chunk:
+                    break
+                buffer += chunk
+                frames = split_frames(buffer)
+                if frames:
+                    writer.write(self.execute(frames))
+                    await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def execute(self, frames: list) -> bytes:
+        """Выполнение пачки запросов
+
+        Args:
+            frames (list): содержимое кадров запросов
+
+        Returns:
+            bytes: кадры ответов в порядке запросов
+        """
+        self.batches += 1
+        self.requests += len(frames)
+        requests = []
+        for frame in frames:
+            try:
+                requests.append(self._decode(frame))
+            except (ValueError, IndexError, struct.error) as error:
+                requests.append((None, error))
+        out = bytearray()
+        i = 0
+        while i < len(requests):
+            op, args = requests[i]
+            if op is None:
+                self._error(args, out)
+                i += 1
+                continue
+            if op == SET or op == DELETE:
+                # Серия одинаковых операций записи - одна пакетная операция
+                j = i + 1
+                while j < len(requests) and requests[j][0] == op:
+                    j += 1
+                group = [args for _, args in requests[i:j]]
+                self._write_group(op, group, out)
+                if len(group) > 1:
+                    self.coalesced += len(group)
+                i = j
+                continue
+            try:
+                result = self._read(op, args)
+            except Exception as error:
+                self._error(error, out)
+            else:
+                self._reply(result, out)
+            i += 1
+        return bytes(out)
+
+    @staticmethod
+    def _decode(frame) -> tuple:
+        """Разбор кадра запроса
+
+        Args:
+            frame: содержимое кадра
+
+        Returns:
+            tuple: (код операции, список аргументов)
+        """
+        args = []
+        offset = 1
+        while offset < len(frame):
+            value, offset = decode_value(frame, offset)
+            args.append(value)
+        return frame[0], args
+
+    def _write_group(self, op: int, group: list, out: bytearray) -> None:
+        """Выполнение серии set или delete одной пакетной операцией индекса
+
+        Args:
+            op (int): SET или DELETE
+            group (list): аргументы запросов серии
+            out (bytearray): буфер ответов
+        """
+        try:
+            self._check_group(op, group)
+        except Exception:
+            # Пакетная операция могла бы примениться частично, поэтому серия
+            # выполняется по одному запросу и каждый получает свой ответ
+            for args in group:
+                try:
+                    self._write(op, args)
+                except Exception as error:
+                    self._error(error, out)
+                else:
+                    self._reply(None, out)
+            return
+        if op == SET:
+            self.index.insert_many(group)
+        else:
+            self.index.delete_many(args[0] for args in group)
+        for _ in group:
+            self._reply(None, out)
+
+    def _check_group(self, op: int, group: list) -> None:
+        """Проверка, что пакетная операция над серией не завершится ошибкой
+
+        Args:
+            op (int): SET или DELETE
+            group (list): аргументы запросов серии
+
+        Raises:
+            TypeError: неверное количество аргументов, нехэшируемый ключ или
+                ключи, не сравнимые между собой или с ключами индекса
+        """
+        expected = 2 if op == SET else 1
+        if any(len(args) != expected for args in group):
+            raise TypeError(f"Expected {expected} arguments")
+        keys = [args[0] for args in group]
+        for key in keys:
+            hash(key)
+        keys.sort()
+        if len(self.index):
+            anchor = self.index.min()
+            for key in keys:
+                key < anchor  # TypeError для ключей другого типа
+
+    def _write(self, op: int, args: list) -> None:
+        """Выполнение одного запроса set или delete
+
+        Args:
+            op (int): SET или DELETE
+            args (list): аргументы
+
+        Raises:
+            TypeError: неподходящий ключ
+            ValueError: неверное количество аргументов
+        """
+        if op == SET:
+            key, value = args
+            self.index.insert(key, value)
+        else:
+            (key,) = args
+            self.index.delete(key)
+
+    def _read(self, op: int, args: list):
+        """Выполнение запроса, не изменяющего индекс
+
+        Args:
+            op (int): код операции
+            args (list): аргументы
+
+        Raises:
+            ValueError: неизвестный код операции
+
+        Returns:
+            Any: результат
+        """
+        index = self.index
+        if op == GET:
+            (key,) = args
+            return index.get(key)
+        if op == CONTAINS:
+            (key,) = args
+            return key in index
+        if op == RANGE:
+            lo, hi, limit = args
+            return list(islice(index.irange(lo, hi), limit))
+        if op == RANK:
+            (key,) = args
+            return index.rank(key)
+        if op == SELECT:
+            (position,) = args
+            return index.select(position)
+        if op == SIZE:
+            return len(index)
+        raise ValueError(f"Unknown operation: {op}")
+
+    @staticmethod
+    def _reply(result, out: bytearray) -> None:
+        """Запись кадра успешного ответа
+
+        Args:
+            result: результат
+            out (bytearray): буфер ответов
+        """
+        start = len(out)
+        out += b"\0\0\0\0"
+        out.append(_OK)
+        encode_value(result, out)
+        _LENGTH.pack_into(out, start, len(out) - start - 4)
+
+    @staticmethod
+    def _error(error: Exception, out: bytearray) -> None:
+        """Запись кадра ответа с ошибкой
+
+        Args:
+            error (Exception): исключение
+            out (bytearray): буфер ответов
+        """
+        start = len(out)
+        out += b"\0\0\0\0"
+        out.append(_ERROR)
+        encode_value((type(error).__name__, str(error)), out)
+        _LENGTH.pack_into(out, start, len(out) - start - 4)
+
+
+class KVClient:
+    """Клиент KVServer
+
+    Запросы отправляются сразу, а ответы сопоставляются с ожидающими их
+    корутинами по порядку, поэтому конкурентные вызовы одного клиента (или
+    pipeline()) идут по соединению конвейером без ожидания каждого ответа
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self._pending = deque()  # futures запросов в порядке отправки
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 0):
+        """Подключение по TCP
+
+        Args:
+            host (str): адрес
+            port (int): порт
+
+        Returns:
+            KVClient: клиент
+        """
+        return cls(*await asyncio.open_connection(host, port))
+
+    @classmethod
+    async def connect_unix(cls, path: str):
+        """Подключение по Unix-сокету
+
+        Args:
+            path (str): путь к сокету
+
+        Returns:
+            KVClient: клиент
+        """
+        return cls(*await asyncio.open_unix_connection(path))
+
+    async def _receive(self) -> None:
+        """Чтение ответов и завершение ожидающих их futures"""
+        buffer = bytearray()
+        error = ConnectionError("Connection closed")
+        try:
+            while True:
+                chunk = await self.reader.read(_READ_SIZE)
+                if not chunk:
+                    break
+                buffer += chunk
+                for frame in split_frames(buffer):
+                    result, _ = decode_value(frame, 1)
+                    future = self._pending.popleft()
+                    if future.cancelled():
+                        continue
+                    if frame[0] == _OK:
+                        future.set_result(result)
+                    else:
+                        name, message = result
+                        future.set_exception(_ERRORS.get(name, RuntimeError)(message))
+        except (ConnectionError, ValueError) as failure:
+            error = failure
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    def _send(self, requests) -> list:
+        """Отправка запросов одной записью
+
+        Args:
+            requests: пары (код операции, аргументы)
+
+        Returns:
+            list: futures ответов
+        """
+        if self._receiver.done():
+            raise ConnectionError("Connection closed")
+        out = bytearray()
+        count = 0
+        for op, args in requests:
+            encode_request(op, args, out)
+            count += 1
+        # Futures создаются только после кодирования всех запросов: ошибка
+        # кодирования не должна сдвинуть сопоставление ответов
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in range(count)]
+        self._pending.extend(futures)
+        self.writer.write(out)
+        return futures
+
+    async def request(self, op: int, *args):
+        """Выполнение одного запроса
+
+        Args:
+            op (int): код операции
+            args: аргументы
+
+        Raises:
+            KeyError, IndexError, TypeError, ValueError, RuntimeError: ошибка
+                выполнения на сервере
+            ConnectionError: соединение закрыто
+
+        Returns:
+            Any: результат
+        """
+        (future,) = self._send([(op, args)])
+        await self.writer.drain()
+        return await future
+
+    async def pipeline(self, requests) -> list:
+        """Отправка серии запросов без ожидания ответов на каждый
+
+        Args:
+            requests: пары (имя операции, кортеж аргументов), например
+                ("set", (1, "a")), ("get", (1,))
+
+        Raises:
+            KeyError, IndexError, TypeError, ValueError, RuntimeError: ошибка
+                выполнения одного из запросов на сервере
+            ConnectionError: соединение закрыто
+
+        Returns:
+            list: результаты в порядке запросов
+        """
+        futures = self._send([(OPERATIONS[name], args) for name, args in requests])
+        await self.writer.drain()
+        return list(await asyncio.gather(*futures))
+
+    async def get(self, key):
+        """Значение по ключу (None, если ключа нет)"""
+        return await self.request(GET, key)
+
+    async def set(self, key, value) -> None:
+        """Вставка или замена значения"""
+        await self.request(SET, key, value)
+
+    async def delete(self, key) -> None:
+        """Удаление ключа (отсутствующий ключ пропускается)"""
+        await self.request(DELETE, key)
+
+    async def contains(self, key) -> bool:
+        """Проверка наличия ключа"""
+        return await self.request(CONTAINS, key)
+
+    async def range(self, lo, hi, limit: int = None) -> list:
+        """Пары (ключ, значение) с ключами из отрезка [lo, hi] по возрастанию
+
+        Args:
+            lo: нижняя граница (включительно)
+            hi: верхняя граница (включительно)
+            limit (int): наибольшее количество пар (None - без ограничения)
+
+        Returns:
+            list: пары (ключ, значение)
+        """
+        return await self.request(RANGE, lo, hi, limit)
+
+    async def rank(self, key) -> int:
+        """Количество ключей меньше заданного"""
+        return await self.request(RANK, key)
+
+    async def select(self, position: int):
+        """Ключ с заданным номером по возрастанию (IndexError вне индекса)"""
+        return await self.request(SELECT, position)
+
+    async def size(self) -> int:
+        """Количество ключей"""
+        return await self.request(SIZE)
+
+    async def close(self) -> None:
+        """Закрытие соединения"""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._receiver
+
+
+def run_server(host: str = "127.0.0.1", port: int = 0, path: str = None) -> None:
+    """Запуск сервера в текущем процессе до прерывания (для отдельного процесса)
+
+    Args:
+        host (str): адрес TCP
+        port (int): порт TCP
+        path (str): путь Unix-сокета (если задан, TCP не используется)
+    """
+
+    async def main():
+        server = KVServer()
+        if path:
+            await server.start_unix(path)
+        else:
+            await server.start(host, port)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+# Пример использования
+if __name__ == "__main__":
+
+    async def example():
+        server = KVServer()
+        await server.start()
+        client = await KVClient.connect(*server.address)
+        for user_id, name in [(42, "ann"), (7, "bob"), (19, "eve"), (3, "joe")]:
+            await client.set(user_id, name)
+        print("Get 19:", await client.get(19), "contains 5:", await client.contains(5))
+        print("Range [5, 50]:", await client.range(5, 50))
+        print("Rank of 42:", await client.rank(42))
+        print("Select 0:", await client.select(0))
+        results = await client.pipeline(
+            [("set", (i, i * i)) for i in range(100, 110)]
+            + [("delete", (7,)), ("size", ()), ("range", (100, 200, 3))]
+        )
+        print("Pipeline results:", results[-2:])
+        try:
+            await client.select(1000)
+        except IndexError as error:
+            print("Server error:", error)
+        print(
+            f"Requests: {server.requests}, batches: {server.batches},"
+            f" coalesced: {server.coalesced}"
+        )
+        await client.close()
+        await server.close()
+
+    asyncio.run(example())
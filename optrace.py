@@ -0,0 +1,588 @@
+import inspect
+import struct
+import sys
+import time
+from array import array
+from contextlib import contextmanager
+
+from assoc import DoubleHashingMap, MyDict
+from avl_map import AVLMap
+from avl_multiset import AVLMultiset
+from ordered_index import OrderedIndex
+
+# Коды операций трассы
+INSERT = 0
+SEARCH = 1
+DELETE = 2
+POP_MIN = 3
+POP_MAX = 4
+LOAD = 5  # ключ, бывший в структуре до начала записи
+INSERT_MANY = 6  # заголовок пакета: ключ - количество следующих записей INSERT
+DELETE_MANY = 7  # заголовок пакета: ключ - количество следующих записей DELETE
+OPERATIONS = (
+    "insert",
+    "search",
+    "delete",
+    "pop_min",
+    "pop_max",
+    "load",
+    "insert_many",
+    "delete_many",
+)
+
+# Ключ записан номером первого появления (не целое число или не влезает в int64)
+_INTERNED = 0x80
+_OP_MASK = 0x7F
+_STRIP_FLAG = bytes(i & _OP_MASK for i in range(256))
+
+# Формат файла: сигнатура и версия, затем блоки - количество записей,
+# байты кодов операций и ключи (int64, little-endian)
+_TRACE_HEADER = struct.Struct("<4sI")
+_TRACE_MAGIC = b"OPTR"
+_TRACE_VERSION = 1
+_BLOCK_HEADER = struct.Struct("<I")
+# Методы структур, подменяемые на время записи
+_PATCHED = (
+    "insert",
+    "search",
+    "delete",
+    "pop_min",
+    "pop_max",
+    "insert_many",
+    "delete_many",
+)
+
+
+class TraceRecorder:
+    """Буферизованная запись трассы операций в бинарный файл
+
+    Коды операций и ключи копятся в bytearray и array("q") и сбрасываются
+    на диск блоками по buffer_size записей. Записывается только внешний вызов:
+    операции, вызванные изнутри другой записываемой операции (delete внутри
+    pop_min мультимножества, insert внутри перехеширования таблицы), в трассу
+    не попадают
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.ops = bytearray()  # коды операций текущего блока
+        self.keys = array("q")  # ключи текущего блока
+        self.count = 0  # записей, сброшенных на диск
+        self.depth = 0  # вложенность выполняющихся записываемых операций
+        self._interned = {}  # ключ, не помещающийся в int64 -> номер
+        self.file = open(path, "wb")
+        self.file.write(_TRACE_HEADER.pack(_TRACE_MAGIC, _TRACE_VERSION))
+
+    def append(self, op: int, key) -> None:
+        """Добавление записи в буфер
+
+        Args:
+            op (int): код операции
+            key: ключ
+        """
+        try:
+            self.keys.append(key)
+        except (TypeError, OverflowError):
+            self.keys.append(self._intern(key))
+            op |= _INTERNED
+        self.ops.append(op)
+        if len(self.ops) >= self.buffer_size:
+            self.flush()
+
+    def _intern(self, key) -> int:
+        """Номер ключа, не являющегося целым числом из диапазона int64
+
+        Сами такие ключи в трассу не пишутся, сохраняется только порядок
+        обращений к ним
+
+        Args:
+            key: ключ
+
+        Returns:
+            int: номер первого появления ключа
+        """
+        return self._interned.setdefault(key, len(self._interned))
+
+    def flush(self) -> None:
+        """Сброс буфера на диск одним блоком"""
+        if not self.ops:
+            return
+        keys = self.keys
+        if sys.byteorder != "little":
+            keys = array("q", keys)
+            keys.byteswap()
+        self.file.write(_BLOCK_HEADER.pack(len(self.ops)))
+        self.file.write(self.ops)
+        keys.tofile(self.file)
+        self.file.flush()
+        self.count += len(self.ops)
+        # Буферы очищаются на месте: на них ссылаются обертки методов
+        del self.ops[:]
+        del self.keys[:]
+
+    def close(self) -> None:
+        """Сброс буфера и закрытие файла"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def record(structure, path: str, buffer_size: int = 1 << 16) -> TraceRecorder:
+    """Включение записи трассы операций структуры
+
+    Как и instrument() из avl_stats, методы подменяются атрибутами экземпляра,
+    класс не изменяется. Для MyDict записываются операции внутренней
+    DoubleHashingMap (insert, search, delete), для деревьев - insert, search,
+    delete, pop_min, pop_max, insert_many и delete_many. Ключи, уже бывшие в
+    структуре, пишутся в начало трассы записями LOAD. Структуры ключ-значение
+    (AVLMap) записывают из пакета только ключи, а мультимножество - каждый
+    вставленный или удаленный экземпляр отдельной записью, в том числе в LOAD.
+    Операции, завершившиеся исключением, не записываются
+
+    Args:
+        structure: MyDict, DoubleHashingMap, AVLTree или наследник AVLTree
+        path (str): путь к файлу трассы
+        buffer_size (int): количество записей в одном блоке
+
+    Raises:
+        ValueError: запись для структуры уже включена
+
+    Returns:
+        TraceRecorder: объект записи
+    """
+    target = structure.map if isinstance(structure, MyDict) else structure
+    if "_recorder" in vars(target):
+        raise ValueError("Structure is already being recorded")
+    recorder = TraceRecorder(path, buffer_size)
+    if isinstance(target, DoubleHashingMap):
+        existing = [
+            entry[0]
+            for entry in target.table
+            if entry is not None and entry is not target.deleted
+        ]
+    elif isinstance(target, AVLMultiset):
+        existing = target.elements()
+    else:
+        existing = target.inorder_traversal()
+    for key in existing:
+        recorder.append(LOAD, key)
+
+    patches = {}
+    for op, name in ((INSERT, "insert"), (SEARCH, "search"), (DELETE, "delete")):
+        patches[name] = _recorded(recorder, op, getattr(target, name))
+    if isinstance(target, AVLMultiset):
+        for op, name in ((INSERT, "insert"), (DELETE, "delete")):
+            patches[name] = _recorded_count(recorder, op, getattr(target, name), target)
+    for op, name in ((POP_MIN, "pop_min"), (POP_MAX, "pop_max")):
+        if hasattr(target, name):
+            patches[name] = _recorded_pop(recorder, op, getattr(target, name))
+    pairs = isinstance(target, (AVLMap, OrderedIndex))
+    for op, name in ((INSERT_MANY, "insert_many"), (DELETE_MANY, "delete_many")):
+        if hasattr(target, name):
+            method = getattr(target, name)
+            patches[name] = _recorded_batch(recorder, op, method, pairs)
+    vars(target).update(patches)
+    target._recorder = recorder
+    return recorder
+
+
+def _recorded(recorder: TraceRecorder, op: int, method):
+    """Обертка операции над одним ключом
+
+    Args:
+        recorder (TraceRecorder): объект записи
+        op (int): код операции
+        method: исходный связанный метод
+
+    Returns:
+        function: обертка
+    """
+    ops, keys = recorder.ops, recorder.keys
+    ops_append, keys_append = ops.append, keys.append
+    limit = recorder.buffer_size
+
+    def wrapper(key, *args):
+        recorder.depth += 1
+        try:
+            result = method(key, *args)
+        finally:
+            recorder.depth -= 1
+        if recorder.depth:
+            return result
+        # Быстрый путь recorder.append без лишнего вызова
+        try:
+            keys_append(key)
+        except (TypeError, OverflowError):
+            recorder.append(op, key)
+            return result
+        ops_append(op)
+        if len(ops) >= limit:
+            recorder.flush()
+        return result
+
+    return wrapper
+
+
+def _recorded_count(recorder: TraceRecorder, op: int, method, multiset: AVLMultiset):
+    """Обертка insert/delete мультимножества: по записи на каждый экземпляр
+
+    Трасса хранит только ключи, поэтому insert(key, 3) записывается тремя
+    INSERT, а delete - столько раз, сколько экземпляров действительно удалено
+
+    Args:
+        recorder (TraceRecorder): объект записи
+        op (int): INSERT или DELETE
+        method: исходный связанный метод
+        multiset (AVLMultiset): мультимножество
+
+    Returns:
+        function: обертка
+    """
+
+    def wrapper(key, *args):
+        before = multiset.count(key)
+        recorder.depth += 1
+        try:
+            result = method(key, *args)
+        finally:
+            recorder.depth -= 1
+        if not recorder.depth:
+            for _ in range(abs(multiset.count(key) - before)):
+                recorder.append(op, key)
+        return result
+
+    return wrapper
+
+
+def _recorded_pop(recorder: TraceRecorder, op: int, method):
+    """Обертка pop_min/pop_max, записывающая извлеченный ключ
+
+    Args:
+        recorder (TraceRecorder): объект записи
+        op (int): код операции
+        method: исходный связанный метод
+
+    Returns:
+        function: обертка
+    """
+
+    def wrapper():
+        recorder.depth += 1
+        try:
+            key = method()
+        finally:
+            recorder.depth -= 1
+        if not recorder.depth:
+            recorder.append(op, key)
+        return key
+
+    return wrapper
+
+
+def _recorded_batch(recorder: TraceRecorder, op: int, method, pairs: bool):
+    """Обертка insert_many/delete_many: заголовок пакета и записи его ключей
+
+    Args:
+        recorder (TraceRecorder): объект записи
+        op (int): код пакетной операции
+        method: исходный связанный метод
+        pairs (bool): insert_many принимает пары (ключ, значение)
+
+    Returns:
+        function: обертка
+    """
+    item = INSERT if op == INSERT_MANY else DELETE
+    pairs = pairs and op == INSERT_MANY
+
+    def wrapper(keys):
+        keys = list(keys)
+        recorder.depth += 1
+        try:
+            result = method(keys)
+        finally:
+            recorder.depth -= 1
+        if recorder.depth:
+            return result
+        recorder.append(op, len(keys))
+        for key in keys:
+            # В трассу идет только ключ пары, значение воспроизводится ключом
+            recorder.append(item, key[0] if pairs else key)
+        return result
+
+    return wrapper
+
+
+def stop_recording(structure) -> TraceRecorder:
+    """Отключение записи, сброс буфера и возврат методов класса
+
+    Args:
+        structure: структура, переданная в record()
+
+    Returns:
+        TraceRecorder: объект записи (None, если запись не была включена)
+    """
+    target = structure.map if isinstance(structure, MyDict) else structure
+    for name in _PATCHED:
+        vars(target).pop(name, None)
+    recorder = vars(target).pop("_recorder", None)
+    if recorder is not None:
+        recorder.close()
+    return recorder
+
+
+@contextmanager
+def recording(structure, path: str, buffer_size: int = 1 << 16):
+    """Контекстный менеджер записи трассы внутри блока with
+
+    Args:
+        structure: MyDict, DoubleHashingMap или дерево
+        path (str): путь к файлу трассы
+        buffer_size (int): количество записей в одном блоке
+
+    Yields:
+        TraceRecorder: объект записи
+    """
+    recorder = record(structure, path, buffer_size)
+    try:
+        yield recorder
+    finally:
+        stop_recording(structure)
+
+
+def load_trace(path: str) -> tuple:
+    """Чтение трассы из файла
+
+    Ключи, записанные номерами, восстанавливаются строками вида "#номер":
+    порядок обращений и повторы сохраняются, исходные значения - нет
+
+    Args:
+        path (str): путь к файлу трассы
+
+    Raises:
+        ValueError: файл не является трассой операций
+
+    Returns:
+        tuple: (bytes кодов операций, list ключей)
+    """
+    with open(path, "rb") as file:
+        view = memoryview(file.read())
+    if len(view) < _TRACE_HEADER.size:
+        raise ValueError("Not an operation trace")
+    magic, version = _TRACE_HEADER.unpack_from(view)
+    if magic != _TRACE_MAGIC or version != _TRACE_VERSION:
+        raise ValueError("Not an operation trace")
+    ops, keys = bytearray(), array("q")
+    offset = _TRACE_HEADER.size
+    while offset < len(view):
+        if offset + _BLOCK_HEADER.size > len(view):
+            raise ValueError("Truncated operation trace")
+        (count,) = _BLOCK_HEADER.unpack_from(view, offset)
+        offset += _BLOCK_HEADER.size
+        end = offset + count * 9
+        if end > len(view):
+            raise ValueError("Truncated operation trace")
+        ops += view[offset : offset + count]
+        keys.frombytes(view[offset + count : end])
+        offset = end
+    view.release()
+    if sys.byteorder != "little":
+        keys.byteswap()
+    keys = keys.tolist()
+    if any(op & _INTERNED for op in ops):
+        for i, op in enumerate(ops):
+            if op & _INTERNED:
+                keys[i] = f"#{keys[i]}"
+    return bytes(ops.translate(_STRIP_FLAG)), keys
+
+
+def _operations(structure) -> tuple:
+    """Функции структуры, соответствующие кодам операций над одним ключом
+
+    Трасса хранит только ключи, поэтому структуры ключ-значение (хэш-таблицы,
+    AVLMap, OrderedIndex) получают ключ и в качестве значения
+
+    Args:
+        structure: MyDict, DoubleHashingMap, dict, AVLMap, OrderedIndex
+            или дерево
+
+    Raises:
+        ValueError: insert дерева не принимает один ключ
+
+    Returns:
+        tuple: функции одного аргумента-ключа для INSERT, SEARCH, DELETE,
+            POP_MIN и POP_MAX (None, если операция не поддерживается)
+    """
+    if isinstance(structure, DoubleHashingMap):
+        return (
+            lambda key: structure.insert(key, key),
+            structure.search,
+            structure.delete,
+            None,
+            None,
+        )
+    if isinstance(structure, (MyDict, dict)):
+        if isinstance(structure, MyDict):
+            get, pop = structure.__getitem__, structure.__delitem__
+        else:
+            get, pop = structure.get, lambda key: structure.pop(key, None)
+        return lambda key: structure.__setitem__(key, key), get, pop, None, None
+    pops = []
+    for name in ("pop_min", "pop_max"):
+        method = getattr(structure, name, None)
+        pops.append(method and (lambda _, method=method: method()))
+    if isinstance(structure, (AVLMap, OrderedIndex)):
+        search = getattr(structure, "search", None) or structure.get
+        insert = structure.insert
+        return (lambda key: insert(key, key), search, structure.delete, *pops)
+    try:
+        inspect.signature(structure.insert).bind(None)
+    except TypeError:
+        raise ValueError(
+            f"{type(structure).__name__}.insert does not take a single key"
+        ) from None
+    return (structure.insert, structure.search, structure.delete, *pops)
+
+
+def compile_trace(structure, ops: bytes, keys: list) -> tuple:
+    """Подготовка трассы к воспроизведению на структуре
+
+    Args:
+        structure: MyDict, DoubleHashingMap, dict, AVLMap, OrderedIndex
+            или дерево
+        ops (bytes): коды операций
+        keys (list): ключи
+
+    Raises:
+        ValueError: структура не поддерживает операцию из трассы или вставку
+            одного ключа
+
+    Returns:
+        tuple: (ключи начального заполнения, список пар (функция, аргумент))
+    """
+    single = _operations(structure)
+    batch = {
+        INSERT_MANY: getattr(structure, "insert_many", None),
+        DELETE_MANY: getattr(structure, "delete_many", None),
+    }
+    if isinstance(structure, (AVLMap, OrderedIndex)):
+        batch[INSERT_MANY] = lambda group: structure.insert_many(
+            (key, key) for key in group
+        )
+    preload, calls = [], []
+    i = 0
+    while i < len(ops):
+        op, key = ops[i], keys[i]
+        i += 1
+        if op == LOAD:
+            preload.append(key)
+            continue
+        if op in batch:
+            group = keys[i : i + key]
+            i += key
+            if batch[op] is not None:
+                calls.append((batch[op], group))
+                continue
+            # Структура без пакетных операций выполняет их поэлементно
+            function = single[INSERT if op == INSERT_MANY else DELETE]
+            calls.extend((function, item) for item in group)
+            continue
+        function = single[op]
+        if function is None:
+            raise ValueError(
+                f"{type(structure).__name__} does not support {OPERATIONS[op]}"
+            )
+        calls.append((function, key))
+    return preload, calls
+
+
+def replay(structure, ops: bytes, keys: list, timed: bool = False) -> dict:
+    """Воспроизведение трассы на структуре с замером скорости
+
+    Ключи LOAD вставляются до начала замера. Без timed замеряется только общее
+    время, с timed - еще и задержка каждой операции (сами замеры замедляют
+    воспроизведение). Для трассы без операций (только LOAD) все показатели
+    нулевые
+
+    Args:
+        structure: пустая MyDict, DoubleHashingMap, dict, AVLMap,
+            OrderedIndex или дерево
+        ops (bytes): коды операций
+        keys (list): ключи
+        timed (bool): замерять задержку каждой операции
+
+    Raises:
+        ValueError: структура не поддерживает операцию из трассы или вставку
+            одного ключа
+
+    Returns:
+        dict: количество операций, время, операций в секунду и (с timed)
+            перцентили задержек в микросекундах
+    """
+    preload, calls = compile_trace(structure, ops, keys)
+    insert = _operations(structure)[INSERT]
+    for key in preload:
+        insert(key)
+    if not calls:
+        # Трасса только из LOAD: замерять нечего
+        result = {"ops": 0, "seconds": 0.0, "ops_per_sec": 0.0}
+        if timed:
+            result.update(p50_us=0.0, p99_us=0.0, max_us=0.0)
+        return result
+    if not timed:
+        start = time.perf_counter()
+        for function, argument in calls:
+            function(argument)
+        elapsed = time.perf_counter() - start
+        return {
+            "ops": len(calls),
+            "seconds": elapsed,
+            "ops_per_sec": len(calls) / elapsed if elapsed else 0.0,
+        }
+    clock = time.perf_counter_ns
+    latencies = []
+    append = latencies.append
+    for function, argument in calls:
+        begin = clock()
+        function(argument)
+        append(clock() - begin)
+    total = sum(latencies) / 1e9
+    latencies.sort()
+    last = len(latencies) - 1
+    speed = len(calls) / total if total else 0.0
+    result = {"ops": len(calls), "seconds": total, "ops_per_sec": speed}
+    for q in (50, 99):
+        result[f"p{q}_us"] = latencies[round(last * q / 100)] / 1000
+    result["max_us"] = latencies[-1] / 1000
+    return result
+
+
+# Пример использования
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    from avl import AVLTree
+    from btree import BPlusTree
+
+    path = os.path.join(tempfile.gettempdir(), "optrace_example.bin")
+    tree = AVLTree.from_sorted(range(0, 2000, 2))
+    with recording(tree, path, buffer_size=4096) as recorder:
+        for _ in range(20000):
+            key = random.randrange(4000)
+            action = random.random()
+            if action < 0.6:
+                tree.search(key)
+            elif action < 0.8:
+                tree.insert(key)
+            else:
+                tree.delete(key)
+        tree.insert_many(range(4000, 4100))
+    print("Recorded operations:", recorder.count, "file size:", os.path.getsize(path))
+
+    ops, keys = load_trace(path)
+    for engine in (AVLTree, BPlusTree):
+        stats = replay(engine(), ops, keys, timed=True)
+        print(engine.__name__, {name: round(value, 3) for name, value in stats.items()})
+    os.remove(path)
@@ -0,0 +1,389 @@
+from assoc import DoubleHashingMap
+from avl import AVLTree
+from avl_map import AVLMap, AVLMapNode
+
+
+class _SizedNode(AVLMapNode):
+    __slots__ = ("parent",)
+
+    def __init__(self, key, value):
+        super().__init__(key, value)
+        self.parent = None  # Родитель (None у корня)
+
+
+class _SizedMap(AVLMap):
+    """AVLMap, хранящий в поле agg узла размер поддерева (целое число)
+    и ссылку на родителя
+
+    Обходится дешевле общих агрегатов AVLMap, которые собираются в кортежи.
+    Все алгоритмы AVLTree вызывают _update_height для узла после изменения его
+    потомков, поэтому ссылки на родителей расставляются там же
+    """
+
+    @property
+    def root(self) -> _SizedNode:
+        return self._root
+
+    @root.setter
+    def root(self, node: _SizedNode) -> None:
+        AVLTree.root.fset(self, node)
+        if node:
+            node.parent = None
+
+    def _new_node(self, key, value=None) -> _SizedNode:
+        """Создание узла со ссылкой на родителя
+
+        Args:
+            key: ключ
+            value: значение
+
+        Returns:
+            _SizedNode: новый узел
+        """
+        return _SizedNode(key, value)
+
+    def _update_height(self, node) -> None:
+        """Обновляет высоту и размер поддерева узла
+
+        Args:
+            node (AVLMapNode): узел для обновления
+        """
+        # Вызывается на каждом уровне пути, поэтому высота считается здесь же,
+        # без цепочки super() через AVLMap
+        left, right = node.left, node.right
+        if left and right:
+            node.height = max(left.height, right.height) + 1
+            node.agg = left.agg + right.agg + 1
+            left.parent = right.parent = node
+        elif left:
+            node.height, node.agg = left.height + 1, left.agg + 1
+            left.parent = node
+        elif right:
+            node.height, node.agg = right.height + 1, right.agg + 1
+            right.parent = node
+        else:
+            node.height, node.agg = 1, 1
+
+    def delete_node(self, node: _SizedNode) -> None:
+        """Удаление узла по ссылке без спуска от корня
+
+        Узел заменяется потомком или преемником, после чего высоты и размеры
+        пересчитываются подъемом по ссылкам на родителей за O(log n) без
+        сравнений ключей
+
+        Args:
+            node (_SizedNode): узел этого дерева
+        """
+        low, high = self._min_node, self._max_node
+        # Соседний узел удаляемого крайнего становится новым крайним
+        if low is node:
+            low = node.right or node.parent
+        if high is node:
+            high = node.left or node.parent
+        parent = node.parent
+        if node.left and node.right:
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            if successor is node.right:
+                start = successor
+            else:
+                start = successor.parent
+                start.left = successor.right
+                successor.right = node.right
+                node.right.parent = successor
+            successor.left = node.left
+            node.left.parent = successor
+            replacement = successor
+        else:
+            replacement = node.left or node.right
+            start = parent
+        self._replace_child(parent, node, replacement)
+        node.left = node.right = node.parent = None
+        while start:
+            above = start.parent
+            self._update_height(start)
+            top = self._balance_node(start)
+            if top is not start:
+                self._replace_child(above, start, top)
+            start = above
+        self._min_node, self._max_node = low, high
+
+    def _replace_child(self, parent: _SizedNode, old, new) -> None:
+        """Замена потомка parent (или корня, если parent - None)
+
+        Args:
+            parent (_SizedNode): родитель заменяемого узла
+            old (_SizedNode): заменяемый узел
+            new (_SizedNode): новый узел или None
+        """
+        if parent is None:
+            self.root = new
+            return
+        if parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+        if new:
+            new.parent = parent
+
+
+class OrderedIndex:
+    """Упорядоченный индекс: хэш-таблица для точного поиска и АВЛ-дерево
+    для диапазонных запросов над одними и теми же ключами
+
+    Значения хранятся один раз - в узлах AVLMap. Ячейки DoubleHashingMap
+    указывают прямо на узлы дерева (узлы не пересоздаются при поворотах и
+    удалении), поэтому get и изменение значения существующего ключа работают
+    за O(1) без спуска по дереву. Удаление находит узел в хэш-таблице и
+    поднимается от него по ссылкам на родителей, а удаление отсутствующего
+    ключа не трогает дерево вовсе. Каждый узел хранит размер поддерева для select
+    """
+
+    def __init__(self):
+        self.map = DoubleHashingMap()  # ключ -> узел дерева
+        self.tree = _SizedMap()  # упорядоченные ключи и значения
+
+    def insert(self, key, value) -> None:
+        """Вставка ключа со значением (значение существующего ключа заменяется)
+
+        Args:
+            key: ключ
+            value: значение
+        """
+        node = self.map.search(key)
+        if node is not None:
+            node.value = value
+            return
+        self.map.insert(key, self.tree.insert(key, value))
+
+    def insert_many(self, items) -> None:
+        """Пакетная вставка пар (ключ, значение)
+
+        Новые ключи вставляются в дерево одним проходом (AVLMap.insert_many),
+        значения существующих заменяются через хэш-таблицу
+
+        Args:
+            items: пары (ключ, значение), при повторах остается последнее
+        """
+        batch = dict(items)
+        new = {}
+        for key, value in batch.items():
+            node = self.map.search(key)
+            if node is None:
+                new[key] = value
+            else:
+                node.value = value
+        for node in self.tree.insert_many(new.items()):
+            self.map.insert(node.key, node)
+
+    def get(self, key, default=None):
+        """Получение значения по ключу за O(1)
+
+        Args:
+            key: ключ
+            default: значение по умолчанию
+
+        Returns:
+            Any: значение, если ключ найден, иначе default
+        """
+        node = self.map.search(key)
+        return default if node is None else node.value
+
+    def delete(self, key) -> None:
+        """Удаление ключа через узел из хэш-таблицы без спуска по дереву
+        (отсутствующий ключ проверяется за O(1))
+
+        Args:
+            key: ключ для удаления
+        """
+        node = self.map.search(key)
+        if node is None:
+            return
+        self.map.delete(key)
+        self.tree.delete_node(node)
+
+    def delete_many(self, keys) -> None:
+        """Пакетное удаление ключей (дерево перестраивается одним проходом)
+
+        Args:
+            keys: ключи для удаления, отсутствующие пропускаются
+        """
+        present = [key for key in set(keys) if self.map.search(key) is not None]
+        for key in present:
+            self.map.delete(key)
+        self.tree.delete_many(present)
+
+    def irange(self, lo, hi):
+        """Ленивый обход пар из отрезка ключей [lo, hi] за O(log n + k)
+
+        Args:
+            lo: нижняя граница (включительно)
+            hi: верхняя граница (включительно)
+
+        Yields:
+            tuple: пары (ключ, значение) в порядке возрастания ключей
+        """
+        stack = []
+        node = self.tree.root
+        while stack or node:
+            while node:
+                if node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key > hi:
+                return
+            yield node.key, node.value
+            node = node.right
+
+    def min(self):
+        """Минимальный ключ
+
+        Raises:
+            ValueError: индекс пустой
+
+        Returns:
+            Any: минимальный ключ
+        """
+        return self.tree.min()
+
+    def max(self):
+        """Максимальный ключ
+
+        Raises:
+            ValueError: индекс пустой
+
+        Returns:
+            Any: максимальный ключ
+        """
+        return self.tree.max()
+
+    def select(self, index: int):
+        """Ключ с заданным номером в порядке возрастания за O(log n)
+
+        Args:
+            index (int): номер ключа (с нуля, отрицательные - с конца)
+
+        Raises:
+            IndexError: номер вне индекса
+
+        Returns:
+            Any: ключ
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Index out of range")
+        node = self.tree.root
+        while True:
+            left = node.left.agg if node.left else 0
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.key
+            else:
+                index -= left + 1
+                node = node.right
+
+    def rank(self, key) -> int:
+        """Количество ключей меньше заданного за O(log n)
+
+        Args:
+            key: ключ (может отсутствовать в индексе)
+
+        Returns:
+            int: номер, который ключ имеет или имел бы в порядке возрастания
+        """
+        rank = 0
+        node = self.tree.root
+        while node:
+            if key <= node.key:
+                node = node.left
+            else:
+                rank += (node.left.agg if node.left else 0) + 1
+                node = node.right
+        return rank
+
+    def items(self) -> list:
+        """Пары (ключ, значение) в порядке возрастания ключей
+
+        Returns:
+            list: список пар
+        """
+        return self.tree.items()
+
+    def __len__(self) -> int:
+        """Магический метод определения количества ключей
+
+        Returns:
+            int: количество ключей
+        """
+        return self.map.size
+
+    def __getitem__(self, key):
+        """Магический метод получения значения по ключу (index[key])
+
+        Args:
+            key: ключ
+
+        Returns:
+            (Any | None): значение, если ключ найден, иначе None
+        """
+        return self.get(key)
+
+    def __setitem__(self, key, value) -> None:
+        """Магический метод для вставки по ключу (index[key] = value)
+
+        Args:
+            key: ключ
+            value: значение
+        """
+        self.insert(key, value)
+
+    def __delitem__(self, key) -> None:
+        """Магический метод для удаления по ключу (del index[key])
+
+        Args:
+            key: ключ
+        """
+        self.delete(key)
+
+    def __contains__(self, key) -> bool:
+        """Магический метод проверки наличия ключа за O(1) (key in index)
+
+        Args:
+            key: ключ
+
+        Returns:
+            bool: True, если ключ есть в индексе
+        """
+        return self.map.search(key) is not None
+
+    def __str__(self) -> str:
+        """Магический метод вывода индекса в виде строки
+
+        Returns:
+            str: индекс в виде строки
+        """
+        return str(self.tree) if len(self) else "Empty index"
+
+
+# Пример использования
+if __name__ == "__main__":
+    users = OrderedIndex()
+    for user_id, name in [(42, "ann"), (7, "bob"), (19, "eve"), (3, "joe"), (88, "kim")]:
+        users[user_id] = name
+    print(users)
+    print("Get 19:", users[19], "contains 5:", 5 in users)
+    print("Range [5, 50]:", list(users.irange(5, 50)))
+    print("Min:", users.min(), "max:", users.max(), "select(2):", users.select(2))
+    print("Rank of 42:", users.rank(42))
+    del users[7]
+    users[42] = "ann-updated"
+    print("After updates:", users.items())
@@ -0,0 +1,59 @@
+"""Рандомизированные сравнения DoubleHashingMap и MyDict со словарем"""
+
+import random
+
+import pytest
+
+from assoc import DoubleHashingMap, MyDict
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 3, 8, 12, 100])
+def test_capacity_is_power_of_two_and_probe_visits_every_slot(capacity):
+    table = DoubleHashingMap(capacity)
+    assert table.capacity >= capacity
+    assert table.capacity & (table.capacity - 1) == 0
+    for key in list(range(50)) + ["key", (1, 2), -7, 2**70]:
+        slots = {table._probe(key, i) for i in range(table.capacity)}
+        assert slots == set(range(table.capacity))
+
+
+@pytest.mark.parametrize("capacity", [2, 12, 64])
+def test_random_operations_match_dict(capacity):
+    rng = random.Random(capacity)
+    table, expected = DoubleHashingMap(capacity), {}
+    for _ in range(5000):
+        if rng.random() < 0.3:
+            # Ключи, кратные размеру таблицы, дают одинаковый первый хэш
+            key = rng.randrange(40) * table.capacity
+        else:
+            key = rng.randrange(300)
+        action = rng.random()
+        if action < 0.45:
+            table.insert(key, key * 2)
+            expected[key] = key * 2
+        elif action < 0.8:
+            table.delete(key)
+            expected.pop(key, None)
+        else:
+            assert table.search(key) == expected.get(key)
+    assert table.size == len(expected)
+    assert all(table.search(key) == value for key, value in expected.items())
+    stored = {entry for entry in table.table if entry and entry is not table.deleted}
+    assert stored == set(expected.items())
+
+
+def test_my_dict_matches_dict():
+    rng = random.Random(1)
+    mapping, expected = MyDict(), {}
+    for _ in range(3000):
+        key = rng.choice([rng.randrange(200), str(rng.randrange(200))])
+        action = rng.random()
+        if action < 0.5:
+            mapping[key] = action
+            expected[key] = action
+        elif action < 0.8:
+            del mapping[key]
+            expected.pop(key, None)
+        else:
+            assert mapping[key] == expected.get(key)
+            assert (key in mapping) == (key in expected)
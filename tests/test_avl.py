@@ -0,0 +1,225 @@
+"""Рандомизированные сравнения AVLTree и его наследников с отсортированным
+множеством Python"""
+
+import random
+
+import pytest
+
+from avl import AVLTree
+from avl_persistent import PersistentAVLTree
+from avl_wavl import WAVLTree
+
+TREES = [AVLTree, WAVLTree, PersistentAVLTree]
+
+
+def check_tree(tree, expected) -> None:
+    """Проверка ключей, порядка и балансировки дерева
+
+    Args:
+        tree: проверяемое дерево
+        expected: ожидаемое множество ключей
+    """
+    assert tree.inorder_traversal() == sorted(expected)
+    assert tree.count_nodes() == len(expected)
+    assert tree.validate_avl_tree()
+    if type(tree) is not WAVLTree:
+        assert _check_heights(tree.root) >= 0
+
+
+def _check_heights(node) -> int:
+    """Сверка сохраненных высот с фактическими
+
+    Args:
+        node: корень поддерева
+
+    Returns:
+        int: высота поддерева
+    """
+    if not node:
+        return 0
+    height = max(_check_heights(node.left), _check_heights(node.right)) + 1
+    assert node.height == height
+    return height
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_random_operations_match_set(cls):
+    rng = random.Random(1)
+    tree, expected = cls(), set()
+    for _ in range(3000):
+        key = rng.randrange(500)
+        action = rng.random()
+        if action < 0.45:
+            tree.insert(key)
+            expected.add(key)
+        elif action < 0.8:
+            tree.delete(key)
+            expected.discard(key)
+        else:
+            assert (tree.search(key) is not None) == (key in expected)
+    check_tree(tree, expected)
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_batches_match_set(cls):
+    rng = random.Random(2)
+    tree, expected = cls(), set()
+    for _ in range(60):
+        batch = [rng.randrange(2000) for _ in range(rng.randrange(200))]
+        if rng.random() < 0.6:
+            tree.insert_many(batch)
+            expected.update(batch)
+        else:
+            tree.delete_many(batch)
+            expected.difference_update(batch)
+        check_tree(tree, expected)
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_min_max_and_pops_match_sorted(cls):
+    rng = random.Random(3)
+    tree, expected = cls(), set()
+    for _ in range(2000):
+        key = rng.randrange(300)
+        action = rng.random()
+        if action < 0.4:
+            tree.insert(key)
+            expected.add(key)
+        elif action < 0.55:
+            tree.delete(key)
+            expected.discard(key)
+        elif expected and action < 0.7:
+            assert tree.pop_min() == min(expected)
+            expected.remove(min(expected))
+        elif expected and action < 0.85:
+            assert tree.pop_max() == max(expected)
+            expected.remove(max(expected))
+        elif expected:
+            assert (tree.min(), tree.max()) == (min(expected), max(expected))
+    check_tree(tree, expected)
+    k = len(expected) // 3
+    assert tree.pop_min_n(k) == sorted(expected)[:k]
+    check_tree(tree, sorted(expected)[k:])
+
+
+def test_pop_from_empty_tree_raises():
+    with pytest.raises(IndexError):
+        AVLTree().pop_min()
+    with pytest.raises(ValueError):
+        AVLTree().min()
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_split_and_join(cls):
+    rng = random.Random(4)
+    for _ in range(50):
+        keys = set(rng.sample(range(1000), rng.randrange(1, 200)))
+        key = rng.randrange(1000)
+        tree = cls.from_iterable(keys)
+        left, found, right = tree.split(key)
+        assert (found is not None) == (key in keys)
+        check_tree(left, {k for k in keys if k < key})
+        check_tree(right, {k for k in keys if k > key})
+        joined = cls.join(left, key, right)
+        check_tree(joined, keys | {key})
+
+
+def test_join_rejects_overlapping_trees():
+    with pytest.raises(ValueError):
+        AVLTree.join(AVLTree.from_sorted([1, 5]), 3, AVLTree.from_sorted([4]))
+
+
+@pytest.mark.parametrize(
+    "operation, reference",
+    [
+        ("union", set.union),
+        ("intersection", set.intersection),
+        ("difference", set.difference),
+        ("symmetric_difference", set.symmetric_difference),
+    ],
+)
+@pytest.mark.parametrize("cls", TREES)
+def test_set_algebra_matches_set(cls, operation, reference):
+    rng = random.Random(5)
+    for size in (0, 1, 30, 500):
+        a = set(rng.sample(range(2000), size))
+        b = set(rng.sample(range(2000), rng.randrange(0, 300)))
+        tree, other = cls.from_iterable(a), cls.from_iterable(b)
+        getattr(tree, operation)(other)
+        check_tree(tree, reference(a, b))
+        assert other.root is None
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_merge_trees_keeps_other(cls):
+    rng = random.Random(6)
+    for small in (5, 400):
+        a = set(rng.sample(range(5000), 1000))
+        b = set(rng.sample(range(5000), small))
+        tree, other = cls.from_iterable(a), cls.from_iterable(b)
+        tree.merge_trees(other)
+        check_tree(tree, a | b)
+        check_tree(other, b)
+
+
+def test_from_sorted_rejects_unsorted_keys():
+    assert AVLTree.from_sorted([1, 1, 2]).inorder_traversal() == [1, 2]
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted([2, 1])
+
+
+def test_irange_matches_sorted():
+    rng = random.Random(7)
+    keys = set(rng.sample(range(10**4), 1000))
+    tree = AVLTree.from_iterable(keys)
+    for _ in range(100):
+        lo = rng.randrange(10**4)
+        hi = lo + rng.randrange(500)
+        assert list(tree.irange(lo, hi)) == sorted(k for k in keys if lo <= k <= hi)
+
+
+def test_persistent_snapshot_is_unchanged():
+    rng = random.Random(8)
+    tree = PersistentAVLTree.from_sorted(range(0, 1000, 2))
+    snap = tree.snapshot()
+    for _ in range(500):
+        key = rng.randrange(1000)
+        if rng.random() < 0.5:
+            tree.insert(key)
+        else:
+            tree.delete(key)
+    check_tree(snap, range(0, 1000, 2))
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+@pytest.mark.parametrize("cls", TREES)
+def test_dump_load_round_trip(cls, use_mmap, tmp_path):
+    rng = random.Random(9)
+    tree = cls()
+    for key in rng.sample(range(-(10**12), 10**12), 3000):
+        tree.insert(key)
+    path = str(tmp_path / "tree.bin")
+    tree.dump(path)
+    loaded = cls.load(path, use_mmap=use_mmap)
+    assert loaded.preorder_traversal() == tree.preorder_traversal()
+    check_tree(loaded, tree.inorder_traversal())
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "garbage.bin"
+    path.write_bytes(b"not a tree dump at all")
+    with pytest.raises(ValueError):
+        AVLTree.load(str(path))
+
+
+def test_write_dot_orders_children_and_checks_root(tmp_path):
+    tree = AVLTree.from_sorted(range(1, 16))
+    path = str(tmp_path / "tree.dot")
+    tree.write_dot(path, max_depth=2)
+    with open(path) as file:
+        edges = [line.split() for line in file if "->" in line]
+    # Левый потомок идет первым у каждого узла, в том числе обрезанный
+    assert edges[:2] == [["8", "->", "4"], ["8", "->", "12"]]
+    assert edges[2:4] == [["4", "->", '"...2"'], ["4", "->", '"...6"']]
+    with pytest.raises(KeyError):
+        tree.write_dot(path, root_key=100)
@@ -0,0 +1,99 @@
+"""Рандомизированные сравнения AVLMap со словарем"""
+
+import random
+
+import pytest
+
+from avl_map import AVLMap
+
+AGGREGATES = ("sum", "count", "min", "max")
+
+
+def check_map(tree: AVLMap, expected: dict) -> None:
+    """Проверка пар, балансировки и агрегатов всего массива
+
+    Args:
+        tree (AVLMap): проверяемый массив
+        expected (dict): ожидаемые пары
+    """
+    assert tree.items() == sorted(expected.items())
+    assert tree.validate_avl_tree()
+    values = list(expected.values())
+    assert tree.aggregate(float("-inf"), float("inf")) == {
+        "sum": sum(values),
+        "count": len(values),
+        "min": min(values, default=None),
+        "max": max(values, default=None),
+    }
+
+
+def test_random_operations_match_dict():
+    rng = random.Random(1)
+    tree, expected = AVLMap(AGGREGATES), {}
+    for _ in range(3000):
+        key = rng.randrange(300)
+        action = rng.random()
+        if action < 0.5:
+            value = rng.randrange(-1000, 1000)
+            node = tree.insert(key, value)
+            assert (node.key, node.value) == (key, value)
+            expected[key] = value
+        elif action < 0.8:
+            tree.delete(key)
+            expected.pop(key, None)
+        else:
+            assert tree.get(key) == expected.get(key)
+            assert (key in tree) == (key in expected)
+    check_map(tree, expected)
+
+
+def test_aggregate_ranges_match_dict():
+    rng = random.Random(2)
+    expected = {key: rng.randrange(100) for key in rng.sample(range(5000), 800)}
+    tree = AVLMap.from_iterable(expected.items(), AGGREGATES)
+    check_map(tree, expected)
+    for _ in range(300):
+        lo = rng.randrange(5000)
+        hi = lo + rng.randrange(1000)
+        values = [v for k, v in expected.items() if lo <= k <= hi]
+        assert tree.aggregate(lo, hi) == {
+            "sum": sum(values),
+            "count": len(values),
+            "min": min(values, default=None),
+            "max": max(values, default=None),
+        }
+
+
+def test_insert_many_returns_new_nodes():
+    rng = random.Random(3)
+    tree, expected = AVLMap(AGGREGATES), {}
+    for _ in range(40):
+        items = [(rng.randrange(1000), rng.randrange(50)) for _ in range(60)]
+        created = tree.insert_many(items)
+        batch = dict(items)
+        new_keys = sorted(set(batch) - set(expected))
+        assert sorted(node.key for node in created) == new_keys
+        expected.update(batch)
+        check_map(tree, expected)
+        tree.delete_many(rng.sample(range(1000), 50))
+        for key in set(expected) - {key for key, _ in tree.items()}:
+            del expected[key]
+        check_map(tree, expected)
+
+
+def test_split_and_join_keep_aggregates():
+    rng = random.Random(4)
+    expected = {key: key % 7 for key in rng.sample(range(2000), 500)}
+    tree = AVLMap.from_iterable(expected.items(), AGGREGATES)
+    left, found, right = tree.split(1000)
+    check_map(left, {k: v for k, v in expected.items() if k < 1000})
+    check_map(right, {k: v for k, v in expected.items() if k > 1000})
+    joined = AVLMap.join(left, 1000, found.value if found else 3, right)
+    check_map(joined, {**expected, 1000: expected.get(1000, 3)})
+
+
+def test_unknown_aggregate_and_dump_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        AVLMap(("median",))
+    with pytest.raises(TypeError):
+        AVLMap.from_sorted([(1, "a")]).dump(str(tmp_path / "map.bin"))
@@ -0,0 +1,82 @@
+"""Проверки набора бенчмарков: запуск малых нагрузок, запись результатов и
+поиск регрессий при сравнении двух запусков"""
+
+import argparse
+import json
+
+from bench.__main__ import compare, run
+from bench.suite import (
+    BULK_STRUCTURES,
+    BULK_WORKLOADS,
+    DISTRIBUTIONS,
+    STRUCTURES,
+    WORKLOADS,
+)
+
+
+def run_args(path: str) -> argparse.Namespace:
+    """Аргументы быстрого прогона всех нагрузок на маленьком размере
+
+    Args:
+        path (str): файл результатов
+
+    Returns:
+        argparse.Namespace: аргументы команды run
+    """
+    return argparse.Namespace(
+        sizes=[200],
+        structures=list(STRUCTURES),
+        workloads=list(WORKLOADS),
+        distributions=list(DISTRIBUTIONS),
+        hit_ratios=[1.0, 0.0],
+        merge_ratios=[1, 10],
+        repeat=1,
+        seed=1,
+        output=path,
+    )
+
+
+def test_run_writes_every_workload(tmp_path):
+    path = str(tmp_path / "base.json")
+    run(run_args(path))
+    with open(path) as file:
+        data = json.load(file)
+    assert "python" in data["environment"]
+    seen = {(r["structure"], r["workload"]) for r in data["results"]}
+    for workload in WORKLOADS:
+        for structure in STRUCTURES:
+            if workload in BULK_WORKLOADS and structure not in BULK_STRUCTURES:
+                continue
+            assert (structure, workload) in seen
+    assert all(r["ops_per_sec"] > 0 for r in data["results"])
+
+
+def test_compare_reports_only_regressions_beyond_threshold(tmp_path, capsys):
+    base = {
+        "environment": {},
+        "results": [
+            {
+                "structure": name,
+                "workload": "insert",
+                "distribution": "random",
+                "size": 1000,
+                "param": None,
+                "ops_per_sec": 1000.0,
+            }
+            for name in ("dict", "set", "AVLTree")
+        ],
+    }
+    new = json.loads(json.dumps(base))
+    new["results"][0]["ops_per_sec"] = 950.0  # в пределах порога
+    new["results"][1]["ops_per_sec"] = 500.0
+    new["results"][2]["ops_per_sec"] = 3000.0
+    (tmp_path / "base.json").write_text(json.dumps(base))
+    (tmp_path / "new.json").write_text(json.dumps(new))
+    args = argparse.Namespace(
+        base=str(tmp_path / "base.json"), new=str(tmp_path / "new.json"), threshold=0.1
+    )
+    assert compare(args) == 1
+    assert capsys.readouterr().out.count("REGRESSION") == 1
+    new["results"][1]["ops_per_sec"] = 1000.0
+    (tmp_path / "new.json").write_text(json.dumps(new))
+    assert compare(args) == 0
@@ -0,0 +1,83 @@
+"""Рандомизированные сравнения BPlusTree с отсортированным множеством"""
+
+import random
+
+import pytest
+
+from btree import BPlusTree
+
+
+def check_tree(tree: BPlusTree, expected) -> None:
+    """Проверка ключей, размера и одинаковой глубины листьев
+
+    Args:
+        tree (BPlusTree): проверяемое дерево
+        expected: ожидаемое множество ключей
+    """
+    assert tree.inorder_traversal() == sorted(expected)
+    assert len(tree) == len(expected)
+    depths = set()
+    stack = [(tree.root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        children = getattr(node, "children", None)
+        if children is None:
+            depths.add(depth)
+        else:
+            assert len(children) == len(node.keys) + 1
+            stack.extend((child, depth + 1) for child in children)
+    assert len(depths) == 1
+
+
+@pytest.mark.parametrize("capacity", [4, 5, 64])
+def test_random_operations_match_set(capacity):
+    rng = random.Random(capacity)
+    tree = BPlusTree(leaf_capacity=capacity, branch_capacity=capacity)
+    expected = set()
+    for _ in range(5000):
+        key = rng.randrange(800)
+        action = rng.random()
+        if action < 0.45:
+            tree.insert(key)
+            expected.add(key)
+        elif action < 0.8:
+            tree.delete(key)
+            expected.discard(key)
+        else:
+            # search возвращает ключ, а не узел, поэтому 0 сравнивается с None
+            found = tree.search(key)
+            assert (found is not None) == (key in expected)
+            assert found is None or found == key
+            assert (key in tree) == (key in expected)
+    check_tree(tree, expected)
+
+
+def test_irange_matches_sorted():
+    rng = random.Random(1)
+    keys = set(rng.sample(range(10**4), 2000))
+    tree = BPlusTree.from_iterable(keys, leaf_capacity=8, branch_capacity=8)
+    check_tree(tree, keys)
+    for _ in range(200):
+        lo = rng.randrange(-10, 10**4)
+        hi = lo + rng.randrange(300)
+        assert list(tree.irange(lo, hi)) == sorted(k for k in keys if lo <= k <= hi)
+
+
+def test_split_and_merge_match_set():
+    rng = random.Random(2)
+    for _ in range(30):
+        keys = set(rng.sample(range(3000), rng.randrange(300)))
+        key = rng.randrange(3000)
+        tree = BPlusTree.from_iterable(keys, leaf_capacity=6, branch_capacity=6)
+        left, right = tree.split_tree(key)
+        check_tree(left, {k for k in keys if k < key})
+        check_tree(right, {k for k in keys if k > key})
+        check_tree(tree, {key} & keys)
+        left.merge_trees(right)
+        check_tree(left, keys - {key})
+        check_tree(right, {k for k in keys if k > key})
+
+
+def test_small_capacity_rejected():
+    with pytest.raises(ValueError):
+        BPlusTree(leaf_capacity=3)
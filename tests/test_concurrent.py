@@ -0,0 +1,46 @@
+"""Проверки ConcurrentAVLTree под нагрузкой из нескольких потоков"""
+
+import random
+import threading
+
+from avl_concurrent import ConcurrentAVLTree
+
+
+def test_parallel_writers_and_readers_match_set():
+    tree = ConcurrentAVLTree()
+    expected = [set() for _ in range(4)]
+    errors = []
+
+    def writer(worker: int) -> None:
+        # У каждого писателя свой диапазон ключей, итог сверяется с его множеством
+        rng = random.Random(worker)
+        keys = expected[worker]
+        for _ in range(2000):
+            key = worker * 10**6 + rng.randrange(500)
+            if rng.random() < 0.6:
+                tree.insert(key)
+                keys.add(key)
+            else:
+                tree.delete(key)
+                keys.discard(key)
+            if rng.random() < 0.05:
+                batch = [worker * 10**6 + rng.randrange(500) for _ in range(20)]
+                with tree.batch() as inner:
+                    inner.delete_many(batch)
+                keys.difference_update(batch)
+
+    def reader() -> None:
+        for _ in range(300):
+            keys = tree.inorder_traversal()
+            if keys != sorted(set(keys)):
+                errors.append(keys)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+    threads += [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert tree.inorder_traversal() == sorted(set().union(*expected))
+    assert tree.tree.validate_avl_tree()
@@ -0,0 +1,54 @@
+"""Сравнение векторизованного поиска FrozenAVLIndex с bisect"""
+
+import random
+from bisect import bisect_left
+
+import numpy as np
+import pytest
+
+from avl import AVLTree
+from avl_frozen import FrozenAVLIndex
+
+
+def check_index(index: FrozenAVLIndex, keys: list, queries: list) -> None:
+    """Сверка принадлежности, lower_bound и рангов с bisect
+
+    Args:
+        index (FrozenAVLIndex): проверяемый индекс
+        keys (list): отсортированные ключи индекса
+        queries (list): запросы
+    """
+    result = index.search_many(queries)
+    for i, query in enumerate(queries):
+        rank = bisect_left(keys, query)
+        assert result.rank[i] == rank
+        assert bool(result.found[i]) == (rank < len(keys) and keys[rank] == query)
+        if rank < len(keys):
+            assert result.lower_bound[i] == keys[rank]
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 7, 8, 1000])
+def test_integer_keys_match_bisect(size):
+    rng = random.Random(size)
+    keys = sorted(rng.sample(range(-5000, 5000), size))
+    index = AVLTree.from_sorted(keys).freeze()
+    assert len(index) == size
+    check_index(index, keys, [rng.randrange(-5100, 5100) for _ in range(500)])
+
+
+def test_float_string_and_object_keys_match_bisect():
+    rng = random.Random(1)
+    floats = sorted({rng.uniform(-1, 1) for _ in range(300)})
+    queries = [rng.uniform(-1.1, 1.1) for _ in range(200)]
+    check_index(FrozenAVLIndex(floats), floats, queries)
+    words = {"".join(rng.choices("abcde", k=rng.randrange(1, 5))) for _ in range(300)}
+    words = sorted(words)
+    queries = ["".join(rng.choices("abcdef", k=3)) for _ in range(200)]
+    check_index(FrozenAVLIndex(words), words, queries)
+    objects = np.array(words, dtype=object)
+    check_index(FrozenAVLIndex(objects), words, queries)
+
+
+def test_unsorted_keys_rejected():
+    with pytest.raises(ValueError):
+        FrozenAVLIndex([3, 1, 2])
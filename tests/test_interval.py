@@ -0,0 +1,67 @@
+"""Рандомизированные сравнения IntervalTree с перебором списка отрезков"""
+
+import random
+
+import pytest
+
+from avl_interval import IntervalTree
+
+
+def check_max_end(node) -> int:
+    """Сверка наибольших концов поддеревьев с фактическими
+
+    Args:
+        node: корень поддерева
+
+    Returns:
+        int: наибольший конец в поддереве (None для пустого)
+    """
+    if not node:
+        return None
+    ends = [node.key[1], check_max_end(node.left), check_max_end(node.right)]
+    max_end = max(end for end in ends if end is not None)
+    assert node.max_end == max_end
+    return max_end
+
+
+def test_overlap_and_stab_match_brute_force():
+    rng = random.Random(1)
+    tree, expected = IntervalTree(), set()
+    for step in range(3000):
+        start = rng.randrange(1000)
+        interval = (start, start + rng.randrange(50))
+        if rng.random() < 0.6:
+            tree.insert(*interval)
+            expected.add(interval)
+        else:
+            tree.delete(*interval)
+            expected.discard(interval)
+        if step % 50 == 0:
+            lo = rng.randrange(1000)
+            hi = lo + rng.randrange(30)
+            assert tree.overlap(lo, hi) == sorted(
+                (s, e) for s, e in expected if s <= hi and e >= lo
+            )
+            assert tree.stab(lo) == sorted((s, e) for s, e in expected if s <= lo <= e)
+    assert tree.inorder_traversal() == sorted(expected)
+    assert tree.validate_avl_tree()
+    check_max_end(tree.root)
+
+
+def test_bulk_builds_match_brute_force():
+    rng = random.Random(2)
+    intervals = [(s, s + rng.randrange(20)) for s in rng.sample(range(5000), 700)]
+    tree = IntervalTree.from_iterable(intervals)
+    tree.insert_many((s, s + 5) for s in range(0, 100, 7))
+    expected = set(intervals) | {(s, s + 5) for s in range(0, 100, 7)}
+    assert tree.inorder_traversal() == sorted(expected)
+    check_max_end(tree.root)
+    for lo in range(0, 5000, 97):
+        assert tree.overlap(lo, lo + 40) == sorted(
+            (s, e) for s, e in expected if s <= lo + 40 and e >= lo
+        )
+
+
+def test_invalid_interval_rejected():
+    with pytest.raises(ValueError):
+        IntervalTree().insert(5, 1)
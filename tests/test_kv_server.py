@@ -0,0 +1,249 @@
+"""Рандомизированные проверки протокола KVServer: кодирование значений и
+кадров и сравнение ответов сервера со словарем Python"""
+
+import asyncio
+import bisect
+import random
+
+import pytest
+
+from kv_server import (
+    MAX_FRAME,
+    OPERATIONS,
+    SET,
+    KVClient,
+    KVServer,
+    decode_value,
+    encode_request,
+    encode_value,
+    split_frames,
+)
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    """Случайное значение любого поддерживаемого протоколом типа
+
+    Args:
+        rng (random.Random): генератор
+        depth (int): глубина вложенности списков и кортежей
+
+    Returns:
+        Any: значение
+    """
+    kind = rng.randrange(8 if depth < 3 else 6)
+    if kind == 0:
+        return None
+    if kind == 1:
+        return rng.random() < 0.5
+    if kind == 2:
+        return rng.randrange(-(2**63), 2**63)
+    if kind == 3:
+        return rng.uniform(-1e300, 1e300)
+    if kind == 4:
+        size = rng.randrange(20)
+        return "".join(chr(rng.randrange(1, 0x3000)) for _ in range(size))
+    if kind == 5:
+        return rng.randbytes(rng.randrange(20))
+    items = [random_value(rng, depth + 1) for _ in range(rng.randrange(5))]
+    return items if kind == 6 else tuple(items)
+
+
+def test_values_round_trip():
+    rng = random.Random(1)
+    for _ in range(2000):
+        value = random_value(rng)
+        out = bytearray(b"xx")
+        encode_value(value, out)
+        decoded, offset = decode_value(out, 2)
+        assert decoded == value and type(decoded) is type(value)
+        assert offset == len(out)
+
+
+def test_unsupported_value_rejected():
+    with pytest.raises(TypeError):
+        encode_value({1: 2}, bytearray())
+    with pytest.raises(ValueError):
+        decode_value(b"?", 0)
+
+
+def test_split_frames_handles_partial_reads():
+    rng = random.Random(2)
+    requests = [(SET, (rng.randrange(100), random_value(rng))) for _ in range(300)]
+    stream = bytearray()
+    for op, args in requests:
+        encode_request(op, args, stream)
+    buffer, frames, position = bytearray(), [], 0
+    # Поток приходит кусками произвольной длины, в том числе посреди длины кадра
+    while position < len(stream):
+        step = rng.randrange(1, 40)
+        buffer += stream[position : position + step]
+        position += step
+        frames.extend(split_frames(buffer))
+    assert not buffer
+    assert len(frames) == len(requests)
+    for frame, (op, args) in zip(frames, requests):
+        assert frame[0] == op
+        key, offset = decode_value(frame, 1)
+        value, offset = decode_value(frame, offset)
+        assert (key, value) == args and offset == len(frame)
+
+
+def test_split_frames_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        split_frames(bytearray(b"\0\0\0\0"))
+    with pytest.raises(ValueError):
+        split_frames(bytearray((MAX_FRAME + 1).to_bytes(4, "little")))
+
+
+def test_mixed_set_batch_is_not_half_applied():
+    server = KVServer()
+    server.index.insert(1, "one")
+    frames = bytearray()
+    for args in [(1, "CHANGED"), ("x", "y"), (2, "two")]:
+        encode_request(SET, args, frames)
+    replies = server.execute(split_frames(frames))
+    results = [decode_value(frame, 1)[0] for frame in split_frames(bytearray(replies))]
+    # Каждый запрос серии получает свой ответ, корректные записи применяются
+    assert results[0] is None and results[2] is None
+    assert results[1][0] == "TypeError"
+    assert list(server.index.irange(0, 10)) == [(1, "CHANGED"), (2, "two")]
+
+
+class Reference:
+    """Эталон индекса: словарь и отсортированный список ключей"""
+
+    def __init__(self):
+        self.data = {}
+        self.keys = []
+
+    def apply(self, name: str, args: tuple):
+        """Выполнение операции так, как ее должен выполнить сервер
+
+        Args:
+            name (str): имя операции
+            args (tuple): аргументы
+
+        Returns:
+            Any: ожидаемый ответ или исключение
+        """
+        data, keys = self.data, self.keys
+        if name == "set":
+            key, value = args
+            if key not in data:
+                bisect.insort(keys, key)
+            data[key] = value
+            return None
+        if name == "delete":
+            (key,) = args
+            if key in data:
+                del data[key]
+                keys.remove(key)
+            return None
+        if name == "get":
+            return data.get(args[0])
+        if name == "contains":
+            return args[0] in data
+        if name == "range":
+            lo, hi, limit = args
+            found = keys[bisect.bisect_left(keys, lo) : bisect.bisect_right(keys, hi)]
+            return [(key, data[key]) for key in found[:limit]]
+        if name == "rank":
+            return bisect.bisect_left(keys, args[0])
+        if name == "select":
+            # Отрицательные номера отсчитываются с конца, как у списка
+            if not -len(keys) <= args[0] < len(keys):
+                return IndexError
+            return keys[args[0]]
+        return len(keys)
+
+
+def random_request(rng: random.Random) -> tuple:
+    """Случайный запрос с ключами из небольшого диапазона
+
+    Args:
+        rng (random.Random): генератор
+
+    Returns:
+        tuple: (имя операции, аргументы)
+    """
+    key = rng.randrange(300)
+    name = rng.choice(list(OPERATIONS))
+    if name == "set":
+        return name, (key, rng.choice([None, key * 2, str(key), [key, "v"]]))
+    if name == "range":
+        return name, (key, key + rng.randrange(50), rng.choice([None, 3]))
+    if name == "select":
+        return name, (rng.randrange(-5, 200),)
+    if name == "size":
+        return name, ()
+    return name, (key,)
+
+
+async def check_client(client: KVClient, rng: random.Random, reference) -> None:
+    """Серии конкурентных запросов одного клиента со сверкой с эталоном
+
+    Args:
+        client (KVClient): клиент
+        rng (random.Random): генератор
+        reference (Reference): эталон
+    """
+    for _ in range(40):
+        requests = [random_request(rng) for _ in range(rng.randrange(1, 60))]
+        expected = [reference.apply(name, args) for name, args in requests]
+        coroutines = [
+            client.request(OPERATIONS[name], *args) for name, args in requests
+        ]
+        # Конкурентные вызовы одного клиента идут конвейером, порядок сохраняется
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for result, wanted in zip(results, expected):
+            if wanted is IndexError:
+                assert isinstance(result, IndexError)
+            else:
+                assert result == wanted
+
+
+async def _run_random_clients(server: KVServer, connect) -> None:
+    """Несколько клиентов по очереди изменяют индекс и сверяются с эталоном
+
+    Args:
+        server (KVServer): запущенный сервер
+        connect: корутина-функция, открывающая соединение
+    """
+    rng = random.Random(3)
+    reference = Reference()
+    clients = [await connect() for _ in range(3)]
+    try:
+        for _ in range(3):
+            for client in clients:
+                await check_client(client, rng, reference)
+        with_pipeline = [random_request(rng) for _ in range(200)]
+        with_pipeline = [r for r in with_pipeline if r[0] != "select"]
+        expected = [reference.apply(name, args) for name, args in with_pipeline]
+        assert await clients[0].pipeline(with_pipeline) == expected
+        assert await clients[1].size() == len(reference.keys)
+    finally:
+        for client in clients:
+            await client.close()
+        await server.close()
+    assert server.coalesced > 0
+
+
+def test_tcp_clients_match_dict():
+    async def main():
+        server = KVServer()
+        await server.start("127.0.0.1", 0)
+        host, port = server.address[:2]
+        await _run_random_clients(server, lambda: KVClient.connect(host, port))
+
+    asyncio.run(main())
+
+
+def test_unix_clients_match_dict(tmp_path):
+    path = str(tmp_path / "kv.sock")
+
+    async def main():
+        server = KVServer()
+        await server.start_unix(path)
+        await _run_random_clients(server, lambda: KVClient.connect_unix(path))
+
+    asyncio.run(main())
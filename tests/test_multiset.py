@@ -0,0 +1,98 @@
+"""Рандомизированные сравнения AVLMultiset с collections.Counter"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from avl_multiset import AVLMultiset
+
+
+def check_multiset(tree: AVLMultiset, expected: Counter) -> None:
+    """Проверка кратностей, сумм поддеревьев и балансировки
+
+    Args:
+        tree (AVLMultiset): проверяемое мультимножество
+        expected (Counter): ожидаемые кратности
+    """
+    assert tree.items() == sorted(expected.items())
+    assert len(tree) == sum(expected.values())
+    assert list(tree.elements()) == sorted(expected.elements())
+    assert tree.validate_avl_tree()
+    stack = [tree.root] if tree.root else []
+    while stack:
+        node = stack.pop()
+        children = [child for child in (node.left, node.right) if child]
+        assert node.total == node.count + sum(child.total for child in children)
+        stack.extend(children)
+
+
+def test_random_operations_match_counter():
+    rng = random.Random(1)
+    tree, expected = AVLMultiset(), Counter()
+    for _ in range(3000):
+        key = rng.randrange(100)
+        count = rng.randrange(1, 4)
+        action = rng.random()
+        if action < 0.5:
+            tree.insert(key, count)
+            expected[key] += count
+        elif action < 0.8:
+            tree.delete(key, count)
+            expected[key] -= min(count, expected[key])
+            expected = +expected
+        elif expected and action < 0.9:
+            assert tree.pop_min() == min(expected)
+            expected[min(expected)] -= 1
+            expected = +expected
+        else:
+            assert tree.count(key) == expected[key]
+            elements = sorted(expected.elements())
+            assert tree.rank(key) == sum(1 for element in elements if element < key)
+            if elements:
+                i = rng.randrange(len(elements))
+                assert tree.select(i) == elements[i]
+    check_multiset(tree, expected)
+
+
+def test_batches_match_counter():
+    rng = random.Random(2)
+    tree, expected = AVLMultiset(), Counter()
+    for _ in range(80):
+        batch = [rng.randrange(150) for _ in range(rng.randrange(80))]
+        if rng.random() < 0.55:
+            tree.insert_many(batch)
+            expected.update(batch)
+        else:
+            tree.delete_many(batch)
+            expected.subtract(batch)
+            expected = +expected
+        check_multiset(tree, expected)
+
+
+@pytest.mark.parametrize(
+    "operation, reference",
+    [
+        ("union", lambda a, b: a + b),
+        ("intersection", lambda a, b: a & b),
+        ("difference", lambda a, b: a - b),
+        ("symmetric_difference", lambda a, b: (a - b) + (b - a)),
+    ],
+)
+def test_set_operations_follow_counter(operation, reference):
+    rng = random.Random(3)
+    for _ in range(20):
+        a = Counter(rng.randrange(60) for _ in range(rng.randrange(150)))
+        b = Counter(rng.randrange(60) for _ in range(rng.randrange(150)))
+        tree = AVLMultiset.from_iterable(a.elements())
+        getattr(tree, operation)(AVLMultiset.from_iterable(b.elements()))
+        check_multiset(tree, reference(a, b))
+
+
+@pytest.mark.parametrize("method", ["insert", "delete"])
+@pytest.mark.parametrize("count", [0, -2])
+def test_non_positive_count_rejected(method, count):
+    tree = AVLMultiset.from_iterable([1, 1, 2])
+    with pytest.raises(ValueError):
+        getattr(tree, method)(1, count)
+    check_multiset(tree, Counter([1, 1, 2]))
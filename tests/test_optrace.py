@@ -0,0 +1,179 @@
+"""Проверки записи и воспроизведения трасс optrace"""
+
+import random
+
+import pytest
+
+from assoc import DoubleHashingMap, MyDict
+from avl import AVLTree
+from avl_interval import IntervalTree
+from avl_map import AVLMap
+from avl_multiset import AVLMultiset
+from avl_wavl import WAVLTree
+from btree import BPlusTree
+from optrace import load_trace, recording, replay
+from ordered_index import OrderedIndex
+
+
+def workload(structure, rng: random.Random, tree: bool) -> None:
+    """Случайная смешанная нагрузка
+
+    Args:
+        structure: структура
+        rng (random.Random): генератор
+        tree (bool): структура - дерево (есть пакетные операции и pop_min)
+    """
+    for _ in range(3000):
+        key = rng.randrange(500)
+        action = rng.random()
+        if action < 0.35:
+            if tree:
+                structure.insert(key)
+            else:
+                structure.insert(key, key)
+        elif action < 0.6:
+            structure.delete(key)
+        elif tree and action < 0.65:
+            structure.insert_many(rng.sample(range(500), 10))
+        elif tree and action < 0.7:
+            structure.delete_many(rng.sample(range(500), 10))
+        elif tree and action < 0.72 and structure.root:
+            structure.pop_min()
+        else:
+            structure.search(key)
+
+
+def stored_keys(table: DoubleHashingMap) -> list:
+    """Ключи хэш-таблицы
+
+    Args:
+        table (DoubleHashingMap): таблица
+
+    Returns:
+        list: отсортированные ключи
+    """
+    return sorted(
+        entry[0] for entry in table.table if entry and entry is not table.deleted
+    )
+
+
+@pytest.fixture
+def tree_trace(tmp_path):
+    rng = random.Random(1)
+    tree = AVLTree.from_sorted(range(0, 500, 3))
+    path = str(tmp_path / "trace.bin")
+    with recording(tree, path):
+        workload(tree, rng, tree=True)
+    return tree, load_trace(path)
+
+
+@pytest.mark.parametrize("cls", [AVLTree, WAVLTree, AVLMap])
+def test_tree_trace_replays_to_same_keys(tree_trace, cls):
+    tree, (ops, keys) = tree_trace
+    target = cls()
+    stats = replay(target, ops, keys, timed=True)
+    assert stats["ops"] > 0 and stats["p50_us"] <= stats["p99_us"]
+    assert target.inorder_traversal() == tree.inorder_traversal()
+
+
+@pytest.mark.parametrize("cls", [BPlusTree, OrderedIndex, IntervalTree])
+def test_unsupported_structures_are_rejected_before_replay(tree_trace, cls):
+    # BPlusTree и OrderedIndex не умеют pop_min, insert IntervalTree
+    # принимает два аргумента
+    _, (ops, keys) = tree_trace
+    target = cls()
+    with pytest.raises(ValueError):
+        replay(target, ops, keys)
+    assert len(target) == 0
+
+
+def test_key_value_structures_replay_without_pops(tmp_path):
+    rng = random.Random(2)
+    table = DoubleHashingMap()
+    path = str(tmp_path / "trace.bin")
+    with recording(table, path):
+        workload(table, rng, tree=False)
+    ops, keys = load_trace(path)
+    expected = stored_keys(table)
+    for target in (AVLMap(), OrderedIndex(), MyDict(), dict()):
+        replay(target, ops, keys)
+        if isinstance(target, MyDict):
+            target = target.map
+        if isinstance(target, DoubleHashingMap):
+            replayed = stored_keys(target)
+        elif isinstance(target, dict):
+            replayed = sorted(target)
+        else:
+            replayed = [key for key, _ in target.items()]
+        assert replayed == expected
+
+
+def test_non_integer_keys_are_interned(tmp_path):
+    path = str(tmp_path / "trace.bin")
+    table = MyDict()
+    with recording(table, path):
+        for word in ["a", "b", "a", 2**80, "c"]:
+            table[word] = 1
+    ops, keys = load_trace(path)
+    assert len(ops) == 5
+    assert keys[0] == keys[2] != keys[1]
+    assert all(isinstance(key, str) for key in keys)
+
+
+def test_recording_twice_rejected(tmp_path):
+    tree = AVLTree()
+    with recording(tree, str(tmp_path / "a.bin")):
+        with pytest.raises(ValueError):
+            with recording(tree, str(tmp_path / "b.bin")):
+                pass
+    assert "insert" not in vars(tree)
+
+
+def test_recorded_map_batches_store_keys_only(tmp_path):
+    path = str(tmp_path / "trace.bin")
+    source = AVLMap.from_sorted([(1, "x"), (2, "y")])
+    with recording(source, path):
+        source.insert_many([(7, "a"), (3, "b")])
+        source.insert(5, "c")
+    ops, keys = load_trace(path)
+    assert all(isinstance(key, int) for key in keys)
+    for target in (AVLMap(), AVLTree()):
+        replay(target, ops, keys)
+        assert target.inorder_traversal() == source.inorder_traversal()
+
+
+@pytest.mark.parametrize("timed", [False, True])
+def test_trace_without_operations_gives_zero_stats(tmp_path, timed):
+    path = str(tmp_path / "trace.bin")
+    with recording(AVLTree.from_sorted([1, 2, 3]), path):
+        pass
+    target = AVLTree()
+    stats = replay(target, *load_trace(path), timed=timed)
+    assert stats["ops"] == 0 and stats["ops_per_sec"] == 0
+    assert target.inorder_traversal() == [1, 2, 3]
+
+
+def test_multiset_replay_keeps_multiplicities(tmp_path):
+    rng = random.Random(3)
+    path = str(tmp_path / "trace.bin")
+    source = AVLMultiset.from_iterable([1, 1, 2, 5, 5, 5])
+    with recording(source, path):
+        source.pop_min()
+        for _ in range(2000):
+            key = rng.randrange(50)
+            action = rng.random()
+            if action < 0.4:
+                source.insert(key, rng.randrange(1, 4))
+            elif action < 0.7:
+                source.delete(key, rng.choice([1, 2, None]))
+            elif action < 0.8:
+                source.insert_many(rng.choices(range(50), k=5))
+            elif action < 0.85:
+                source.delete_many(rng.choices(range(50), k=5))
+            elif source.root and action < 0.95:
+                source.pop_min()
+            elif source.root:
+                source.pop_max()
+    target = AVLMultiset()
+    replay(target, *load_trace(path))
+    assert target.items() == source.items()
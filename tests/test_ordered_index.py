@@ -0,0 +1,72 @@
+"""Рандомизированные сравнения OrderedIndex со словарем и сортировкой"""
+
+import random
+
+import pytest
+
+from ordered_index import OrderedIndex
+
+
+def check_index(index: OrderedIndex, expected: dict) -> None:
+    """Проверка пар, размеров поддеревьев и ссылок на родителей
+
+    Args:
+        index (OrderedIndex): проверяемый индекс
+        expected (dict): ожидаемые пары
+    """
+    assert index.items() == sorted(expected.items())
+    assert len(index) == len(expected)
+    assert index.tree.validate_avl_tree()
+    stack = [(index.tree.root, None)] if index.tree.root else []
+    while stack:
+        node, parent = stack.pop()
+        assert node.parent is parent
+        children = [child for child in (node.left, node.right) if child]
+        assert node.agg == 1 + sum(child.agg for child in children)
+        stack.extend((child, node) for child in children)
+
+
+def test_random_operations_match_dict():
+    rng = random.Random(1)
+    index, expected = OrderedIndex(), {}
+    for step in range(4000):
+        key = rng.randrange(300)
+        action = rng.random()
+        if action < 0.4:
+            index.insert(key, step)
+            expected[key] = step
+        elif action < 0.5:
+            items = [(rng.randrange(300), step) for _ in range(rng.randrange(20))]
+            index.insert_many(items)
+            expected.update(items)
+        elif action < 0.8:
+            index.delete(key)
+            expected.pop(key, None)
+        elif action < 0.85:
+            keys = rng.sample(range(300), 15)
+            index.delete_many(keys)
+            for key in keys:
+                expected.pop(key, None)
+        else:
+            assert index.get(key) == expected.get(key)
+            assert (key in index) == (key in expected)
+            ordered = sorted(expected)
+            assert index.rank(key) == sum(1 for k in ordered if k < key)
+            if ordered:
+                assert (index.min(), index.max()) == (ordered[0], ordered[-1])
+                i = rng.randrange(len(ordered))
+                assert index.select(i) == ordered[i]
+            lo = rng.randrange(300)
+            assert list(index.irange(lo, lo + 30)) == [
+                (k, expected[k]) for k in ordered if lo <= k <= lo + 30
+            ]
+        if step % 100 == 0:
+            check_index(index, expected)
+    check_index(index, expected)
+
+
+def test_select_out_of_range_raises():
+    index = OrderedIndex()
+    index.insert(1, "a")
+    with pytest.raises(IndexError):
+        index.select(1)
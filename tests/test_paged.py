@@ -0,0 +1,136 @@
+"""Рандомизированные сравнения PagedAVLTree с отсортированным множеством и
+проверки ввода-вывода узлов через файл"""
+
+import gc
+import os
+import random
+import tempfile
+
+import pytest
+
+from avl import AVLTree
+from avl_paged import PagedAVLTree
+
+
+def check_tree(tree, expected) -> None:
+    """Проверка ключей и балансировки дерева
+
+    Args:
+        tree: проверяемое дерево
+        expected: ожидаемое множество ключей
+    """
+    assert tree.inorder_traversal() == sorted(expected)
+    assert tree.validate_avl_tree()
+
+
+def test_random_operations_with_small_pool_match_set(tmp_path):
+    rng = random.Random(1)
+    expected = set()
+    # Пул из двух страниц заставляет постоянно вытеснять и перечитывать узлы
+    with PagedAVLTree(str(tmp_path / "tree.avlp"), pool_pages=2) as tree:
+        for _ in range(4000):
+            key = rng.randrange(700)
+            if rng.random() < 0.1:
+                key = rng.randrange(-(2**40), 2**40)  # большие и отрицательные ключи
+            action = rng.random()
+            if action < 0.45:
+                tree.insert(key)
+                expected.add(key)
+            elif action < 0.75:
+                tree.delete(key)
+                expected.discard(key)
+            elif expected and action < 0.8:
+                assert tree.pop_min() == min(expected)
+                expected.remove(min(expected))
+            else:
+                assert (tree.search(key) is not None) == (key in expected)
+        check_tree(tree, expected)
+        assert tree.io_stats()["reads"] > 0
+
+
+def test_reopen_restores_tree_and_reuses_freed_records(tmp_path):
+    path = str(tmp_path / "tree.avlp")
+    keys = list(range(0, 3000, 3))
+    with PagedAVLTree(path, pool_pages=4) as tree:
+        tree.insert_many(keys)
+        tree.delete_many(keys[::2])
+    size = os.path.getsize(path)
+    with PagedAVLTree(path) as tree:
+        check_tree(tree, keys[1::2])
+        # Освобожденные записи используются повторно, файл не растет
+        tree.insert_many(keys[::2])
+        check_tree(tree, keys)
+    assert os.path.getsize(path) == size
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "garbage.avlp"
+    path.write_bytes(b"\x01" * 4096)
+    with pytest.raises(ValueError):
+        PagedAVLTree(str(path))
+
+
+def test_set_operations_and_merge_with_memory_tree():
+    rng = random.Random(2)
+    a = set(rng.sample(range(5000), 800))
+    b = set(rng.sample(range(5000), 300))
+    with PagedAVLTree() as tree:
+        tree.insert_many(a)
+        other = PagedAVLTree.from_sorted(sorted(b))
+        tree.symmetric_difference(other)
+        check_tree(tree, a ^ b)
+        tree.merge_trees(AVLTree.from_iterable(a))
+        check_tree(tree, a | b)
+        left, found, right = tree.split(2500)
+        assert (found is not None) == (2500 in a | b)
+        check_tree(left, {k for k in a | b if k < 2500})
+        check_tree(right, {k for k in a | b if k > 2500})
+
+
+def test_temporary_files_are_removed():
+    directory = tempfile.gettempdir()
+    before = {name for name in os.listdir(directory) if name.endswith(".avlp")}
+    with PagedAVLTree() as tree:
+        tree.insert_many(range(100))
+        parts = tree.split(50)
+        joined = PagedAVLTree.join(parts[0], 50, parts[2])
+        check_tree(joined, range(100))
+    del tree, parts, joined
+    gc.collect()
+    after = {name for name in os.listdir(directory) if name.endswith(".avlp")}
+    assert after <= before
+
+
+def test_del_item_returns_record_to_free_list(tmp_path):
+    with PagedAVLTree(str(tmp_path / "tree.avlp")) as tree:
+        tree.insert_many(range(100))
+        _, next_id, _ = tree._read_header()
+        del tree[40]
+        del tree[41]
+        root_id, after_next, free_id = tree._read_header()
+        assert after_next == next_id and free_id != 0
+        check_tree(tree, set(range(100)) - {40, 41})
+        tree.insert_many([40, 41])
+        # Обе записи взяты из списка освобожденных, новые не выделялись
+        assert tree._read_header()[1:] == (next_id, 0)
+
+
+def test_split_and_join_release_records_of_named_trees(tmp_path):
+    path = str(tmp_path / "tree.avlp")
+    with PagedAVLTree(path, pool_pages=4) as tree:
+        tree.insert_many(range(3000))
+        tree.flush()
+        size = os.path.getsize(path)
+        left, found, right = tree.split(1500)
+        assert found.key == 1500
+        assert tree.root is None and tree._read_header()[1:] == (1, 0)
+        check_tree(left, range(1500))
+        # Записи разрезанного дерева используются заново, файл не растет
+        tree.insert_many(range(3000))
+        tree.flush()
+        assert os.path.getsize(path) == size
+        with PagedAVLTree(str(tmp_path / "left.avlp")) as named:
+            named.insert_many(range(10))
+            joined = PagedAVLTree.join(named, 10, right)
+            assert named._read_header() == (0, 1, 0)
+        check_tree(joined, set(range(11)) | set(range(1501, 3000)))
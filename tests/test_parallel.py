@@ -0,0 +1,16 @@
+"""Сравнение параллельного построения AVLTree с множеством ключей файла"""
+
+import random
+
+from avl_parallel import build_parallel
+
+
+def test_build_parallel_matches_set(tmp_path):
+    rng = random.Random(1)
+    keys = [rng.randrange(-(10**6), 10**6) for _ in range(20000)]
+    path = tmp_path / "keys.txt"
+    path.write_text("\n".join(map(str, keys)) + "\n")
+    # Маленькие куски дают повторы ключей в разных кусках
+    tree = build_parallel(str(path), workers=2, chunk_bytes=4096)
+    assert tree.inorder_traversal() == sorted(set(keys))
+    assert tree.validate_avl_tree()
@@ -0,0 +1,48 @@
+"""Проверки сбора статистики avl_stats на случайных операциях"""
+
+import random
+
+import pytest
+
+from avl import AVLTree
+from avl_stats import instrument, instrumented, uninstrument
+
+
+def test_instrumented_tree_matches_plain_tree():
+    rng = random.Random(1)
+    plain, tree = AVLTree(), AVLTree()
+    calls = []
+    with instrumented(tree, lambda name, elapsed: calls.append(name)) as stats:
+        for _ in range(3000):
+            key = rng.randrange(400)
+            action = rng.random()
+            if action < 0.5:
+                plain.insert(key)
+                tree.insert(key)
+            elif action < 0.8:
+                plain.delete(key)
+                tree.delete(key)
+            else:
+                assert (tree.search(key) is None) == (plain.search(key) is None)
+        snapshot = stats.snapshot()
+    assert tree.inorder_traversal() == plain.inorder_traversal()
+    assert tree.preorder_traversal() == plain.preorder_traversal()
+    # Одинарная балансировка - один поворот, двойная - два
+    rebalances = snapshot["rebalances"]
+    rotations = sum(snapshot["rotations"].values())
+    assert rotations == rebalances.get("single", 0) + 2 * rebalances.get("double", 0)
+    assert snapshot["timings"]["search"]["count"] == sum(
+        snapshot["search_depth"].values()
+    )
+    assert len(calls) == sum(t["count"] for t in snapshot["timings"].values())
+    # После выхода из блока остаются только методы класса
+    assert not {"insert", "_search", "_stats"} & set(vars(tree))
+
+
+def test_double_instrument_rejected():
+    tree = AVLTree()
+    instrument(tree)
+    with pytest.raises(ValueError):
+        instrument(tree)
+    assert uninstrument(tree) is not None
+    assert uninstrument(tree) is None
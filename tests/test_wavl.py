@@ -0,0 +1,70 @@
+"""Проверки ранговых правил WAVLTree на случайных последовательностях"""
+
+import math
+import random
+
+from avl import AVLTree
+from avl_stats import instrumented
+from avl_wavl import WAVLTree
+
+
+def test_insert_only_tree_is_avl_tree():
+    rng = random.Random(1)
+    keys = rng.sample(range(10**5), 3000)
+    wavl, avl = WAVLTree(), AVLTree()
+    for key in keys:
+        wavl.insert(key)
+        avl.insert(key)
+    # Без удалений ранги совпадают с высотами, а форма - с АВЛ-деревом
+    assert wavl.preorder_traversal() == avl.preorder_traversal()
+    assert AVLTree._validate_avl_tree(wavl, wavl.root)
+
+
+def test_rank_rule_and_height_bound_under_deletes():
+    rng = random.Random(2)
+    tree, expected = WAVLTree(), set()
+    for _ in range(20):
+        batch = rng.sample(range(10**4), 500)
+        for key in batch:
+            tree.insert(key)
+        expected.update(batch)
+        for key in rng.sample(sorted(expected), len(expected) // 2):
+            tree.delete(key)
+            expected.remove(key)
+        assert tree.validate_avl_tree()
+        assert tree.inorder_traversal() == sorted(expected)
+        height = max(len(path) for path in _paths(tree.root))
+        assert height <= 2 * math.log2(len(expected) + 1)
+
+
+def test_delete_does_at_most_two_rotations():
+    rng = random.Random(3)
+    keys = rng.sample(range(10**5), 5000)
+    tree = WAVLTree()
+    for key in keys:
+        tree.insert(key)
+    rng.shuffle(keys)
+    with instrumented(tree) as stats:
+        for key in keys:
+            before = sum(stats.rotations.values())
+            tree.delete(key)
+            assert sum(stats.rotations.values()) - before <= 2
+    assert tree.root is None
+
+
+def _paths(node, path=()):
+    """Пути от корня до листьев
+
+    Args:
+        node: корень поддерева
+        path (tuple): путь до node
+
+    Yields:
+        tuple: ключи на пути до листа
+    """
+    path += (node.key,)
+    if not node.left and not node.right:
+        yield path
+    for child in (node.left, node.right):
+        if child:
+            yield from _paths(child, path)